@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makeParser():
+    # Import standard modules ...
+    import argparse
+    import os
+
+    # **************************************************************************
+
+    # Create argument parser ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Make an animation of the map of the difference between 12 o'clock UTC and sunrise (or noon, or sunset) through the year.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+    parser.add_argument(
+        "--delay",
+        default = 0.1,
+           dest = "delay",
+           help = "the delay between frames in the animated PNG file [s]",
+           type = float,
+    )
+    parser.add_argument(
+        "--event",
+        choices = [
+            "rising",
+            "setting",
+            "transit",
+        ],
+        default = "transit",
+           dest = "event",
+           help = "the event to animate",
+           type = str,
+    )
+    parser.add_argument(
+        "--frames",
+        default = None,
+           dest = "frames",
+           help = "save the frames as numbered PNG files in this directory (instead of as an animated PNG file)",
+           type = str,
+    )
+    parser.add_argument(
+        "--hour",
+        default = 12,
+           dest = "hour",
+           help = "the hour (UTC) of the reference time on each day",
+           type = int,
+    )
+    parser.add_argument(
+        "--jobs",
+        default = os.cpu_count() or 1,
+           dest = "jobs",
+           help = "the number of frames to calculate at the same time (each in its own process)",
+           type = int,
+    )
+    parser.add_argument(
+        "--land-only",
+        action = "store_true",
+          dest = "landOnly",
+          help = "only draw the pixels which contain any land (using \"land.bin\" from \"step1a_makeElevationMap.py\") and draw the others as having no data",
+    )
+    parser.add_argument(
+        "--output",
+        default = None,
+           dest = "pfile",
+           help = "the animated PNG file to save (if not given then it is the event followed by \"Animation.png\")",
+           type = str,
+    )
+    parser.add_argument(
+        "--step",
+        default = 1,
+           dest = "step",
+           help = "the number of days between frames",
+           type = int,
+    )
+    parser.add_argument(
+        "--year",
+        default = 2019,
+           dest = "year",
+           help = "the year to animate",
+           type = int,
+    )
+
+    # Return answer ...
+    return parser
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import collections
+    import concurrent.futures
+    import datetime
+    import os
+
+    # Create argument parser and parse the arguments ...
+    # NOTE: This is done before any special modules are imported, so that
+    #       "--help" is quick and works without them.
+    parser = makeParser()
+    args = parser.parse_args()
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.image
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # Import local modules ...
+    import funcs
+
+    # **************************************************************************
+
+    # Set default PNG file name ...
+    if args.pfile is None:
+        args.pfile = f"{args.event}Animation.png"
+
+    # **************************************************************************
+
+    # Load palette ...
+    turbo = funcs.loadPalette("turbo")
+
+    # **************************************************************************
+
+    # Make the list of reference times ...
+    refs = []
+    ref = datetime.datetime(args.year, 1, 1, args.hour, tzinfo = datetime.UTC)
+    while ref.year == args.year:
+        refs.append(ref)
+        ref += datetime.timedelta(days = args.step)
+
+    # Create a pool of processes to calculate the frames ...
+    with concurrent.futures.ProcessPoolExecutor(max_workers = args.jobs) as pool:
+        # Define a generator which yields the frames in order ...
+        # NOTE: Only a limited number of frames are submitted ahead of the one
+        #       that is currently being encoded, so that the memory usage is
+        #       bounded no matter how many frames there are.
+        def frames():
+            pending = collections.deque()
+            for ref in refs:
+                pending.append(
+                    pool.submit(
+                        funcs.calcEventFrame,
+                        ref,
+                        event = args.event,
+                         mask = "land.bin" if args.landOnly else None,
+                    )
+                )
+                if len(pending) > 2 * args.jobs:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+        # Check if numbered frames are wanted ...
+        if args.frames is not None:
+            # Make directory ...
+            os.makedirs(args.frames, exist_ok = True)
+
+            # Loop over frames ...
+            for i, img in enumerate(frames()):
+                # Define PNG file name ...
+                pfile = f"{args.frames}/frame{i:06d}.png"
+                print(f"Making \"{pfile}\" ...")
+
+                # Save PNG ...
+                src = pyguymer3.image.makePng(
+                    img.reshape(img.shape[0], img.shape[1], 1),
+                    calcAdaptive = True,
+                     calcAverage = True,
+                        calcNone = True,
+                       calcPaeth = True,
+                         calcSub = True,
+                          calcUp = True,
+                         choices = "all",
+                           debug = args.debug,
+                             dpi = None,
+                          levels = [9,],
+                       memLevels = [9,],
+                         modTime = None,
+                        palUint8 = turbo,
+                      strategies = None,
+                          wbitss = [15,],
+                )
+                with open(pfile, mode = "wb") as fObj:
+                    fObj.write(src)
+        else:
+            print(f"Making \"{args.pfile}\" ...")
+
+            # Save animated PNG ...
+            funcs.saveAnimatedPng(
+                frames(),
+                args.pfile,
+                  delay = args.delay,
+                nframes = len(refs),
+                    pal = turbo,
+            )
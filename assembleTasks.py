@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makeParser():
+    # Import standard modules ...
+    import argparse
+
+    # **************************************************************************
+
+    # Create argument parser ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Stitch the answers of the tasks in a work queue (made by \"queueTasks.py\" and solved by \"runWorker.py\") together into BIN files.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+    parser.add_argument(
+        "--encoding",
+        choices = [
+            "float64",
+            "int32",
+            "uint16",
+        ],
+        default = "float64",
+           dest = "encoding",
+           help = "the encoding to use when saving the BIN files (\"int32\" stores seconds, \"uint16\" stores minutes)",
+           type = str,
+    )
+    parser.add_argument(
+        "--queue",
+        default = "queue",
+           dest = "queue",
+           help = "the directory of the work queue",
+           type = str,
+    )
+
+    # Return answer ...
+    return parser
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import json
+    import os
+
+    # Create argument parser and parse the arguments ...
+    # NOTE: This is done before any special modules are imported, so that
+    #       "--help" is quick and works without them.
+    parser = makeParser()
+    args = parser.parse_args()
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import local modules ...
+    import funcs
+
+    # **************************************************************************
+
+    # Load the list of tasks ...
+    with open(os.path.join(args.queue, "manifest.json"), mode = "rt", encoding = "utf-8") as fObj:
+        manifest = json.load(fObj)
+    shape = tuple(manifest["shape"])
+
+    # Group the tasks by the BIN file that they are part of ...
+    bfiles = {}
+    for task in manifest["tasks"]:
+        bfiles.setdefault(task["bfile"], []).append(task)
+
+    # Loop over BIN files ...
+    for bfile, tasks in bfiles.items():
+        # Skip this BIN file if it exists already ...
+        if os.path.exists(bfile):
+            continue
+
+        # Skip this BIN file if any of its tasks have not been done yet ...
+        dnames = [os.path.join(args.queue, "done", f"{task['name']}.bin") for task in tasks]
+        nmiss = sum(not os.path.exists(dname) for dname in dnames)
+        if nmiss > 0:
+            print(f"Skipping \"{bfile}\" as {nmiss:,d} of its {len(tasks):,d} tasks have not been done yet.")
+            continue
+
+        print(f"Making \"{bfile}\" ...")
+
+        # Stitch the answers of the tasks together ...
+        diff = numpy.zeros(shape[0] * shape[1], dtype = numpy.float64)          # [hr]
+        for task, dname in zip(tasks, dnames, strict = True):
+            diff[task["start"]:task["stop"]] = numpy.fromfile(dname, dtype = numpy.float64) # [hr]
+
+        # Save difference map ...
+        funcs.encodeMap(
+            diff.reshape(shape),
+             encoding = args.encoding,
+            sentinels = True,
+        ).tofile(bfile)
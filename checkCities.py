@@ -1,12 +1,71 @@
 #!/usr/bin/env python3
 
+# Define function ...
+def makeParser():
+    # Import standard modules ...
+    import argparse
+    import os
+
+    # **************************************************************************
+
+    # Create argument parser ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Compare the time zones of some cities with the time zones that they should be in.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--csv",
+        default = "cities.csv",
+           dest = "csv",
+           help = "the CSV file to save the answers for every populated place to (with \"--exact\")",
+           type = str,
+    )
+    parser.add_argument(
+        "--date",
+        default = "2019-03-20T12:00:00+00:00",
+           dest = "date",
+           help = "the reference time (in ISO 8601 format, with \"--exact\")",
+           type = str,
+    )
+    parser.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+    parser.add_argument(
+        "--exact",
+        action = "store_true",
+          help = "solve noon, sunrise and sunset at the exact location of every populated place (and find the time zone that each one is in) rather than using the nearest pixel of the maps made by steps 2 and 3",
+    )
+    parser.add_argument(
+        "--jobs",
+        default = os.cpu_count() or 1,
+           dest = "jobs",
+           help = "the number of processes to solve the populated places with (with \"--exact\")",
+           type = int,
+    )
+
+    # Return answer ...
+    return parser
+
 # Use the proper idiom in the main module ...
 # NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
 if __name__ == "__main__":
     # Import standard modules ...
+    import concurrent.futures
+    import csv
+    import datetime
     import math
+    import os
     import pathlib
 
+    # Create argument parser and parse the arguments ...
+    # NOTE: This is done before any special modules are imported, so that
+    #       "--help" is quick and works without them.
+    parser = makeParser()
+    args = parser.parse_args()
+
     # Import special modules ...
     try:
         import cartopy
@@ -29,6 +88,16 @@ if __name__ == "__main__":
     except:
         raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
 
+    # Import local modules ...
+    import funcs
+
+    # **************************************************************************
+
+    # Parse the reference time ...
+    ref = datetime.datetime.fromisoformat(args.date)
+    if ref.tzinfo is None:
+        ref = ref.replace(tzinfo = datetime.UTC)
+
     # **************************************************************************
 
     # Create list of cities of interest ...
@@ -55,15 +124,9 @@ if __name__ == "__main__":
         mm = int(round(60.0 * (flt % 1.0)))                                     # [min]
         return f"{hh:02d}:{mm:02d}"
 
-    # Load axes and arrays ...
-    lon = numpy.fromfile("lon.bin", dtype = numpy.float64)                      # [rad]
-    lat = numpy.fromfile("lat.bin", dtype = numpy.float64)                      # [rad]
-    diff = numpy.fromfile("noonDiff.bin", dtype = numpy.float64).reshape(lat.size, lon.size)    # [hr]
-    tmzn = numpy.fromfile("timeZone.bin", dtype = numpy.float64).reshape(lat.size, lon.size)    # [hr]
-
     # **************************************************************************
 
-    # Find file containing all the country shapes ...
+    # Find file containing all the populated places ...
     sfile = cartopy.io.shapereader.natural_earth(
           category = "cultural",
               name = "populated_places",
@@ -71,26 +134,157 @@ if __name__ == "__main__":
     )
 
     # Loop over records ...
+    neA3s = []
+    neNames = []
+    x = []                                                                      # [rad]
+    y = []                                                                      # [rad]
     for record in cartopy.io.shapereader.Reader(sfile).records():
         # Create short-hands ...
         neA3 = pyguymer3.geo.getRecordAttribute(record, "ADM0_A3")
         neName = pyguymer3.geo.getRecordAttribute(record, "NAME")
 
-        # Skip this record if it is not one of the cities of interest ...
-        if neName not in cities:
+        # Skip this record if it is not one of the cities of interest (unless
+        # every populated place is being solved) ...
+        if not args.exact and cities.get(neName) != neA3:
             continue
 
-        # Skip this record if it is not in the correct country ...
-        if neA3 != cities[neName]:
-            continue
+        # Append its names and its location to the lists ...
+        neA3s.append(neA3)
+        neNames.append(neName)
+        x.append(math.radians(record.geometry.x))                               # [rad]
+        y.append(math.radians(record.geometry.y))                               # [rad]
+
+    # Convert the locations to arrays ...
+    x = numpy.array(x, dtype = numpy.float64)                                   # [rad]
+    y = numpy.array(y, dtype = numpy.float64)                                   # [rad]
+
+    # **************************************************************************
+
+    # Check if every populated place is being solved ...
+    if args.exact:
+        print(f"Solving {x.size:,d} populated places ...")
+
+        # Find the elevation of every populated place (using the nearest pixel
+        # of the elevation map, if it has been made) ...
+        if os.path.exists("elev.bin"):
+            lon, lat = funcs.loadAxes()                                         # [rad], [rad]
+            elev = funcs.loadMap("elev.bin", (lat.size, lon.size))              # [m]
+            ix = numpy.abs(lon.reshape(1, -1) - x.reshape(-1, 1)).argmin(axis = 1)
+            iy = numpy.abs(lat.reshape(1, -1) - y.reshape(-1, 1)).argmin(axis = 1)
+            elev = elev[iy, ix]                                                 # [m]
+        else:
+            elev = numpy.zeros(x.size, dtype = numpy.float64)                   # [m]
+
+        # Find the next time that the Sun will cross the meridian, rise and set
+        # for every populated place (in a pool of processes) ...
+        chunks = funcs.balanceChunks(numpy.ones(x.size, dtype = numpy.float64), 4 * args.jobs)
+        events = ["transit", "rising", "setting"]
+        with concurrent.futures.ProcessPoolExecutor(max_workers = args.jobs) as pool:
+            futures = {
+                event : [
+                    pool.submit(
+                        funcs.solveSunEvents,
+                        x[chunk],
+                        y[chunk],
+                        elev[chunk],
+                        ref,
+                        event = event,
+                    )
+                    for chunk in chunks
+                ]
+                for event in events
+            }
+            diff, rise, sett = [
+                numpy.concatenate([future.result() for future in futures[event]])
+                for event in events
+            ]                                                                   # [hr], [hr], [hr]
+
+        # Find file containing all the time zone shapes ...
+        sfile = cartopy.io.shapereader.natural_earth(
+              category = "cultural",
+                  name = "time_zones",
+            resolution = "10m",
+        )
+
+        # Initialize lists ...
+        # NOTE: The first label is for the populated places which are not in a
+        #       time zone.
+        geoms = []
+        zones = [None]
+
+        # Loop over records ...
+        for record in cartopy.io.shapereader.Reader(sfile).records():
+            # Append geometry and its labels to the lists ...
+            geoms.append(record.geometry)
+            zones.append(
+                {
+                          "ZONE" : float(pyguymer3.geo.getRecordAttribute(record, "ZONE")),
+                    "tz_name1st" : pyguymer3.geo.getRecordAttribute(record, "tz_name1st"),
+                }
+            )
+
+        # Find the standard time zone of every populated place (making sure
+        # that they are positive) ...
+        labs = funcs.locatePoints(geoms, x, y)
+        lut = numpy.array([0.0 if zone is None else zone["ZONE"] % 24.0 for zone in zones], dtype = numpy.float64)  # [hr]
+        tmzn = lut[labs]                                                        # [hr]
+
+        # Save the answers for every populated place ...
+        # NOTE: The times are in hours after the reference time.
+        print(f"Making \"{args.csv}\" ...")
+        with open(args.csv, mode = "wt", encoding = "utf-8", newline = "") as fObj:
+            writer = csv.writer(fObj)
+            writer.writerow(
+                [
+                    "NAME",
+                    "ADM0_A3",
+                    "longitude [°]",
+                    "latitude [°]",
+                    "elevation [m]",
+                    "tz_name1st",
+                    "ZONE [hr]",
+                    "noon [hr]",
+                    "sunrise [hr]",
+                    "sunset [hr]",
+                ]
+            )
+            for i in range(x.size):
+                writer.writerow(
+                    [
+                        neNames[i],
+                        neA3s[i],
+                        f"{math.degrees(x[i]):.6f}",
+                        f"{math.degrees(y[i]):.6f}",
+                        f"{elev[i]:.1f}",
+                        "" if zones[labs[i]] is None else zones[labs[i]]["tz_name1st"],
+                        f"{tmzn[i]:.2f}",
+                        f"{diff[i]:.6f}",
+                        f"{rise[i]:.6f}",
+                        f"{sett[i]:.6f}",
+                    ]
+                )
+    else:
+        # Load axes and arrays ...
+        lon, lat = funcs.loadAxes()                                             # [rad], [rad]
+        diff = funcs.loadMap("noonDiff.bin", (lat.size, lon.size))              # [hr]
+        tmzn = funcs.loadMap("timeZone.bin", (lat.size, lon.size))              # [hr]
 
-        # Find its location and determine the closest pixel to it ...
-        x = math.radians(record.geometry.x)                                     # [rad]
-        y = math.radians(record.geometry.y)                                     # [rad]
-        ix = abs(lon - x).argmin()
-        iy = abs(lat - y).argmin()
+        # Determine the closest pixel to every city of interest ...
+        ix = numpy.abs(lon.reshape(1, -1) - x.reshape(-1, 1)).argmin(axis = 1)
+        iy = numpy.abs(lat.reshape(1, -1) - y.reshape(-1, 1)).argmin(axis = 1)
+        diff = diff[iy, ix]                                                     # [hr]
+        tmzn = tmzn[iy, ix]                                                     # [hr]
+
+    # **************************************************************************
+
+    # Loop over populated places ...
+    for i in range(x.size):
+        # Skip this populated place if it is not one of the cities of interest
+        # ...
+        if cities.get(neNames[i]) != neA3s[i]:
+            continue
 
         # Guess the correct time zone ...
-        gues = 24.0 - diff[iy, ix]                                              # [hr]
+        gues = 24.0 - diff[i]                                                   # [hr]
 
-        print(f"{neName:7s} ({neA3:3s}) is at {math.degrees(x):6.1f}° and should be UTC+{flt2hhmm(gues):5s} but it is actually UTC+{flt2hhmm(tmzn[iy, ix]):5s} because noon occurs {flt2hhmm(diff[iy, ix]):5s} after 12:00 UTC.")
+        print(f"{neNames[i]:7s} ({neA3s[i]:3s}) is at {math.degrees(x[i]):6.1f}° and should be UTC+{flt2hhmm(gues):5s} but it is actually UTC+{flt2hhmm(tmzn[i]):5s} because noon occurs {flt2hhmm(diff[i]):5s} after 12:00 UTC.")
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makeParser():
+    # Import standard modules ...
+    import argparse
+
+    # **************************************************************************
+
+    # Create argument parser ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Summarise the noon offset and the time zone mismatch for every country (or time zone).",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--by",
+        choices = [
+            "country",
+            "zone",
+        ],
+        default = "country",
+           dest = "by",
+           help = "summarise by country (using \"country.bin\") or by current time zone (using \"timeZone.bin\")",
+           type = str,
+    )
+    parser.add_argument(
+        "--csv",
+        default = None,
+           dest = "cfile",
+           help = "the CSV file to save the table to (if not given then it is \"countryStats.csv\" or \"zoneStats.csv\")",
+           type = str,
+    )
+    parser.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+
+    # Return answer ...
+    return parser
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import csv
+    import json
+    import math
+    import os
+
+    # Create argument parser and parse the arguments ...
+    # NOTE: This is done before any special modules are imported, so that
+    #       "--help" is quick and works without them.
+    parser = makeParser()
+    args = parser.parse_args()
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import local modules ...
+    import funcs
+
+    # **************************************************************************
+
+    # Set default CSV file name ...
+    if args.cfile is None:
+        args.cfile = f"{args.by}Stats.csv"
+
+    # **************************************************************************
+
+    # Load axes and arrays ...
+    lon, lat = funcs.loadAxes()                                                 # [rad], [rad]
+    diff = funcs.loadMap("noonDiff.bin", (lat.size, lon.size))                  # [hr]
+    tmzn = funcs.loadMap("timeZone.bin", (lat.size, lon.size))                  # [hr]
+
+    # Load (or calculate) the time zone difference map ...
+    if os.path.exists("timeZoneDiff.bin"):
+        offs = funcs.loadMap("timeZoneDiff.bin", (lat.size, lon.size))          # [hr]
+    else:
+        offs = (diff + tmzn - 24.0 + 12.0) % 24.0 - 12.0                        # [hr]
+
+    # Calculate the time zone that each pixel should be in (wrapped so that it
+    # is between -12 hours and +12 hours) ...
+    gues = (24.0 - diff + 12.0) % 24.0 - 12.0                                   # [hr]
+
+    # Calculate the area of each pixel ...
+    # NOTE: The axes are evenly spaced and so the area of each pixel is
+    #       proportional to the cosine of its latitude.
+    dlon = 2.0 * math.pi / float(lon.size)                                      # [rad]
+    dlat = math.pi / float(lat.size)                                            # [rad]
+    area = 6371.0088 * 6371.0088 * dlon * dlat * numpy.cos(lat).reshape(lat.size, 1)    # [km2]
+
+    # **************************************************************************
+
+    # Check how to label the pixels ...
+    match args.by:
+        case "country":
+            # Load country map along with its labels ...
+            labs = numpy.fromfile("country.bin", dtype = numpy.int16).reshape(lat.size, lon.size)
+            with open("country.json", mode = "rt", encoding = "utf-8") as fObj:
+                names = json.load(fObj)
+            keys = [(name["ADM0_A3"], name["NAME"]) for name in names]
+        case "zone":
+            # Label the pixels using their current time zone ...
+            codes = numpy.rint(4.0 * tmzn).astype(numpy.int64)
+            labs = codes + 1
+            keys = [("", "")] + [(f"UTC{(code / 4.0 + 12.0) % 24.0 - 12.0:+.2f}", "") for code in range(int(codes.max()) + 1)]
+        case _:
+            # Crash ...
+            raise ValueError(f"\"args.by\" is an unexpected value ({repr(args.by)})") from None
+
+    # Calculate the statistics for every label ...
+    # NOTE: Both quantities wrap around at ±12 hours, so circular statistics
+    #       are used (otherwise, for example, a country spanning +11.9 hours
+    #       and -11.9 hours would have a mean of zero).
+    guesStats = funcs.zonalStats(labs, gues, area, nlabs = len(keys), period = 24.0)
+    offsStats = funcs.zonalStats(labs, offs, area, nlabs = len(keys), period = 24.0)
+
+    # **************************************************************************
+
+    # Define the columns of the table ...
+    cols = [
+        "ADM0_A3",
+        "NAME",
+        "pixels",
+        "area [km2]",
+        "noon offset mean [hr]",
+        "noon offset area-weighted mean [hr]",
+        "noon offset median [hr]",
+        "noon offset min [hr]",
+        "noon offset max [hr]",
+        "mismatch mean [hr]",
+        "mismatch area-weighted mean [hr]",
+        "mismatch median [hr]",
+        "mismatch min [hr]",
+        "mismatch max [hr]",
+    ]
+
+    # Save the table ...
+    with open(args.cfile, mode = "wt", encoding = "utf-8", newline = "") as fObj:
+        fObj2 = csv.writer(fObj)
+        fObj2.writerow(cols)
+
+        # Loop over labels (sorted by area, largest first) ...
+        for lab in numpy.argsort(guesStats["area"])[::-1]:
+            # Skip this label if it does not have any pixels ...
+            if guesStats["count"][lab] == 0:
+                continue
+
+            # Write the row and print a summary ...
+            fObj2.writerow(
+                [
+                    keys[lab][0],
+                    keys[lab][1],
+                    int(guesStats["count"][lab]),
+                    f"{guesStats['area'][lab]:.1f}",
+                ] + [
+                    f"{stats[key][lab]:+.3f}" for stats in [guesStats, offsStats] for key in ["mean", "wmean", "median", "min", "max"]
+                ]
+            )
+            print(f"{keys[lab][0]:8s} {keys[lab][1][:30]:30s} should be UTC{guesStats['wmean'][lab]:+6.2f} (median UTC{guesStats['median'][lab]:+6.2f}) and is on average {offsStats['wmean'][lab]:+6.2f} hours away from its time zone.")
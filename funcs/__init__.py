@@ -1,4 +1,51 @@
 #!/usr/bin/env python3
 
+# Import constants ...
+from .constants import ALWAYS_UP, NEVER_UP, NO_DATA, PROCESS_MEMORY, SHA256S
+
 # Import functions ...
+from .balanceChunks import balanceChunks
+from .calcEventFrame import calcEventFrame
+from .calcEventMap import calcEventMap
+from .calcGeometry import calcGeometry
+from .calcIndexMap import calcIndexMap
+from .calcReprojection import calcReprojection
+from .calcTable import calcTable
+from .calcTimeZoneDifference import calcTimeZoneDifference
+from .civilOffsets import civilOffsets
+from .claimTask import claimTask
+from .classifyPixels import classifyPixels
+from .decodeMap import decodeMap
+from .detectEncoding import detectEncoding
+from .downloadFile import downloadFile
+from .encodeMap import encodeMap
+from .evaluateMaps import evaluateMaps
+from .filterRows import filterRows
+from .findEvents import findEvents
 from .horizon import horizon
+from .loadAxes import loadAxes
+from .loadColourTable import loadColourTable
+from .loadMap import loadMap
+from .loadMask import loadMask
+from .loadPalette import loadPalette
+from .locatePoints import locatePoints
+from .makeElevationMap import makeElevationMap
+from .makeSunEventMap import makeSunEventMap
+from .makeTimeZoneMap import makeTimeZoneMap
+from .memoryBudget import memoryBudget
+from .overrideZones import overrideZones
+from .peakMemory import peakMemory
+from .planChunks import planChunks
+from .pngChunk import pngChunk
+from .quantiseMap import quantiseMap
+from .rasterise import rasterise
+from .reduceTile import reduceTile
+from .renderFigure import renderFigure
+from .reproject import reproject
+from .saveAnimatedPng import saveAnimatedPng
+from .solveOffsets import solveOffsets
+from .solveSunEvents import solveSunEvents
+from .streamPng import streamPng
+from .summariseCost import summariseCost
+from .vectorise import vectorise
+from .zonalStats import zonalStats
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def balanceChunks(
+    wgts,
+    nchunks,
+    /,
+):
+    # NOTE: This function splits the flattened map of costs "wgts" (for
+    #       example, the time taken to solve each pixel, as saved by the step 2
+    #       scripts when they are passed "--cost") into (up to) "nchunks"
+    #       contiguous chunks of pixels which each cost roughly the same. The
+    #       chunks are returned as a list of slices.
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Find the cumulative cost of the pixels ...
+    # NOTE: A tiny cost is added to every pixel so that pixels which cost
+    #       nothing are still shared out between the chunks.
+    wgts = numpy.asarray(wgts, dtype = numpy.float64).ravel()
+    if wgts.size == 0:
+        return []
+    eps = 1.0e-6 * wgts.mean() if wgts.any() else 1.0
+    cumsum = numpy.cumsum(wgts + eps)
+
+    # Find the boundaries between the chunks ...
+    bounds = numpy.searchsorted(
+        cumsum,
+        cumsum[-1] * numpy.arange(1, nchunks) / nchunks,
+    )
+    bounds = numpy.unique(numpy.concatenate([[0], bounds, [wgts.size]]))
+
+    # Return answer ...
+    return [slice(int(i0), int(i1)) for i0, i1 in zip(bounds[:-1], bounds[1:], strict = True) if i1 > i0]
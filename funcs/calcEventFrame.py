@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calcEventFrame(
+    ref,
+    /,
+    *,
+     body = "Sun",
+    event = "transit",
+     mask = None,
+     vmax = 24.0,
+     vmin = 0.0,
+):
+    # NOTE: This function makes a map of the time of the first event after the
+    #       'aware' datetime object "ref" (using "calcEventMap()") and then
+    #       quantises it (in the same way as the PNG files made by the steps), so
+    #       that only one byte per pixel needs to be returned to the encoder.
+    #       If "mask" is given then the map is set to "NO_DATA" wherever the
+    #       mask in that BIN file (see "loadMask()") is not set.
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .calcEventMap import calcEventMap
+    from .constants import NO_DATA
+    from .loadMask import loadMask
+    from .quantiseMap import quantiseMap
+
+    # **************************************************************************
+
+    # Make map ...
+    diff = calcEventMap(
+        ref,
+         body = body,
+        event = event,
+    )                                                                           # [hr]
+
+    # Remove the answer where it is not wanted (if needed) ...
+    if mask is not None:
+        diff = numpy.where(loadMask(mask, diff.shape), diff, NO_DATA)           # [hr]
+
+    # Return quantised map ...
+    return quantiseMap(
+        diff,
+        vmax = vmax,
+        vmin = vmin,
+    )
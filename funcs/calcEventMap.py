@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+# Define a cache of the geometries which have already been calculated by this
+# process ...
+# NOTE: The keys are the absolute paths, modification times and sizes of the
+#       BIN files that the geometry was calculated from.
+GEOMS = {}
+
+# Define function ...
+def calcEventMap(
+    ref,
+    /,
+    *,
+     body = "Sun",
+      dur = 48.0,
+    event = "transit",
+    efile = "elev.bin",
+    lfile = "lat.bin",
+    mfile = "lon.bin",
+     step = 10.0 / 60.0,
+):
+    # NOTE: This function makes a map of the time of the first event after the
+    #       'aware' datetime object "ref" (in hours) using the axes and the
+    #       elevation in the BIN files. The geometry is only calculated once per
+    #       process, so calling this function for many dates (possibly in a pool
+    #       of processes) only costs one table of positions of the body per
+    #       date, plus the array arithmetic in "findEvents()".
+
+    # Import standard modules ...
+    import os
+
+    # Import sub-functions ...
+    from .calcGeometry import calcGeometry
+    from .calcTable import calcTable
+    from .findEvents import findEvents
+    from .loadAxes import loadAxes
+    from .loadMap import loadMap
+
+    # **************************************************************************
+
+    # Check if the geometry has not been calculated by this process yet ...
+    key = tuple((os.path.abspath(fname), os.path.getmtime(fname), os.path.getsize(fname)) for fname in [mfile, lfile, efile])
+    if key not in GEOMS:
+        # Load elevation map along with axes ...
+        # NOTE: "loadMap()" handles the compact encodings of the BIN files.
+        lon, lat = loadAxes(lfile = lfile, mfile = mfile)                       # [rad], [rad]
+        elev = loadMap(efile, (lat.size, lon.size))                             # [m]
+
+        # Add geometry to the cache ...
+        GEOMS[key] = calcGeometry(lon, lat, elev)
+
+    # Return answer ...
+    return findEvents(
+        GEOMS[key],
+        calcTable(
+            body,
+            ref,
+             dur = dur,
+            step = step,
+        ),
+        event = event,
+    )
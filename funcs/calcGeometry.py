@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calcGeometry(
+    lon,
+    lat,
+    elev,
+    /,
+):
+    # NOTE: This function calculates the quantities for every pixel which do
+    #       not depend on the date, so that they can be re-used when finding the
+    #       times of events on many different dates using "findEvents()". The
+    #       longitude and latitude are broadcast to the shape of the elevation,
+    #       so a map can be passed in as its two axes and its elevation.
+
+    # Import special modules ...
+    try:
+        import ephem
+    except:
+        raise Exception("\"ephem\" is not installed; run \"pip install --user ephem\"") from None
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .horizon import horizon
+
+    # **************************************************************************
+
+    # Broadcast the inputs to the same shape ...
+    elev = numpy.asarray(elev, dtype = numpy.float64)                           # [m]
+    if elev.ndim == 2 and numpy.ndim(lon) == 1 and numpy.ndim(lat) == 1:
+        lon = numpy.reshape(lon, (1, -1))                                       # [rad]
+        lat = numpy.reshape(lat, (-1, 1))                                       # [rad]
+    lon, lat, elev = numpy.broadcast_arrays(lon, lat, elev)                     # [rad], [rad], [m]
+
+    # Return answer ...
+    return {
+        "cosLat" : numpy.cos(lat).ravel(),
+           "hzn" : horizon(elev.ravel()),                                       # [rad]
+           "lon" : lon.astype(numpy.float64).ravel(),                           # [rad]
+           "rho" : elev.ravel() + ephem.earth_radius,                           # [m]
+         "shape" : elev.shape,
+        "sinLat" : numpy.sin(lat).ravel(),
+    }
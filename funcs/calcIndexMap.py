@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calcIndexMap(
+    lon,
+    lat,
+    tlon,
+    tlat,
+    /,
+    *,
+    method = "nearest",
+):
+    # NOTE: "lon" and "lat" are the (regularly spaced) axes of the source grid
+    #       [rad] and "tlon" and "tlat" are the longitude and latitude of the
+    #       centre of every pixel of the target grid [°], which are not finite
+    #       where the target pixel is outside of the Earth.
+    # NOTE: The returned dictionary contains the flat indices of the source
+    #       pixels ("idx") and their weights ("wgt") that make up every target
+    #       pixel, along with which target pixels are valid ("valid"). The
+    #       "nearest" method uses one source pixel per target pixel and the
+    #       "bilinear" method uses four (wrapping around in longitude).
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Find which target pixels are valid ...
+    valid = numpy.isfinite(tlon) & numpy.isfinite(tlat)
+
+    # Find the fractional index of every target pixel in the source grid ...
+    fx = numpy.where(valid, (numpy.radians(tlon) - lon[0]) / (lon[1] - lon[0]), 0.0)
+    fy = numpy.where(valid, (numpy.radians(tlat) - lat[0]) / (lat[1] - lat[0]), 0.0)
+    fy = fy.clip(0.0, lat.size - 1.0)
+
+    # Check method ...
+    match method:
+        case "nearest":
+            # Find the nearest source pixel ...
+            ix = numpy.rint(fx).astype(numpy.int64) % lon.size
+            iy = numpy.rint(fy).astype(numpy.int64)
+            idx = (iy * lon.size + ix).reshape((1,) + tlon.shape)
+            wgt = numpy.ones(idx.shape, dtype = numpy.float32)
+        case "bilinear":
+            # Find the four surrounding source pixels ...
+            x0 = numpy.floor(fx).astype(numpy.int64)
+            y0 = numpy.floor(fy).astype(numpy.int64).clip(max = lat.size - 2)
+            wx = fx - x0
+            wy = fy - y0
+            x1 = (x0 + 1) % lon.size
+            x0 %= lon.size
+            y1 = y0 + 1
+            idx = numpy.stack(
+                [
+                    y0 * lon.size + x0,
+                    y0 * lon.size + x1,
+                    y1 * lon.size + x0,
+                    y1 * lon.size + x1,
+                ]
+            )
+            wgt = numpy.stack(
+                [
+                    (1.0 - wx) * (1.0 - wy),
+                    wx * (1.0 - wy),
+                    (1.0 - wx) * wy,
+                    wx * wy,
+                ]
+            ).astype(numpy.float32)
+        case _:
+            # Crash ...
+            raise ValueError(f"\"method\" is an unexpected value ({repr(method)})") from None
+
+    # Clear the invalid target pixels ...
+    idx[:, ~valid] = 0
+    wgt[:, ~valid] = 0.0
+
+    # Return answer ...
+    return {
+          "idx" : idx.astype(numpy.int32),
+        "valid" : valid,
+          "wgt" : wgt,
+    }
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+# Define a cache of the index maps which have already been loaded by this
+# process ...
+REPROJECTIONS = {}
+
+# Define function ...
+def calcReprojection(
+    lon,
+    lat,
+    proj,
+    shape,
+    /,
+    *,
+     cache = "reprojection",
+    method = "nearest",
+):
+    # NOTE: "proj" is the name of a Cartopy projection (for example,
+    #       "EqualEarth" or "NorthPolarStereo") and "shape" is the shape of the
+    #       target grid, which covers the whole extent of the projection. See
+    #       "calcIndexMap()" for the returned dictionary, which can be passed
+    #       to "reproject()".
+    # NOTE: The index maps are saved as NPZ files in the directory "cache",
+    #       which are named after the source grid, the projection, the shape
+    #       and the method, so they are only ever calculated once. They are
+    #       also only loaded once per process.
+
+    # Import standard modules ...
+    import hashlib
+    import os
+    import pathlib
+
+    # Import special modules ...
+    try:
+        import cartopy
+        cartopy.config.update(
+            {
+                "cache_dir" : pathlib.PosixPath("~/.local/share/cartopy").expanduser(),
+            }
+        )
+        import cartopy.crs
+    except:
+        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .calcIndexMap import calcIndexMap
+
+    # **************************************************************************
+
+    # Create short-hands ...
+    grid = hashlib.sha256(lon.tobytes() + lat.tobytes()).hexdigest()[:16]
+    nfile = f"{cache}/{proj}_{shape[0]:d}x{shape[1]:d}_{method}_{grid}.npz"
+
+    # Check if the index map has not been loaded by this process yet ...
+    if nfile not in REPROJECTIONS:
+        # Check if the index map has not been calculated yet ...
+        if not os.path.exists(nfile):
+            print(f"Making \"{nfile}\" ...")
+
+            # Find the centres of the pixels of the target grid ...
+            crs = getattr(cartopy.crs, proj)()
+            x0, x1 = crs.x_limits                                               # [m], [m]
+            y0, y1 = crs.y_limits                                               # [m], [m]
+            dx = (x1 - x0) / shape[1]                                           # [m]
+            dy = (y1 - y0) / shape[0]                                           # [m]
+            x, y = numpy.meshgrid(
+                numpy.linspace(x0 + 0.5 * dx, x1 - 0.5 * dx, num = shape[1]),
+                numpy.linspace(y1 - 0.5 * dy, y0 + 0.5 * dy, num = shape[0]),
+            )                                                                   # [m], [m]
+
+            # Find the longitude and latitude of the centres of the pixels of
+            # the target grid ...
+            pnts = cartopy.crs.PlateCarree().transform_points(crs, x, y)
+            tlon = pnts[:, :, 0]                                                # [°]
+            tlat = pnts[:, :, 1]                                                # [°]
+
+            # Make index map and save it ...
+            rmap = calcIndexMap(lon, lat, tlon, tlat, method = method)
+            os.makedirs(cache, exist_ok = True)
+            numpy.savez_compressed(f"{nfile}.tmp.npz", **rmap)
+            os.replace(f"{nfile}.tmp.npz", nfile)
+
+        # Load index map and add it to the cache ...
+        with numpy.load(nfile) as fObj:
+            rmap = {key : fObj[key] for key in fObj.files}
+        for value in rmap.values():
+            value.setflags(write = False)
+        REPROJECTIONS[nfile] = rmap
+
+    # Return answer ...
+    return REPROJECTIONS[nfile]
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calcTable(
+    body,
+    ref,
+    /,
+    *,
+     dur = 48.0,
+    step = 10.0 / 60.0,
+):
+    # NOTE: This function tabulates the apparent geocentric position of "body"
+    #       (the name of an "ephem" body, for example "Sun" or "Moon") every
+    #       "step" hours for "dur" hours after the 'aware' datetime object "ref".
+    #       The table is shared by every pixel when finding the times of events
+    #       using "findEvents()", so that "ephem" is only called once per row of
+    #       the table rather than many times per pixel.
+
+    # Import standard modules ...
+    import datetime
+
+    # Import special modules ...
+    try:
+        import ephem
+    except:
+        raise Exception("\"ephem\" is not installed; run \"pip install --user ephem\"") from None
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Make the times ...
+    n = round(dur / step) + 1
+    times = step * numpy.arange(n, dtype = numpy.float64)                       # [hr]
+
+    # Initialize arrays ...
+    gst = numpy.zeros(n, dtype = numpy.float64)                                 # [rad]
+    ra = numpy.zeros(n, dtype = numpy.float64)                                  # [rad]
+    dec = numpy.zeros(n, dtype = numpy.float64)                                 # [rad]
+    dist = numpy.zeros(n, dtype = numpy.float64)                                # [m]
+    rad = numpy.zeros(n, dtype = numpy.float64)                                 # [rad]
+
+    # Initialize observer (at the intersection of the Equator and the Prime
+    # Meridian, so that its sidereal time is the Greenwich sidereal time) and
+    # body ...
+    # NOTE: The observer is moved down to the centre of the Earth, as "ephem"
+    #       returns the distance and the angular radius of the body as seen by
+    #       the observer (which differ by up to 2% for the Moon).
+    obs = ephem.Observer()
+    obs.elevation = -ephem.earth_radius                                         # [m]
+    obj = getattr(ephem, body)()
+
+    # Loop over times ...
+    for i in range(n):
+        # Update the observer's time ...
+        obs.date = ephem.Date(ref + datetime.timedelta(hours = float(times[i])))
+
+        # Find the position of the body ...
+        obj.compute(obs)
+        gst[i] = obs.sidereal_time()                                            # [rad]
+        ra[i] = obj.g_ra                                                        # [rad]
+        dec[i] = obj.g_dec                                                      # [rad]
+        dist[i] = obj.earth_distance * ephem.meters_per_au                      # [m]
+        rad[i] = obj.radius                                                     # [rad]
+
+    # Unwrap the angles so that they can be interpolated ...
+    gst = numpy.unwrap(gst)                                                     # [rad]
+    ra = numpy.unwrap(ra)                                                       # [rad]
+
+    # Return answer ...
+    return {
+          "dec" : dec,
+         "dist" : dist,
+          "gst" : gst,
+           "ra" : ra,
+          "rad" : rad,
+        "times" : times,
+    }
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calcTimeZoneDifference(
+    diff,
+    tmzn,
+    /,
+):
+    # NOTE: This function calculates the difference [hr] between noon and the
+    #       time zone from the map of the time until noon after 12 o'clock UTC
+    #       "diff" [hr] (see "step2b") and the map of time zones "tmzn" [hr]
+    #       (see "makeTimeZoneMap()"). The answer is between -12 hours and +12
+    #       hours, and is positive where noon is later than 12 o'clock local
+    #       time. The inputs are not modified and pixels which do not have any
+    #       data in either input do not have any data in the answer.
+
+    # Calculate difference ...
+    offs = diff + tmzn - 24.0                                                   # [hr]
+
+    # Make sure that the values loop back around correctly ...
+    offs[offs < -12.0] += 24.0                                                  # [hr]
+    offs[offs > +12.0] -= 24.0                                                  # [hr]
+
+    # Return answer ...
+    return offs
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+# Define a cache of the UTC offsets which have already been found by this
+# process ...
+OFFSETS = {}
+
+# Define function ...
+def civilOffsets(
+    zones,
+    date,
+    /,
+):
+    # NOTE: "zones" is the list of labels of the time zone label map (see
+    #       "step3a"), where the first entry is for the pixels which are not in
+    #       a time zone. The returned array contains the civil UTC offset (in
+    #       the same convention as the "ZONE" attribute, i.e., between 0 and 24
+    #       hours) of every label on "date", which can then be indexed by the
+    #       label map to make a map of the civil time zones.
+    # NOTE: The offset is evaluated at 12 o'clock local time, which is well
+    #       away from any daylight saving transitions. If the IANA time zone is
+    #       missing (or is not known to this system) then the standard offset
+    #       is used instead.
+
+    # Import standard modules ...
+    import datetime
+    import zoneinfo
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Initialize array ...
+    ans = numpy.zeros(len(zones), dtype = numpy.float64)                        # [hr]
+
+    # Loop over labels ...
+    for i, zone in enumerate(zones):
+        # Skip this label if it is not a time zone ...
+        if zone is None:
+            continue
+
+        # Create short-hands ...
+        name = zone["tz_name1st"]
+        std = zone["ZONE"]                                                      # [hr]
+
+        # Check if the offset has not been found by this process yet ...
+        key = (name, std, date)
+        if key not in OFFSETS:
+            try:
+                tz = zoneinfo.ZoneInfo(name)
+            except (TypeError, ValueError, zoneinfo.ZoneInfoNotFoundError):
+                OFFSETS[key] = std                                              # [hr]
+            else:
+                OFFSETS[key] = datetime.datetime.combine(
+                    date,
+                    datetime.time(12, tzinfo = tz),
+                ).utcoffset().total_seconds() / 3600.0                          # [hr]
+
+        # Set offset (making sure that it is positive) ...
+        ans[i] = OFFSETS[key] % 24.0                                            # [hr]
+
+    # Return answer ...
+    return ans
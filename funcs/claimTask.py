@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def claimTask(
+    qdir,
+    owner,
+    /,
+    *,
+    stale = 300.0,
+):
+    # NOTE: This function claims the next task from the work queue in the
+    #       (shared) directory "qdir" (see "queueTasks.py") on behalf of
+    #       "owner" (which must be unique across every worker on every
+    #       machine). A task is claimed by atomically renaming its file from
+    #       "todo" to "claimed", so if two workers try to claim the same task
+    #       at the same time then only one of them succeeds. The path of the
+    #       claim and the description of the task are returned, or None if
+    #       there are no tasks left to claim.
+    # NOTE: Workers must touch their claims at least every "stale" seconds
+    #       (see "runWorker.py"). Any claims which have not been touched for
+    #       longer than that are assumed to belong to a worker which has died
+    #       and so they are moved back to "todo" before a new task is claimed.
+    #       The age of a claim is measured using the clock of the file server
+    #       (by touching a file of this worker's own), as the clocks of the
+    #       machines may not agree.
+
+    # Import standard modules ...
+    import json
+    import os
+
+    # **************************************************************************
+
+    # Create short-hands ...
+    tdir = os.path.join(qdir, "todo")
+    cdir = os.path.join(qdir, "claimed")
+    ddir = os.path.join(qdir, "done")
+
+    # Find the current time according to the file server ...
+    os.makedirs(os.path.join(qdir, "clocks"), exist_ok = True)
+    clock = os.path.join(qdir, "clocks", owner)
+    with open(clock, mode = "wb"):
+        pass
+    now = os.stat(clock).st_mtime                                               # [s]
+
+    # Loop over claims ...
+    for cname in sorted(os.listdir(cdir)):
+        # Find out when the claim was last touched (renaming a file changes its
+        # status change time but not its modification time) ...
+        try:
+            stat = os.stat(os.path.join(cdir, cname))
+        except FileNotFoundError:
+            continue
+        if now - max(stat.st_mtime, stat.st_ctime) <= stale:
+            continue
+
+        # Move the stale claim back to "todo" (ignoring it if another worker
+        # has already done so) ...
+        try:
+            os.rename(
+                os.path.join(cdir, cname),
+                os.path.join(tdir, f"{cname.partition('@')[0]}.json"),
+            )
+        except FileNotFoundError:
+            continue
+
+    # Loop over tasks ...
+    for tname in sorted(os.listdir(tdir)):
+        # Skip this file if it is not a task ...
+        if not tname.endswith(".json"):
+            continue
+
+        # Try to claim the task (ignoring it if another worker has already
+        # claimed it) ...
+        name = tname.removesuffix(".json")
+        cname = os.path.join(cdir, f"{name}@{owner}.json")
+        try:
+            os.rename(os.path.join(tdir, tname), cname)
+        except FileNotFoundError:
+            continue
+        os.utime(cname)
+
+        # Load the description of the task ...
+        with open(cname, mode = "rt", encoding = "utf-8") as fObj:
+            task = json.load(fObj)
+
+        # Release the claim if the task has already been done (by a worker
+        # whose claim went stale before it finished) ...
+        if os.path.exists(os.path.join(ddir, f"{name}.bin")):
+            try:
+                os.remove(cname)
+            except FileNotFoundError:
+                pass
+            continue
+
+        # Return answer ...
+        return cname, task
+
+    # Return answer ...
+    return None
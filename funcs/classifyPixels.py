@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def classifyPixels(
+    lat,
+    elev,
+    ref,
+    /,
+    *,
+        body = "Sun",
+      margin = 0.1,
+    pressure = 1010.0,
+        temp = 15.0,
+):
+    # NOTE: This function classifies every pixel as either "normal" (0), one
+    #       where the body is always above the horizon (1) or one where the body
+    #       is never above the horizon (2) during the search for the first
+    #       rising (or setting) after the 'aware' datetime object "ref", without
+    #       calling "ephem" for each pixel. The latitude [rad] and the
+    #       elevation [m] are broadcast to the same shape and the codes match
+    #       the "flags" returned by "solveSunEvents()".
+    # NOTE: The body is always up if its altitude at lower culmination is above
+    #       the horizon for every declination that it has within the search and
+    #       it is never up if its altitude at upper culmination is below the
+    #       horizon for every declination that it has within the search (where,
+    #       as in "ephem", the horizon is lowered by the radius of the body and
+    #       corrected for refraction, using "pressure" and "temp"). Pixels which
+    #       are within "margin" degrees (plus the parallax of the body) of
+    #       either condition are left as normal, so that "ephem" can decide
+    #       which ones raise "AlwaysUpError" and "NeverUpError" itself.
+
+    # Import standard modules ...
+    import datetime
+
+    # Import special modules ...
+    try:
+        import ephem
+    except:
+        raise Exception("\"ephem\" is not installed; run \"pip install --user ephem\"") from None
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .calcTable import calcTable
+
+    # **************************************************************************
+
+    # Broadcast the inputs to the same shape ...
+    lat, elev = numpy.broadcast_arrays(
+        numpy.asarray(lat, dtype = numpy.float64),
+        numpy.asarray(elev, dtype = numpy.float64),
+    )                                                                           # [rad], [m]
+
+    # Tabulate the body from half a day before the reference time to two days
+    # after it (as "ephem" iterates to a date near the culmination of the body
+    # before raising either exception) ...
+    tab = calcTable(
+        body,
+        ref - datetime.timedelta(hours = 12.0),
+        dur = 60.0,
+    )
+
+    # Find the range of declinations that the body has and its largest
+    # parallax ...
+    decMin = tab["dec"].min()                                                   # [rad]
+    decMax = tab["dec"].max()                                                   # [rad]
+    tol = numpy.radians(margin) + numpy.arcsin(ephem.earth_radius / tab["dist"].min())  # [rad]
+
+    # Make a lookup table to convert apparent altitudes to true altitudes (as
+    # "ephem.unrefract()" only works on scalars) ...
+    appAlt = numpy.radians(numpy.linspace(-15.0, 15.0, 3001))                   # [rad]
+    truAlt = numpy.array([ephem.unrefract(pressure, temp, float(alt)) for alt in appAlt])   # [rad]
+
+    # Calculate the true altitude of the centre of the body when its upper limb
+    # is on the horizon (using the largest radius that the body has) ...
+    hzn = -numpy.arccos(ephem.earth_radius / (elev + ephem.earth_radius))       # [rad]
+    tgt = numpy.interp(hzn - tab["rad"].max(), appAlt, truAlt)                  # [rad]
+
+    # Calculate the lowest altitude at lower culmination and the highest
+    # altitude at upper culmination for any declination within the range ...
+    # NOTE: At lower culmination the altitude is "|lat + dec| - 90°" and at
+    #       upper culmination the altitude is "90° - |lat - dec|".
+    loAlt = numpy.abs(lat + numpy.clip(-lat, decMin, decMax)) - 0.5 * numpy.pi  # [rad]
+    hiAlt = 0.5 * numpy.pi - numpy.abs(lat - numpy.clip(lat, decMin, decMax))   # [rad]
+
+    # Classify the pixels ...
+    ans = numpy.zeros(lat.shape, dtype = numpy.uint8)
+    ans[loAlt > tgt + tol] = 1
+    ans[hiAlt < tgt - tol] = 2
+
+    # Return answer ...
+    return ans
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+# Define the sentinel values that are stored in maps of event times when the
+# event does not occur ...
+ALWAYS_UP = -1.0                                                                # [hr]
+NEVER_UP = -2.0                                                                 # [hr]
+
+# Define the sentinel value that is stored in maps for pixels which were not
+# calculated (for example, the pixels in the sea when only the land was
+# calculated) ...
+# NOTE: As the sentinel value is NaN it must be found using "numpy.isnan()"
+#       rather than by comparing against it.
+NO_DATA = float("nan")                                                          # [hr]
+
+# Define the sentinel codes that are used to store the above sentinel values in
+# the compact encodings of maps of event times (and, for "NO_DATA", of any map)
+# ...
+INT32_ALWAYS_UP = -2147483647
+INT32_NEVER_UP = -2147483646
+INT32_NO_DATA = -2147483648
+UINT16_ALWAYS_UP = 65534
+UINT16_NEVER_UP = 65533
+UINT16_NO_DATA = 65535
+
+# Define the offset that is added to the number of minutes when storing a map
+# of event times as unsigned integers (so that -12 hours is stored as zero) ...
+UINT16_OFFSET = 720                                                             # [min]
+
+# Define the number of codes per hour when storing a map of time zones as
+# unsigned integers (so that quarter-hour time zones can be stored exactly) ...
+UINT8_PER_HOUR = 4
+
+# Define the sentinel code that is used to store "NO_DATA" in a map of time
+# zones ...
+UINT8_NO_DATA = 255
+
+# Define the index of the palettes of the PNG files which is reserved for pixels
+# which do not have any data (the data uses the other 255 indices) and its
+# colour ...
+PALETTE_NO_DATA = 0
+PALETTE_NO_DATA_COLOUR = (128, 128, 128)
+
+# Define the (rough) memory usage of a Python process which has imported NumPy
+# and the other special modules, which is used when estimating how much memory
+# each step will use ...
+PROCESS_MEMORY = 67108864                                                       # [B]
+
+# Define the known SHA-256 checksums of the files which are downloaded (keyed by
+# file name), which they are checked against by default ...
+# NOTE: A checksum of None means that it has not been recorded yet, in which
+#       case the file is not downloaded unless either a checksum is given or
+#       checking it is explicitly turned off (see "step0a_downloadGLOBE.py").
+#       The checksum of the downloaded file is always printed, so that it can
+#       be checked against another copy and then recorded here.
+SHA256S = {
+    "all10g.zip" : None,
+}
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def decodeMap(
+    raw,
+    /,
+):
+    # NOTE: The encoding is determined from the type of the array, see
+    #       "encodeMap()" for the list of supported encodings.
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .constants import ALWAYS_UP, NEVER_UP, NO_DATA
+    from .constants import INT32_ALWAYS_UP, INT32_NEVER_UP, INT32_NO_DATA
+    from .constants import UINT16_ALWAYS_UP, UINT16_NEVER_UP, UINT16_NO_DATA, UINT16_OFFSET
+    from .constants import UINT8_NO_DATA, UINT8_PER_HOUR
+
+    # **************************************************************************
+
+    # Check encoding ...
+    match raw.dtype:
+        case numpy.float64:
+            # Return answer ...
+            return numpy.asarray(raw)
+        case numpy.int32:
+            # Convert the seconds to hours ...
+            ans = raw.astype(numpy.float64) / 3600.0                            # [hr]
+
+            # Overwrite sentinel codes with their values ...
+            numpy.place(ans, raw == INT32_ALWAYS_UP, ALWAYS_UP)
+            numpy.place(ans, raw == INT32_NEVER_UP, NEVER_UP)
+            numpy.place(ans, raw == INT32_NO_DATA, NO_DATA)
+
+            # Return answer ...
+            return ans
+        case numpy.uint16:
+            # Convert the minutes to hours ...
+            ans = (raw.astype(numpy.float64) - float(UINT16_OFFSET)) / 60.0     # [hr]
+
+            # Overwrite sentinel codes with their values ...
+            numpy.place(ans, raw == UINT16_ALWAYS_UP, ALWAYS_UP)
+            numpy.place(ans, raw == UINT16_NEVER_UP, NEVER_UP)
+            numpy.place(ans, raw == UINT16_NO_DATA, NO_DATA)
+
+            # Return answer ...
+            return ans
+        case numpy.uint8:
+            # Convert the codes to hours using the lookup table ...
+            lut = numpy.arange(256, dtype = numpy.float64) / float(UINT8_PER_HOUR)  # [hr]
+            lut[UINT8_NO_DATA] = NO_DATA                                        # [hr]
+
+            # Return answer ...
+            return lut[raw]
+        case _:
+            # Crash ...
+            raise ValueError(f"\"raw\" is an unexpected type ({repr(raw.dtype)})") from None
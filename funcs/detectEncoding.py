@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def detectEncoding(
+    bfile,
+    shape,
+    /,
+):
+    # Import standard modules ...
+    import math
+    import os
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Find out how many bytes are used to store each pixel ...
+    size = os.path.getsize(bfile)                                               # [B]
+    npix = math.prod(shape)                                                     # [px]
+    if size % npix != 0:
+        raise Exception(f"\"{bfile}\" is not an integer multiple of the size of the map") from None
+
+    # Return answer ...
+    match size // npix:
+        case 8:
+            return numpy.dtype(numpy.float64)
+        case 4:
+            return numpy.dtype(numpy.int32)
+        case 2:
+            return numpy.dtype(numpy.uint16)
+        case 1:
+            return numpy.dtype(numpy.uint8)
+        case _:
+            raise Exception(f"\"{bfile}\" uses an unexpected number of bytes per pixel ({size // npix:d})") from None
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def downloadFile(
+    url,
+    fname,
+    /,
+    *,
+      chunk = 1048576,
+    retries = 5,
+   segments = 4,
+     sha256 = None,
+    timeout = 60.0,
+):
+    # NOTE: This function downloads "url" to "fname" in "segments" segments at
+    #       the same time (each in its own thread) using HTTP range requests.
+    #       Each segment is saved to its own partial file (named after the
+    #       range of bytes that it covers), so if the download is interrupted
+    #       then the next call only downloads the bytes which are missing (any
+    #       partial files which do not match the current segments are removed).
+    #       If the server does not support range requests then the file is
+    #       downloaded in one go instead.
+    # NOTE: Once all of the bytes have arrived, the segments are joined, the
+    #       size (and the SHA-256 checksum, if "sha256" is given) of the file
+    #       is checked and only then is it atomically moved to "fname". The
+    #       SHA-256 checksum of the file is returned.
+
+    # Import standard modules ...
+    import concurrent.futures
+    import glob
+    import hashlib
+    import http.client
+    import os
+    import re
+    import urllib.error
+    import urllib.request
+
+    # **************************************************************************
+
+    # Define a function to download a range of bytes to a partial file
+    # (resuming from the end of the partial file, if it exists already) ...
+    def downloadRange(pname, first, last, /):
+        # Loop over attempts ...
+        for attempt in range(retries + 1):
+            # Find out how many bytes are still needed ...
+            start = first + (os.path.getsize(pname) if os.path.exists(pname) else 0)
+            if last is not None and start > last:
+                return
+
+            # Request the missing bytes ...
+            req = urllib.request.Request(url)
+            if last is not None:
+                req.add_header("Range", f"bytes={start:d}-{last:d}")
+
+            try:
+                with urllib.request.urlopen(req, timeout = timeout) as resp:
+                    # Check that the server returned the range that was asked
+                    # for ...
+                    if last is not None and resp.status != 206:
+                        raise Exception(f"the server did not return a partial response for \"{url}\"") from None
+
+                    # Append the bytes to the partial file ...
+                    with open(pname, mode = "ab" if last is not None else "wb") as fObj:
+                        while True:
+                            buf = resp.read(chunk)
+                            if not buf:
+                                break
+                            fObj.write(buf)
+
+                # Check that all of the bytes arrived ...
+                if last is not None and os.path.getsize(pname) != last + 1 - first:
+                    raise http.client.IncompleteRead(b"")
+
+                # Stop trying ...
+                return
+            except (ConnectionError, TimeoutError, http.client.IncompleteRead, urllib.error.URLError) as err:
+                # Crash if there are no attempts left ...
+                if attempt == retries:
+                    raise Exception(f"failed to download \"{url}\"") from err
+
+    # **************************************************************************
+
+    # Ask for the first byte to find out the size of the file and whether the
+    # server supports range requests ...
+    # NOTE: This is retried in the same way as the segments are.
+    for attempt in range(retries + 1):
+        req = urllib.request.Request(url, headers = {"Range" : "bytes=0-0"})
+        try:
+            with urllib.request.urlopen(req, timeout = timeout) as resp:
+                match = re.fullmatch(r"bytes 0-0/([0-9]+)", resp.headers.get("Content-Range", ""))
+                if resp.status == 206 and match is not None:
+                    size = int(match.group(1))                                  # [B]
+                else:
+                    size = None
+
+            # Stop trying ...
+            break
+        except (ConnectionError, TimeoutError, http.client.IncompleteRead, urllib.error.URLError) as err:
+            # Crash if there are no attempts left ...
+            if attempt == retries:
+                raise Exception(f"failed to find the size of \"{url}\"") from err
+
+    # Find the partial files (and the ranges of bytes that they cover, if the
+    # server supports range requests) ...
+    if size is None:
+        pnames = [f"{fname}.part"]
+    else:
+        bounds = [size * i // max(1, segments) for i in range(max(1, segments) + 1)]
+        ranges = [(first, last - 1) for first, last in zip(bounds[:-1], bounds[1:], strict = True) if last > first]
+        pnames = [f"{fname}.part{first:d}-{last:d}" for first, last in ranges]
+
+    # Remove any partial files which were left behind by a previous call which
+    # used a different number of segments (as their ranges do not match) ...
+    for pname in glob.glob(f"{glob.escape(fname)}.part*"):
+        if pname not in pnames:
+            os.remove(pname)
+
+    # Check if the server supports range requests ...
+    if size is None:
+        # Download the whole file ...
+        downloadRange(pnames[0], 0, None)
+        size = os.path.getsize(pnames[0])                                       # [B]
+    else:
+        # Download the segments in a pool of threads ...
+        with concurrent.futures.ThreadPoolExecutor(max_workers = len(ranges)) as pool:
+            futures = [
+                pool.submit(downloadRange, pname, first, last)
+                for pname, (first, last) in zip(pnames, ranges, strict = True)
+            ]
+            for future in futures:
+                future.result()
+
+    # **************************************************************************
+
+    # Join the segments (whilst finding the checksum) ...
+    tname = f"{fname}.tmp"
+    digest = hashlib.sha256()
+    with open(tname, mode = "wb") as fObj:
+        for pname in pnames:
+            with open(pname, mode = "rb") as gObj:
+                while True:
+                    buf = gObj.read(chunk)
+                    if not buf:
+                        break
+                    digest.update(buf)
+                    fObj.write(buf)
+
+    # Check the size and the checksum ...
+    if os.path.getsize(tname) != size:
+        os.remove(tname)
+        raise Exception(f"\"{fname}\" is the wrong size") from None
+    if sha256 is not None and digest.hexdigest() != sha256.lower():
+        # NOTE: The segments are removed too, as one of them must be corrupt.
+        os.remove(tname)
+        for pname in pnames:
+            os.remove(pname)
+        raise Exception(f"\"{fname}\" has the wrong SHA-256 checksum ({digest.hexdigest()})") from None
+
+    # Move the file into place and remove the segments ...
+    os.replace(tname, fname)
+    for pname in pnames:
+        os.remove(pname)
+
+    # Return answer ...
+    return digest.hexdigest()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def encodeMap(
+    arr,
+    /,
+    *,
+     encoding = "float64",
+    sentinels = False,
+):
+    # NOTE: The supported encodings are:
+    #         * "float64" - hours, exactly as they are held in memory;
+    #         * "int32"   - seconds, with sentinel codes for "AlwaysUp" and
+    #                       "NeverUp";
+    #         * "uint16"  - minutes (offset so that -12 hours is zero), with
+    #                       sentinel codes for "AlwaysUp" and "NeverUp"; and
+    #         * "uint8"   - time zones, as the number of quarter-hours (the
+    #                       lookup table is implied by "UINT8_PER_HOUR").
+    # NOTE: The "sentinels" keyword argument controls whether the special
+    #       values "ALWAYS_UP" and "NEVER_UP" should be stored using their
+    #       sentinel codes (which is only true for maps of event times, as
+    #       opposed to maps of differences between times). The special value
+    #       "NO_DATA" (NaN) is always stored using its sentinel code, as it
+    #       cannot be stored as a number.
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .constants import ALWAYS_UP, NEVER_UP
+    from .constants import INT32_ALWAYS_UP, INT32_NEVER_UP, INT32_NO_DATA
+    from .constants import UINT16_ALWAYS_UP, UINT16_NEVER_UP, UINT16_NO_DATA, UINT16_OFFSET
+    from .constants import UINT8_NO_DATA, UINT8_PER_HOUR
+
+    # **************************************************************************
+
+    # Find the pixels which do not have any data ...
+    bad = numpy.isnan(arr)
+
+    # Check encoding ...
+    match encoding:
+        case "float64":
+            # Return answer ...
+            return arr.astype(numpy.float64)
+        case "int32":
+            # Convert the hours to seconds ...
+            ans = numpy.rint(3600.0 * numpy.where(bad, 0.0, arr)).astype(numpy.int32)  # [s]
+
+            # Overwrite sentinel values with their codes ...
+            if sentinels:
+                numpy.place(ans, arr == ALWAYS_UP, INT32_ALWAYS_UP)
+                numpy.place(ans, arr == NEVER_UP, INT32_NEVER_UP)
+            numpy.place(ans, bad, INT32_NO_DATA)
+
+            # Return answer ...
+            return ans
+        case "uint16":
+            # Convert the hours to minutes ...
+            tmp = numpy.rint(60.0 * numpy.where(bad, 0.0, arr)) + float(UINT16_OFFSET)  # [min]
+            if tmp.min() < 0.0 or tmp.max() >= float(UINT16_NEVER_UP):
+                raise Exception("the map cannot be stored as \"uint16\" because it contains values outside of the supported range") from None
+            ans = tmp.astype(numpy.uint16)                                      # [min]
+
+            # Overwrite sentinel values with their codes ...
+            if sentinels:
+                numpy.place(ans, arr == ALWAYS_UP, UINT16_ALWAYS_UP)
+                numpy.place(ans, arr == NEVER_UP, UINT16_NEVER_UP)
+            numpy.place(ans, bad, UINT16_NO_DATA)
+
+            # Return answer ...
+            return ans
+        case "uint8":
+            # Convert the hours to codes ...
+            tmp = float(UINT8_PER_HOUR) * numpy.where(bad, 0.0, arr)
+            if tmp.min() < 0.0 or tmp.max() >= float(UINT8_NO_DATA):
+                raise Exception("the map cannot be stored as \"uint8\" because it contains values outside of the supported range") from None
+            if not numpy.array_equal(tmp, numpy.rint(tmp)):
+                raise Exception("the map cannot be stored as \"uint8\" because it contains values that are not whole quarter-hours") from None
+
+            # Overwrite sentinel values with their codes ...
+            ans = tmp.astype(numpy.uint8)
+            numpy.place(ans, bad, UINT8_NO_DATA)
+
+            # Return answer ...
+            return ans
+        case _:
+            # Crash ...
+            raise ValueError(f"\"encoding\" is an unexpected value ({repr(encoding)})") from None
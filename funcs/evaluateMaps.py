@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def evaluateMaps(
+    func,
+    ifiles,
+    shape,
+    bfile,
+    /,
+    *,
+        chunk = 64,
+     encoding = "float64",
+        image = False,
+         mask = None,
+          pal = None,
+        pfile = None,
+    sentinels = False,
+         vmax = 1.0,
+         vmin = 0.0,
+):
+    # NOTE: This function evaluates "func" on the maps in the BIN files
+    #       "ifiles" (which are passed to it, decoded into hours, as positional
+    #       arguments) a chunk of "chunk" rows at a time. The inputs are
+    #       memory-mapped, so only one chunk of each of them is ever held in
+    #       memory. The answer of each chunk is appended straight to "bfile"
+    #       (unless it is None), see "encodeMap()" for the meaning of
+    #       "encoding" and "sentinels".
+    # NOTE: If "pfile" is given then the answer is quantised between "vmin" and
+    #       "vmax" and the quantised chunks are streamed straight into a
+    #       paletted PNG (using the palette "pal", see "loadPalette()" and
+    #       "streamPng()"), so the memory usage does not depend on the size of
+    #       the maps at all. If "image" is True (and "pfile" is not given) then
+    #       the quantised chunks are copied into an image (which is ready to be
+    #       saved as a paletted PNG) and it is returned instead. Otherwise, the
+    #       answer is not quantised at all and None is returned.
+    # NOTE: If "mask" is given then the answer is set to "NO_DATA" wherever the
+    #       mask in that BIN file (see "loadMask()") is not set. The pixels
+    #       which do not have any data are quantised as the reserved index of
+    #       the palette (see "quantiseMap()").
+
+    # Import standard modules ...
+    import os
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .constants import NO_DATA
+    from .decodeMap import decodeMap
+    from .detectEncoding import detectEncoding
+    from .encodeMap import encodeMap
+    from .quantiseMap import quantiseMap
+    from .streamPng import streamPng
+
+    # **************************************************************************
+
+    # Memory-map the inputs ...
+    maps = [
+        numpy.memmap(
+            ifile,
+            dtype = detectEncoding(ifile, shape),
+             mode = "r",
+            shape = shape,
+        )
+        for ifile in ifiles
+    ]
+    if mask is not None:
+        if os.path.getsize(mask) != shape[0] * shape[1]:
+            raise Exception(f"\"{mask}\" is not the same size as the map") from None
+        mask = numpy.memmap(
+            mask,
+            dtype = numpy.uint8,
+             mode = "r",
+            shape = shape,
+        )
+
+    # Define a function to evaluate the function on each chunk and to yield
+    # the answer ...
+    def evaluateChunks(fObj, /):
+        # Loop over chunks of rows ...
+        for iy0 in range(0, shape[0], chunk):
+            # Create short-hand ...
+            iy1 = min(shape[0], iy0 + chunk)
+
+            # Evaluate the function on this chunk ...
+            ans = func(*[decodeMap(numpy.asarray(m[iy0:iy1, :])) for m in maps])
+
+            # Remove the answer where it is not wanted (if needed) ...
+            if mask is not None:
+                ans = numpy.where(mask[iy0:iy1, :] != 0, ans, NO_DATA)
+
+            # Append the answer to the output (if needed) ...
+            if fObj is not None:
+                encodeMap(
+                    ans,
+                     encoding = encoding,
+                    sentinels = sentinels,
+                ).tofile(fObj)
+
+            # Yield the answer ...
+            yield ans
+
+    # Define a function to quantise the answer of each chunk ...
+    def quantiseChunks(chunks, /):
+        # Loop over chunks ...
+        for ans in chunks:
+            # Yield the quantised answer ...
+            yield quantiseMap(
+                ans,
+                vmax = vmax,
+                vmin = vmin,
+            )
+
+    # **************************************************************************
+
+    # Open output (if needed) ...
+    fObj = None if bfile is None else open(bfile, mode = "wb")
+
+    try:
+        # Check if the image should be streamed into a PNG ...
+        if pfile is not None:
+            # Stream the quantised chunks into the PNG ...
+            streamPng(quantiseChunks(evaluateChunks(fObj)), pfile, shape, pal)
+
+            # Return answer ...
+            return None
+
+        # Check if an image is not wanted ...
+        if not image:
+            # Loop over chunks ...
+            for _ in evaluateChunks(fObj):
+                pass
+
+            # Return answer ...
+            return None
+
+        # Make image ...
+        img = numpy.zeros(
+            (shape[0], shape[1], 1),
+            dtype = numpy.uint8,
+        )
+
+        # Loop over quantised chunks ...
+        iy0 = 0
+        for band in quantiseChunks(evaluateChunks(fObj)):
+            # Copy the quantised chunk into the image ...
+            img[iy0:iy0 + band.shape[0], :, 0] = band
+            iy0 += band.shape[0]
+    finally:
+        # Close output (if needed) ...
+        if fObj is not None:
+            fObj.close()
+
+    # Return answer ...
+    return img
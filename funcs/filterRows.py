@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def filterRows(
+    rows,
+    prev,
+    /,
+):
+    # NOTE: This function applies the PNG row filters, see
+    #       https://www.w3.org/TR/png-3/#9Filters, to a band of rows of an 8-bit
+    #       image with one byte per pixel ("rows", a 2D array of "uint8"), where
+    #       "prev" is the row before the band (or zeros for the first band). All
+    #       five filters are applied to every row at once and the one with the
+    #       smallest sum of absolute differences is chosen for each row (which
+    #       is the heuristic recommended by the PNG specification). The
+    #       returned array has the filter type prepended to each row.
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Create short-hands for the pixel itself and the pixels to the left of it,
+    # above it and above and to the left of it ...
+    x = rows.astype(numpy.int16)
+    b = numpy.concatenate([prev.reshape(1, -1), rows[:-1, :]]).astype(numpy.int16)
+    a = numpy.zeros_like(x)
+    a[:, 1:] = x[:, :-1]
+    c = numpy.zeros_like(b)
+    c[:, 1:] = b[:, :-1]
+
+    # Calculate the Paeth predictor ...
+    p = a + b - c
+    pa = numpy.abs(p - a)
+    pb = numpy.abs(p - b)
+    pc = numpy.abs(p - c)
+    paeth = numpy.where((pa <= pb) & (pa <= pc), a, numpy.where(pb <= pc, b, c))
+
+    # Apply all of the filters ...
+    cands = numpy.stack(
+        [
+            x,
+            x - a,
+            x - b,
+            x - (a + b) // 2,
+            x - paeth,
+        ]
+    ).astype(numpy.uint8)
+
+    # Choose the filter with the smallest sum of absolute differences for each
+    # row (treating the filtered bytes as signed) ...
+    cost = cands.astype(numpy.int8).astype(numpy.int16)
+    best = numpy.abs(cost).sum(axis = 2, dtype = numpy.int64).argmin(axis = 0)
+
+    # Return answer ...
+    ans = numpy.zeros((rows.shape[0], rows.shape[1] + 1), dtype = numpy.uint8)
+    ans[:, 0] = best
+    ans[:, 1:] = cands[best, numpy.arange(rows.shape[0]), :]
+    return ans
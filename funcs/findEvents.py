@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def findEvents(
+    geom,
+    tab,
+    /,
+    *,
+       chunk = 8192,
+       event = "transit",
+    pressure = 1010.0,
+      stride = 6,
+        temp = 15.0,
+):
+    # NOTE: This function finds the time of the first event (either "rising",
+    #       "transit" or "setting") after the start of the table for every pixel
+    #       in the geometry, where the table and the geometry have been made by
+    #       "calcTable()" and "calcGeometry()" respectively. The position of the
+    #       body is evaluated for every pixel at every "stride" rows of the
+    #       table and then at every row within the bracketing pair (in chunks of
+    #       "chunk" pixels, to limit the memory usage) and the time of the event
+    #       is linearly interpolated between the two rows of the table which
+    #       bracket it.
+    # NOTE: As in "ephem", the event is when the upper limb of the body crosses
+    #       the horizon of the observer (after correcting for refraction, using
+    #       "pressure" and "temp", and parallax).
+    # NOTE: The returned map is in hours after the start of the table. If a
+    #       rising (or setting) does not occur within the table then the map
+    #       contains either "ALWAYS_UP" or "NEVER_UP".
+
+    # Import special modules ...
+    try:
+        import ephem
+    except:
+        raise Exception("\"ephem\" is not installed; run \"pip install --user ephem\"") from None
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .constants import ALWAYS_UP, NEVER_UP
+
+    # **************************************************************************
+
+    # Check inputs ...
+    if event not in ["rising", "setting", "transit"]:
+        raise ValueError(f"\"event\" is an unexpected value ({repr(event)})") from None
+
+    # Create short-hands ...
+    times = tab["times"]                                                        # [hr]
+    npix = geom["lon"].size
+
+    # Make a lookup table to convert apparent altitudes to true altitudes (as
+    # "ephem.unrefract()" only works on scalars) ...
+    appAlt = numpy.radians(numpy.linspace(-15.0, 15.0, 3001))                   # [rad]
+    truAlt = numpy.array([ephem.unrefract(pressure, temp, float(alt)) for alt in appAlt])   # [rad]
+
+    # Define a function to evaluate the quantity which crosses zero at the event
+    # for some pixels at some rows of the table ...
+    def calcF(pix, row):
+        # Calculate the hour angle of the body ...
+        ha = tab["gst"][row] + geom["lon"][pix] - tab["ra"][row]                # [rad]
+
+        # Check which event is being looked for ...
+        if event == "transit":
+            # Return the hour angle (wrapped so that it crosses zero from below
+            # as the body crosses the meridian from east to west) ...
+            return (ha + numpy.pi) % (2.0 * numpy.pi) - numpy.pi                # [rad]
+
+        # Calculate the geocentric altitude of the body ...
+        alt = numpy.arcsin(
+            numpy.clip(
+                geom["sinLat"][pix] * numpy.sin(tab["dec"][row]) + geom["cosLat"][pix] * numpy.cos(tab["dec"][row]) * numpy.cos(ha),
+                -1.0,
+                +1.0,
+            )
+        )                                                                       # [rad]
+
+        # Correct the altitude for parallax ...
+        alt -= numpy.arcsin(geom["rho"][pix] / tab["dist"][row]) * numpy.cos(alt)   # [rad]
+
+        # Calculate the true altitude of the centre of the body when its upper
+        # limb is on the horizon ...
+        tgt = numpy.interp(geom["hzn"][pix] - tab["rad"][row], appAlt, truAlt)  # [rad]
+
+        # Return the altitude relative to the horizon (negated for settings, so
+        # that it crosses zero from below) ...
+        if event == "rising":
+            return alt - tgt                                                    # [rad]
+        return tgt - alt                                                        # [rad]
+
+    # Define the rows of the coarse table ...
+    # NOTE: The crossings are found in two stages: first every "stride" rows of
+    #       the table and then every row within the bracketing pair of coarse
+    #       rows, so that only a fraction of the table is evaluated for every
+    #       pixel.
+    stride = max(1, min(stride, times.size - 1))
+    coarse = numpy.arange(0, times.size - 1 + stride, stride).clip(max = times.size - 1)
+    fine = numpy.arange(stride + 1)
+
+    # Initialize map ...
+    ans = numpy.zeros(npix, dtype = numpy.float64)                              # [hr]
+
+    # Loop over chunks of pixels ...
+    for i0 in range(0, npix, chunk):
+        # Create short-hands ...
+        pix = numpy.arange(i0, min(npix, i0 + chunk))
+        rows = numpy.arange(pix.size)
+
+        # Find the first crossing in the coarse table ...
+        f = calcF(pix.reshape(-1, 1), coarse.reshape(1, -1))
+        cross = (f[:, :-1] < 0.0) & (f[:, 1:] >= 0.0)
+        found = cross.any(axis = 1)
+
+        # Overwrite the pixels where the event does not occur with the
+        # sentinel values (remembering that the altitude is negated for
+        # settings) ...
+        up = (f[:, 0] >= 0.0) if event == "rising" else (f[:, 0] < 0.0)
+        ans[pix[~found & up]] = ALWAYS_UP                                       # [hr]
+        ans[pix[~found & ~up]] = NEVER_UP                                       # [hr]
+
+        # Skip this chunk if there are not any crossings ...
+        if not found.any():
+            continue
+
+        # Find the first crossing in the fine table (between the bracketing
+        # pair of coarse rows) ...
+        pix = pix[found]
+        rows = rows[:pix.size]
+        k = coarse[cross[found, :].argmax(axis = 1)]
+        fineRows = (k.reshape(-1, 1) + fine.reshape(1, -1)).clip(max = times.size - 1)
+        f = calcF(pix.reshape(-1, 1), fineRows)
+        cross = (f[:, :-1] < 0.0) & (f[:, 1:] >= 0.0)
+        j = cross.argmax(axis = 1)
+
+        # Interpolate to find the time of the crossing ...
+        t0 = times[fineRows[rows, j]]                                           # [hr]
+        t1 = times[fineRows[rows, j + 1]]                                       # [hr]
+        f0 = f[rows, j]
+        f1 = f[rows, j + 1]
+        ans[pix] = t0 + (t1 - t0) * f0 / (f0 - f1)                              # [hr]
+
+    # Return answer ...
+    return ans.reshape(geom["shape"])
@@ -2,15 +2,20 @@
 
 # Define function ...
 def horizon(e, /):
-    # Import standard modules ...
-    import math
+    # NOTE: The elevation can be either a number or an array (in which case the
+    #       angle is calculated for every element of it), so that the same
+    #       formula is used by "solveSunEvents()" and by "calcGeometry()".
 
     # Import special modules ...
     try:
         import ephem
     except:
         raise Exception("\"ephem\" is not installed; run \"pip install --user ephem\"") from None
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
 
     # Calculate the angle below horizontal down to the horizon due to the
     # observer being above the radius of the Earth ...
-    return -math.acos(ephem.earth_radius / (e + ephem.earth_radius))            # [rad]
+    return -numpy.arccos(ephem.earth_radius / (e + ephem.earth_radius))         # [rad]
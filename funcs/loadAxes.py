@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+# Define a cache of the axes which have already been loaded by this process ...
+# NOTE: The keys are the absolute paths and modification times of the BIN files.
+AXES = {}
+
+# Define function ...
+def loadAxes(
+    *,
+    lfile = "lat.bin",
+    mfile = "lon.bin",
+):
+    # NOTE: The axes are only loaded once per process (unless the BIN files
+    #       change), so running several steps in the same process (for
+    #       example, using "wtzscb.py all") only pays for it once. The returned
+    #       arrays are shared and so they are read-only.
+
+    # Import standard modules ...
+    import os
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Check if the axes have not been loaded by this process yet ...
+    key = tuple((os.path.abspath(fname), os.path.getmtime(fname)) for fname in [mfile, lfile])
+    if key not in AXES:
+        # Load axes ...
+        lon = numpy.fromfile(mfile, dtype = numpy.float64)                      # [rad]
+        lat = numpy.fromfile(lfile, dtype = numpy.float64)                      # [rad]
+        lon.setflags(write = False)
+        lat.setflags(write = False)
+
+        # Add axes to the cache ...
+        AXES[key] = (lon, lat)
+
+    # Return answer ...
+    return AXES[key]
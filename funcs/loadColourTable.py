@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+# Define a cache of the colour tables which have already been loaded by this
+# process ...
+TABLES = {}
+
+# Define function ...
+def loadColourTable(
+    name,
+    /,
+):
+    # NOTE: The JSON file of colour tables is only parsed once per process, so
+    #       running several steps in the same process (for example, using
+    #       "wtzscb.py all") only pays for it once.
+
+    # Import standard modules ...
+    import json
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # **************************************************************************
+
+    # Check if the colour tables have not been loaded by this process yet ...
+    if not TABLES:
+        # Load colour tables and add them to the cache ...
+        with open(f"{pyguymer3.__path__[0]}/data/json/colourTables.json", mode = "rt", encoding = "utf-8") as fObj:
+            colourTables = json.load(fObj)
+        for key, value in colourTables.items():
+            TABLES[key] = numpy.array(value).astype(numpy.uint8)
+            TABLES[key].setflags(write = False)
+
+    # Return answer ...
+    return TABLES[name]
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+# Define a cache of the maps which have already been loaded by this process ...
+# NOTE: The keys are the absolute paths, modification times and sizes of the
+#       BIN files, along with the shapes of the maps.
+MAPS = {}
+
+# Define function ...
+def loadMap(
+    bfile,
+    shape,
+    /,
+):
+    # NOTE: The encoding of the BIN file is determined from its size, see
+    #       "encodeMap()" for the list of supported encodings. The returned map
+    #       is always decoded into hours.
+    # NOTE: The maps are only loaded once per process (unless the BIN files
+    #       change), so running several steps in the same process (for
+    #       example, using "wtzscb.py all") only pays for it once. The returned
+    #       arrays are shared and so they are read-only.
+
+    # Import standard modules ...
+    import os
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .decodeMap import decodeMap
+    from .detectEncoding import detectEncoding
+
+    # **************************************************************************
+
+    # Check if the map has not been loaded by this process yet ...
+    key = (os.path.abspath(bfile), os.path.getmtime(bfile), os.path.getsize(bfile), tuple(shape))
+    if key not in MAPS:
+        # Load map and decode it ...
+        arr = decodeMap(
+            numpy.fromfile(bfile, dtype = detectEncoding(bfile, shape)).reshape(shape)
+        )
+        arr.setflags(write = False)
+
+        # Add map to the cache ...
+        MAPS[key] = arr
+
+    # Return answer ...
+    return MAPS[key]
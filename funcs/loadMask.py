@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+# Define a cache of the masks which have already been loaded by this process
+# ...
+# NOTE: The keys are the absolute paths, modification times and sizes of the
+#       BIN files, along with the shapes of the masks.
+MASKS = {}
+
+# Define function ...
+def loadMask(
+    bfile,
+    shape,
+    /,
+):
+    # NOTE: A mask is stored as one byte per pixel, which is non-zero where the
+    #       pixel is wanted (for example, "land.bin" made by
+    #       "step1a_makeElevationMap.py", which is non-zero where the pixel
+    #       contains any land). The returned mask is always boolean.
+    # NOTE: The masks are only loaded once per process (unless the BIN files
+    #       change), so running several steps in the same process (for
+    #       example, using "wtzscb.py all") only pays for it once. The returned
+    #       arrays are shared and so they are read-only.
+
+    # Import standard modules ...
+    import math
+    import os
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Check the size of the mask ...
+    if os.path.getsize(bfile) != math.prod(shape):
+        raise Exception(f"\"{bfile}\" is not the same size as the map") from None
+
+    # Check if the mask has not been loaded by this process yet ...
+    key = (os.path.abspath(bfile), os.path.getmtime(bfile), os.path.getsize(bfile), tuple(shape))
+    if key not in MASKS:
+        # Load mask ...
+        arr = numpy.fromfile(bfile, dtype = numpy.uint8).reshape(shape) != 0
+        arr.setflags(write = False)
+
+        # Add mask to the cache ...
+        MASKS[key] = arr
+
+    # Return answer ...
+    return MASKS[key]
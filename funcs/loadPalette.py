@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+# Define a cache of the palettes which have already been made by this process
+# ...
+PALETTES = {}
+
+# Define function ...
+def loadPalette(
+    name,
+    /,
+):
+    # NOTE: This function makes the palette of a PNG file from the colour table
+    #       "name" (see "loadColourTable()"). The index "PALETTE_NO_DATA" is
+    #       reserved for the pixels which do not have any data and the colour
+    #       table is resampled into the other 255 indices, in the same order
+    #       as the images made by "quantiseMap()". The returned array is
+    #       shared and so it is read-only.
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .constants import PALETTE_NO_DATA, PALETTE_NO_DATA_COLOUR
+    from .loadColourTable import loadColourTable
+
+    # **************************************************************************
+
+    # Check if the palette has not been made by this process yet ...
+    if name not in PALETTES:
+        # Load colour table ...
+        cmap = loadColourTable(name)
+
+        # Make palette ...
+        pal = numpy.zeros((256, 3), dtype = numpy.uint8)
+        pal[numpy.arange(256) != PALETTE_NO_DATA, :] = cmap[numpy.round(numpy.linspace(0.0, float(cmap.shape[0] - 1), 255)).astype(numpy.int64), :]
+        pal[PALETTE_NO_DATA, :] = PALETTE_NO_DATA_COLOUR
+        pal.setflags(write = False)
+
+        # Add palette to the cache ...
+        PALETTES[name] = pal
+
+    # Return answer ...
+    return PALETTES[name]
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def locatePoints(
+    geoms,
+    lon,
+    lat,
+    /,
+):
+    # NOTE: This function is the same as "rasterise()" but for a list of points
+    #       (given as 1D arrays of longitude [rad] and latitude [rad]) rather
+    #       than for the centres of the pixels of a map. The returned array
+    #       contains the index of the geometry (plus one) that contains each
+    #       point, or zero if no geometry contains it. If more than one geometry
+    #       contains a point then the last one wins.
+    # NOTE: The geometries are put in a spatial index so that each point is
+    #       only tested against the geometries whose bounding boxes contain it.
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+    try:
+        import shapely
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # **************************************************************************
+
+    # Make label array ...
+    labs = numpy.zeros(numpy.size(lon), dtype = numpy.int32)
+
+    # Make a spatial index of the geometries (replacing the missing ones with
+    # empty geometries, so that the indices still match) ...
+    tree = shapely.STRtree(
+        [geom if geom is not None else shapely.Polygon() for geom in geoms]
+    )
+
+    # Make the points ...
+    pnts = shapely.points(
+        numpy.degrees(numpy.ravel(lon)),
+        numpy.degrees(numpy.ravel(lat)),
+    )
+
+    # Find every pair of point and geometry where the point is within the
+    # geometry ...
+    ipnt, igeom = tree.query(pnts, predicate = "within")
+
+    # Set points to the (largest) label of the geometries which contain them ...
+    numpy.maximum.at(labs, ipnt, igeom.astype(numpy.int32) + 1)
+
+    # Return answer ...
+    return labs
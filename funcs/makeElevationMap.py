@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makeElevationMap(
+    zfile,
+    /,
+    *,
+    jobs = 1,
+      sc = 100,
+):
+    # NOTE: This function makes the map of the mean elevation of every "sc" x
+    #       "sc" block of pixels of GLOBE (having risen everywhere up to sea
+    #       level) from the ZIP file "zfile" of the 16 GLOBE tiles, along with
+    #       its axes and the mask of the pixels which contain any land. The
+    #       longitude axis [rad], the latitude axis [rad] (descending), the
+    #       elevation map [m] and the land mask (boolean) are returned.
+    # NOTE: The tiles are loaded and scaled independently (see "reduceTile()")
+    #       by a pool of up to "jobs" threads and are then copied into the
+    #       scaled maps, so the full resolution map is never made. Each thread
+    #       holds about five bytes per pixel of the largest tile (6000 x 10800
+    #       pixels) at full resolution.
+
+    # Import standard modules ...
+    import concurrent.futures
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .reduceTile import reduceTile
+
+    # **************************************************************************
+
+    # Define constants ...
+    bins = [
+        "all10/a11g",
+        "all10/b10g",
+        "all10/c10g",
+        "all10/d10g",
+        "all10/e10g",
+        "all10/f10g",
+        "all10/g10g",
+        "all10/h10g",
+        "all10/i10g",
+        "all10/j10g",
+        "all10/k10g",
+        "all10/l10g",
+        "all10/m10g",
+        "all10/n10g",
+        "all10/o10g",
+        "all10/p10g",
+    ]
+    nx = 43200                                                                  # [px]
+    ny = 21600                                                                  # [px]
+
+    # Check the scale that everything else will be done at ...
+    if nx % sc != 0:
+        raise Exception("\"nx\" must be an integer multiple of \"sc\"") from None
+    if ny % sc != 0:
+        raise Exception("\"ny\" must be an integer multiple of \"sc\"") from None
+
+    # Initialize arrays ...
+    scElev = numpy.zeros((ny // sc, nx // sc), dtype = numpy.float64)          # [m]
+    scLand = numpy.zeros((ny // sc, nx // sc), dtype = bool)
+
+    # Create a pool of threads ...
+    with concurrent.futures.ThreadPoolExecutor(max_workers = jobs) as pool:
+        # Initialize dictionary ...
+        futures = {}
+
+        # Initialize index ...
+        iy = 0                                                                  # [px]
+
+        # Loop over y-axis ...
+        for i in range(4):
+            # Initialize index ...
+            ix = 0                                                              # [px]
+
+            # Loop over x-axis ...
+            for j in range(4):
+                # Define tile size ...
+                if i in [0, 3]:
+                    nrows = 4800                                                # [px]
+                else:
+                    nrows = 6000                                                # [px]
+                ncols = 10800                                                   # [px]
+
+                # Load and scale tile ...
+                future = pool.submit(
+                    reduceTile,
+                    zfile,
+                    bins[j + i * 4],
+                    (nrows, ncols),
+                    sc,
+                    land = True,
+                )
+                futures[future] = (iy // sc, ix // sc)
+
+                # Increment index ...
+                ix += ncols                                                     # [px]
+
+            # Increment index ...
+            iy += nrows                                                         # [px]
+
+        # Loop over futures ...
+        for future in concurrent.futures.as_completed(futures):
+            # Create short-hands ...
+            tile, frac = future.result()                                        # [m]
+            iy, ix = futures[future]
+
+            # Fill maps ...
+            # NOTE: A pixel is land if any of the GLOBE pixels in it are land,
+            #       so that coasts and small islands are kept.
+            scElev[iy:iy + tile.shape[0], ix:ix + tile.shape[1]] = tile[:, :]   # [m]
+            scLand[iy:iy + tile.shape[0], ix:ix + tile.shape[1]] = frac[:, :] > 0.0
+
+    # Make axes ...
+    lon = numpy.radians(360.0 * (numpy.arange(nx // sc, dtype = numpy.float64) + 0.5) / float(nx // sc) - 180.0)   # [rad]
+    lat = numpy.radians(180.0 * (numpy.arange(ny // sc, dtype = numpy.float64) + 0.5) / float(ny // sc) - 90.0)[::-1].copy()   # [rad]
+
+    # Return answer ...
+    return lon, lat, scElev, scLand
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makeSunEventMap(
+    lon,
+    lat,
+    elev,
+    ref,
+    /,
+    *,
+    chunk = None,
+     cost = False,
+    debug = False,
+    event = "transit",
+     jobs = 1,
+     keep = None,
+     warm = False,
+     wgts = None,
+):
+    # NOTE: This function makes a map of the time of the first event (either
+    #       "rising", "transit" or "setting") of the Sun after the 'aware'
+    #       datetime object "ref" (in hours) for every pixel, using "ephem"
+    #       (see "solveSunEvents()"). The longitude [rad], latitude [rad] and
+    #       elevation [m] are broadcast to the same shape (for example, the
+    #       axes can be passed as a row and a column alongside a 2D elevation
+    #       map) and the returned map has that shape. If "cost" is True then a
+    #       dictionary of maps of how expensive each pixel was to solve is
+    #       returned as well (see "solveSunEvents()").
+    # NOTE: For risings and settings, the pixels where the Sun is clearly
+    #       always up or never up are classified without calling "ephem" (see
+    #       "classifyPixels()"). If "keep" is given then only the pixels where
+    #       it is True are solved and the others are set to "NO_DATA".
+    # NOTE: The pixels which need to be solved are split into contiguous chunks
+    #       of roughly the same cost (using the map of costs "wgts", if it is
+    #       given, see "balanceChunks()") of up to about "chunk" pixels each,
+    #       which are solved by a pool of "jobs" processes (or by this process,
+    #       if "jobs" is one). Nothing is read from or written to the disk, so
+    #       this function can be called many times (and at the same time).
+
+    # Import standard modules ...
+    import concurrent.futures
+    import math
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .balanceChunks import balanceChunks
+    from .classifyPixels import classifyPixels
+    from .constants import ALWAYS_UP, NEVER_UP, NO_DATA
+    from .solveSunEvents import solveSunEvents
+
+    # **************************************************************************
+
+    # Broadcast the inputs to the same shape and flatten them ...
+    lon, lat, elev = numpy.broadcast_arrays(
+        numpy.asarray(lon, dtype = numpy.float64),
+        numpy.asarray(lat, dtype = numpy.float64),
+        numpy.asarray(elev, dtype = numpy.float64),
+    )                                                                           # [rad], [rad], [m]
+    shape = elev.shape
+    lon = lon.ravel()                                                           # [rad]
+    lat = lat.ravel()                                                           # [rad]
+    elev = elev.ravel()                                                         # [m]
+    if keep is None:
+        keep = numpy.ones(elev.size, dtype = bool)
+    else:
+        keep = numpy.broadcast_to(numpy.asarray(keep, dtype = bool), shape).ravel()
+
+    # Classify every pixel as one where the Sun is always up, one where the Sun
+    # is never up or one which needs to be solved (as the Sun always crosses
+    # the meridian, every pixel needs to be solved for noon) ...
+    # NOTE: Only the pixels which need to be solved are passed to "ephem", the
+    #       others are set to the sentinel values directly.
+    if event == "transit":
+        cls = numpy.zeros(elev.size, dtype = numpy.uint8)
+    else:
+        cls = classifyPixels(lat, elev, ref)
+    todo = numpy.flatnonzero((cls == 0) & keep)
+    if debug:
+        print(f"  {((cls == 1) & keep).sum():,d} pixels are always up, {((cls == 2) & keep).sum():,d} pixels are never up and {todo.size:,d} pixels need to be solved.")
+
+    # Split the pixels which need to be solved into chunks which should each
+    # take roughly the same amount of time to solve ...
+    if wgts is None:
+        wgts = numpy.ones(todo.size, dtype = numpy.float64)
+    else:
+        wgts = numpy.broadcast_to(wgts, shape).ravel()[todo]
+    nchunks = 4 * jobs if chunk is None else max(4 * jobs, math.ceil(todo.size / chunk))
+    chunks = balanceChunks(wgts, nchunks)
+
+    # Find the next time that the event will happen for every pixel which needs
+    # to be solved (in a pool of processes, if more than one is wanted) ...
+    if jobs > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers = jobs) as pool:
+            futures = [
+                pool.submit(
+                    solveSunEvents,
+                    lon[todo[c]],
+                    lat[todo[c]],
+                    elev[todo[c]],
+                    ref,
+                     cost = cost,
+                    event = event,
+                     warm = warm,
+                )
+                for c in chunks
+            ]
+            results = [future.result() for future in futures]
+    else:
+        results = [
+            solveSunEvents(
+                lon[todo[c]],
+                lat[todo[c]],
+                elev[todo[c]],
+                ref,
+                 cost = cost,
+                event = event,
+                 warm = warm,
+            )
+            for c in chunks
+        ]
+
+    # Make map (and cost maps, if needed) ...
+    ans = numpy.where(cls == 1, ALWAYS_UP, NEVER_UP)                            # [hr]
+    ans[~keep] = NO_DATA                                                        # [hr]
+    if cost:
+        costs = {
+            "evals" : numpy.zeros(elev.size, dtype = numpy.uint16),
+            "flags" : numpy.where(keep, cls, 0).astype(numpy.uint8),
+             "secs" : numpy.zeros(elev.size, dtype = numpy.float64),            # [s]
+        }
+        if results:
+            ans[todo] = numpy.concatenate([result[0] for result in results])    # [hr]
+            for key in costs:
+                costs[key][todo] = numpy.concatenate([result[1][key] for result in results])
+
+        # Return answer ...
+        return ans.reshape(shape), {key : value.reshape(shape) for key, value in costs.items()}
+    if results:
+        ans[todo] = numpy.concatenate(results)                                  # [hr]
+
+    # Return answer ...
+    return ans.reshape(shape)
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makeTimeZoneMap(
+    labs,
+    zones,
+    /,
+    *,
+    date = None,
+):
+    # NOTE: This function makes a map of the time zones [hr] (between 0 and 24
+    #       hours, in the same convention as the "ZONE" attribute) from the time
+    #       zone label map "labs" (as made by "rasterise()" from the geometries
+    #       of the time zones) and its list of labels "zones" (see
+    #       "civilOffsets()"). The pixels which are not in a time zone are set
+    #       to zero. If "date" is given then the map is of the civil time zones
+    #       (including daylight saving) on that date, otherwise it is of the
+    #       standard time zones.
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .civilOffsets import civilOffsets
+
+    # **************************************************************************
+
+    # Check if the civil time zones are wanted ...
+    if date is not None:
+        # Make a look-up table of the civil time zone of every label on this
+        # date ...
+        lut = civilOffsets(zones, date)                                         # [hr]
+    else:
+        # Make a look-up table of the standard time zone of every label (making
+        # sure that they are positive) ...
+        lut = numpy.zeros(len(zones), dtype = numpy.float64)                    # [hr]
+        for i, zone in enumerate(zones):
+            if zone is not None:
+                lut[i] = zone["ZONE"] % 24.0                                    # [hr]
+
+    # Return answer ...
+    return lut[labs]
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def memoryBudget(
+    text = None,
+    /,
+):
+    # NOTE: This function returns the amount of memory [B] that a step is
+    #       allowed to use. If "text" is given then it is parsed as a number of
+    #       bytes, with an optional binary suffix (for example, "512M" or
+    #       "4GiB"). Otherwise, the memory limit of the control group that this
+    #       process is in (either version 1 or version 2) is used, unless it
+    #       is larger than the physical memory of the machine (or there is no
+    #       limit), in which case the physical memory of the machine is used.
+
+    # Import standard modules ...
+    import os
+    import re
+
+    # **************************************************************************
+
+    # Check if a budget was given ...
+    if text is not None:
+        # Parse the budget ...
+        match = re.fullmatch(r"\s*([0-9.]+)\s*(|[KMGT])(|i?B)\s*", text, flags = re.IGNORECASE)
+        if match is None:
+            raise ValueError(f"\"{text}\" is not a number of bytes") from None
+
+        # Return answer ...
+        return int(float(match.group(1)) * 1024 ** " KMGT".index(match.group(2).upper() or " "))
+
+    # Find the physical memory of the machine ...
+    ans = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")              # [B]
+
+    # Make a list of the files which might contain the memory limit of the
+    # control group that this process is in ...
+    fnames = []
+    try:
+        with open("/proc/self/cgroup", mode = "rt", encoding = "utf-8") as fObj:
+            for line in fObj:
+                _, ctrls, path = line.strip().split(":", 2)
+                if ctrls == "":
+                    fnames.append(f"/sys/fs/cgroup{path}/memory.max")
+                elif "memory" in ctrls.split(","):
+                    fnames.append(f"/sys/fs/cgroup/memory{path}/memory.limit_in_bytes")
+    except (FileNotFoundError, ValueError):
+        pass
+    fnames += [
+        "/sys/fs/cgroup/memory.max",
+        "/sys/fs/cgroup/memory/memory.limit_in_bytes",
+    ]
+
+    # Loop over files ...
+    for fname in fnames:
+        # Skip this file if it does not exist ...
+        if not os.path.exists(fname):
+            continue
+
+        # Load the limit (which is "max" if there is no limit) ...
+        with open(fname, mode = "rt", encoding = "utf-8") as fObj:
+            limit = fObj.read().strip()
+        if limit.isdigit():
+            ans = min(ans, int(limit))                                          # [B]
+        break
+
+    # Return answer ...
+    return ans
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def overrideZones(
+    tmzn,
+    gues,
+    mask,
+    offsets,
+    /,
+):
+    # NOTE: This function returns a copy of the time zone map "tmzn" where the
+    #       pixels in "mask" have been moved to one of the time zones in
+    #       "offsets" [hr]. If more than one time zone is given then each pixel
+    #       is moved to the one which is closest to the time zone that it
+    #       should be in, "gues" (which splits a country into bands of
+    #       longitude, much like "solveOffsets()" does). The time zones in the
+    #       returned map follow the same convention as "tmzn", i.e., they are
+    #       between 0 and 24 hours.
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Create short-hands ...
+    offsets = numpy.asarray(offsets, dtype = numpy.float64).ravel()             # [hr]
+    ans = tmzn.copy()                                                           # [hr]
+
+    # Find the time zone that each pixel in the mask should be in ...
+    want = gues[mask]                                                           # [hr]
+
+    # Find the closest time zone for each pixel in the mask (taking into
+    # account that the time zones wrap around) ...
+    dist = numpy.abs((want.reshape(-1, 1) - offsets.reshape(1, -1) + 12.0) % 24.0 - 12.0)  # [hr]
+    ans[mask] = offsets[numpy.argmin(dist, axis = 1)] % 24.0                    # [hr]
+
+    # Return answer ...
+    return ans
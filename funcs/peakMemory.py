@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def peakMemory():
+    # NOTE: This function returns the peak memory usage (the maximum resident
+    #       set size) [B] of this process and of the largest of its child
+    #       processes which have finished (for example, the worker processes of
+    #       a pool which has been shut down).
+
+    # Import standard modules ...
+    import resource
+    import sys
+
+    # **************************************************************************
+
+    # Find out what units the maximum resident set size is in ...
+    # NOTE: It is in kibibytes on Linux and in bytes on macOS.
+    scale = 1 if sys.platform == "darwin" else 1024
+
+    # Return answer ...
+    return {
+        "children" : scale * resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,    # [B]
+            "self" : scale * resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,    # [B]
+    }
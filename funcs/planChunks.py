@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def planChunks(
+    budget,
+    nitems,
+    /,
+    *,
+      fixed = 0,
+       jobs = 1,
+    perItem = 0,
+     perJob = 0,
+):
+    # NOTE: This function chooses how many jobs to run at the same time (up to
+    #       "jobs") and how many of the "nitems" items each job should work on
+    #       at a time, so that the estimated peak memory usage of a step,
+    #
+    #           fixed + njobs * (perJob + chunk * perItem),
+    #
+    #       is below "budget" [B]. "fixed" is the memory which is used however
+    #       the work is split up, "perJob" is the memory which is used by each
+    #       job however much it works on (for example, the memory of a worker
+    #       process) and "perItem" is the memory which is used by a job for
+    #       each item that it works on. As many jobs as possible are run (as
+    #       that is faster) and then each one is given as many items as
+    #       possible. The number of jobs, the number of items per chunk and the
+    #       estimated peak memory usage [B] are returned.
+
+    # Import standard modules ...
+    import math
+
+    # **************************************************************************
+
+    # Find the memory which is left after the fixed usage ...
+    spare = budget - fixed                                                      # [B]
+    if spare < perJob + perItem:
+        raise Exception(f"the memory budget ({budget / 1048576.0:,.1f} MiB) is too small, at least {(fixed + perJob + perItem) / 1048576.0:,.1f} MiB is needed") from None
+
+    # Find the most jobs which fit (with one item each) ...
+    njobs = max(1, min(jobs, nitems, spare // (perJob + perItem)))
+
+    # Find the most items per chunk which fit ...
+    if perItem > 0:
+        chunk = max(1, min(math.ceil(nitems / njobs), (spare // njobs - perJob) // perItem))
+    else:
+        chunk = math.ceil(nitems / njobs)
+
+    # Return answer ...
+    return int(njobs), int(chunk), int(fixed + njobs * (perJob + chunk * perItem))
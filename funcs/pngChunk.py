@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def pngChunk(
+    typ,
+    data,
+    /,
+):
+    # NOTE: See https://www.w3.org/TR/png-3/#5Chunk-layout
+
+    # Import standard modules ...
+    import struct
+    import zlib
+
+    # **************************************************************************
+
+    # Return the chunk (its length, its type, its data and the CRC of its type
+    # and its data) ...
+    return struct.pack(">I", len(data)) + typ + data + struct.pack(">I", zlib.crc32(typ + data))
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def quantiseMap(
+    arr,
+    /,
+    *,
+    vmax = 1.0,
+    vmin = 0.0,
+):
+    # NOTE: This function quantises a map between "vmin" and "vmax" into the
+    #       indices of a palette made by "loadPalette()", so that it is ready
+    #       to be saved as a paletted PNG. The pixels which do not have any data
+    #       (which are NaN) are set to the reserved index "PALETTE_NO_DATA" and
+    #       the other pixels are set to the other 255 indices (values outside
+    #       of the range are clipped), so that they never look like each other.
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .constants import PALETTE_NO_DATA
+
+    # **************************************************************************
+
+    # Find the indices of the data (skipping the reserved index) ...
+    bad = numpy.isnan(arr)
+    idx = (254.0 * numpy.clip((numpy.where(bad, vmin, arr) - vmin) / (vmax - vmin), 0.0, 1.0)).astype(numpy.uint8)
+    idx += (idx >= PALETTE_NO_DATA).astype(numpy.uint8)
+
+    # Return answer ...
+    return numpy.where(bad, numpy.uint8(PALETTE_NO_DATA), idx)
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def rasterise(
+    geoms,
+    lon,
+    lat,
+    /,
+):
+    # NOTE: The returned map contains the index of the geometry (plus one) that
+    #       contains the centre of each pixel, or zero if no geometry contains
+    #       it. If more than one geometry contains a pixel then the last one
+    #       wins (which matches the original behaviour of "step3a").
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+    try:
+        import shapely
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # **************************************************************************
+
+    # Make label map ...
+    if len(geoms) >= numpy.iinfo(numpy.int16).max:
+        raise Exception("there are too many geometries to be labelled") from None
+    labs = numpy.zeros((lat.size, lon.size), dtype = numpy.int16)
+
+    # Convert the axes to degrees ...
+    lonDeg = numpy.degrees(lon)                                                 # [°]
+    latDeg = numpy.degrees(lat)                                                 # [°]
+
+    # Loop over geometries ...
+    for i, geom in enumerate(geoms):
+        # Skip this geometry if it is empty ...
+        if geom is None or geom.is_empty:
+            continue
+
+        # Find the pixels which are within the bounding box of the geometry
+        # (so that only a small sub-grid needs to be tested) ...
+        # NOTE: Both axes are monotonic and so the pixels are contiguous.
+        minLon, minLat, maxLon, maxLat = geom.bounds                            # [°], [°], [°], [°]
+        ixs = numpy.flatnonzero((lonDeg >= minLon) & (lonDeg <= maxLon))
+        iys = numpy.flatnonzero((latDeg >= minLat) & (latDeg <= maxLat))
+        if ixs.size == 0 or iys.size == 0:
+            continue
+
+        # Find the pixels in the sub-grid which are within the geometry ...
+        x, y = numpy.meshgrid(lonDeg[ixs], latDeg[iys])                         # [°], [°]
+        shapely.prepare(geom)
+        inside = shapely.contains_xy(geom, x, y)
+
+        # Set pixels to the label of the geometry ...
+        sub = labs[iys[0]:iys[-1] + 1, ixs[0]:ixs[-1] + 1]
+        sub[inside] = i + 1
+
+    # Return answer ...
+    return labs
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def reduceTile(
+    zfile,
+    member,
+    shape,
+    sc,
+    /,
+    *,
+    land = False,
+):
+    # NOTE: This function loads a GLOBE tile from the ZIP file and returns the
+    #       mean elevation of every "sc" x "sc" block of pixels in it (having
+    #       risen everywhere up to sea level). Each call opens its own handle
+    #       to the ZIP file so that the tiles can be loaded by a pool of
+    #       threads; both the decompression and the reduction release the GIL.
+    # NOTE: If "land" is True then the fraction of the pixels in every block
+    #       which are land (rather than the "no data" value that GLOBE uses for
+    #       the sea) is returned as well.
+
+    # Import standard modules ...
+    import zipfile
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Check inputs ...
+    nrows, ncols = shape                                                        # [px], [px]
+    if nrows % sc != 0 or ncols % sc != 0:
+        raise Exception(f"the shape of \"{member}\" must be an integer multiple of \"sc\"") from None
+
+    # Load tile ...
+    with zipfile.ZipFile(zfile, mode = "r") as fObj:
+        tile = numpy.frombuffer(
+            fObj.read(member),
+            dtype = numpy.int16
+        ).reshape(nrows, ncols)                                                 # [m]
+
+    # Find the fraction of every block which is land (if needed) ...
+    if land:
+        frac = (tile != -500).reshape(nrows // sc, sc, ncols // sc, sc).sum(axis = (1, 3), dtype = numpy.int64) / float(sc * sc)
+
+    # Rise everywhere up to sea level ...
+    tile = numpy.maximum(tile, 0)                                               # [m]
+
+    # Reduce the tile ...
+    ans = tile.reshape(nrows // sc, sc, ncols // sc, sc).sum(axis = (1, 3), dtype = numpy.int64) / float(sc * sc) # [m]
+
+    # Return answer ...
+    if land:
+        return ans, frac
+    return ans
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+
+# Define a cache of the figures and axes which have already been created (and
+# have had their coastlines and gridlines drawn) by this process ...
+# NOTE: The keys are the colours of the coastlines and the gridlines.
+BASES = {}
+
+# Define function ...
+def renderFigure(
+    pfile,
+    /,
+    *,
+                   bfile = None,
+    coastlines_edgecolor = "white",
+                    cmap = "turbo",
+                   debug = False,
+                  extent = None,
+     gridlines_linecolor = "white",
+                   label = "",
+                    name = None,
+                   shape = None,
+                    vmax = 24.0,
+                    vmin = 0.0,
+):
+    # NOTE: This function is designed to be called many times by the same
+    #       process (possibly in a pool of processes). The base map is only
+    #       created once per process (per colour of coastlines and gridlines)
+    #       and then only the background image and the colour bar are replaced
+    #       for each figure.
+    # NOTE: If the colour of the coastlines (or gridlines) is None then the
+    #       default of "pyguymer3.geo.add_axis()" is used.
+    # NOTE: If "bfile" is None then the background image called "name" (as
+    #       registered in "images.json") is drawn, otherwise the BIN file is
+    #       loaded (using "shape") and drawn directly (using "extent", which
+    #       defaults to the whole world, and "cmap", "vmin" and "vmax").
+
+    # Import standard modules ...
+    import os
+    import pathlib
+
+    # Import special modules ...
+    try:
+        import cartopy
+        cartopy.config.update(
+            {
+                "cache_dir" : pathlib.PosixPath("~/.local/share/cartopy").expanduser(),
+            }
+        )
+        import cartopy.crs
+    except:
+        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+    try:
+        import matplotlib
+        matplotlib.rcParams.update(
+            {
+                       "axes.xmargin" : 0.01,
+                       "axes.ymargin" : 0.01,
+                            "backend" : "Agg",                                  # NOTE: See https://matplotlib.org/stable/gallery/user_interfaces/canvasagg.html
+                         "figure.dpi" : 300,
+                     "figure.figsize" : (9.6, 7.2),                             # NOTE: See https://github.com/Guymer/misc/blob/main/README.md#matplotlib-figure-sizes
+                          "font.size" : 8,
+                "image.interpolation" : "none",                                 # NOTE: See https://matplotlib.org/stable/gallery/images_contours_and_fields/interpolation_methods.html
+                     "image.resample" : False,
+            }
+        )
+        import matplotlib.pyplot
+    except:
+        raise Exception("\"matplotlib\" is not installed; run \"pip install --user matplotlib\"") from None
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # Import sub-functions ...
+    from .loadMap import loadMap
+
+    # **************************************************************************
+
+    # Configure Cartopy ...
+    if bfile is None and "CARTOPY_USER_BACKGROUNDS" not in os.environ:
+        os.environ["CARTOPY_USER_BACKGROUNDS"] = os.getcwd()
+
+    # Check if the base map has not been created by this process yet ...
+    key = (coastlines_edgecolor, gridlines_linecolor)
+    if key not in BASES:
+        if debug:
+            print(f"DEBUG: Creating base map for {repr(key)} in process {os.getpid():d} ...")
+
+        # Create figure ...
+        fg = matplotlib.pyplot.figure()
+
+        # Create axis ...
+        kwargs = {}
+        if coastlines_edgecolor is not None:
+            kwargs["coastlines_edgecolor"] = coastlines_edgecolor
+        if gridlines_linecolor is not None:
+            kwargs["gridlines_linecolor"] = gridlines_linecolor
+        ax = pyguymer3.geo.add_axis(fg, **kwargs)
+
+        # Add base map to the cache ...
+        BASES[key] = (fg, ax)
+
+    # Create short-hands ...
+    fg, ax = BASES[key]
+
+    # **************************************************************************
+
+    # Check if a BIN file was not provided ...
+    if bfile is None:
+        # Configure axis ...
+        pyguymer3.geo.add_map_background(
+            ax,
+               name = name,
+            subName = name,
+        )
+
+        # Add (fake) foreground images ...
+        im = ax.imshow(numpy.array([[vmin, vmax]]), cmap = cmap)
+        im.set_visible(False)
+    else:
+        # Set default extent ...
+        if extent is None:
+            extent = [-180.0, +180.0, -90.0, +90.0]                             # [°]
+
+        # Load map ...
+        arr = loadMap(bfile, shape)
+
+        # Add foreground image ...
+        im = ax.imshow(
+            arr,
+                 cmap = cmap,
+               extent = extent,
+               origin = "upper",
+            transform = cartopy.crs.PlateCarree(),
+                 vmax = vmax,
+                 vmin = vmin,
+        )
+
+    # Add colour bar ...
+    cb = fg.colorbar(im, ax = ax, orientation = "horizontal")
+
+    # Configure colour bar ...
+    cb.set_label(label)
+
+    # Configure figure ...
+    fg.tight_layout()
+
+    # Save figure ...
+    fg.savefig(pfile)
+
+    # **************************************************************************
+
+    # Remove the colour bar and the images so that the base map can be re-used
+    # by the next figure ...
+    cb.remove()
+    for image in list(ax.images):
+        image.remove()
+
+    # Return the PNG file name ...
+    return pfile
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def reproject(
+    arr,
+    rmap,
+    /,
+    *,
+    fill = None,
+):
+    # NOTE: "rmap" is an index map, see "calcIndexMap()". The target pixels
+    #       which are outside of the Earth are set to "fill" (which defaults to
+    #       NaN for floating-point maps and zero otherwise). Nearest neighbour
+    #       index maps keep the type of "arr" (so they can be used for maps of
+    #       labels) whereas bilinear index maps return floating-point maps
+    #       (and should not be used for maps containing sentinel values).
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Create short-hand ...
+    flat = arr.ravel()
+
+    # Gather the source pixels (weighting them, if needed) ...
+    if rmap["idx"].shape[0] == 1:
+        ans = flat[rmap["idx"][0]]
+    else:
+        ans = (rmap["wgt"] * flat[rmap["idx"]]).sum(axis = 0, dtype = numpy.float64)
+
+    # Fill the target pixels which are outside of the Earth ...
+    if fill is None:
+        fill = numpy.nan if numpy.issubdtype(ans.dtype, numpy.floating) else 0
+    ans[~rmap["valid"]] = fill
+
+    # Return answer ...
+    return ans
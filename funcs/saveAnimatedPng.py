@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def saveAnimatedPng(
+    frames,
+    pfile,
+    /,
+    *,
+      delay = 0.1,
+    nframes,
+        pal,
+):
+    # NOTE: This function writes an animated PNG, see
+    #       https://www.w3.org/TR/png-3/#apng-frame-based-animation, where each
+    #       frame is a paletted image. The frames are consumed from the iterable
+    #       "frames" (of 2D arrays of "uint8", which are all the same shape) and
+    #       are compressed and written to the file as they arrive, so only one
+    #       frame needs to be in memory at a time. The number of frames must be
+    #       known in advance, as it is written at the start of the file.
+
+    # Import standard modules ...
+    import struct
+    import zlib
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .pngChunk import pngChunk
+
+    # **************************************************************************
+
+    # Open PNG file ...
+    with open(pfile, mode = "wb") as fObj:
+        # Initialize counters ...
+        i = 0
+        seq = 0
+
+        # Loop over frames ...
+        for frame in frames:
+            # Create short-hands ...
+            ny, nx = frame.shape
+
+            # Check if this is the first frame ...
+            if i == 0:
+                # Save the header, the animation control and the palette ...
+                # NOTE: The image is 8-bit with a palette (colour type 3).
+                fObj.write(b"\x89PNG\r\n\x1a\n")
+                fObj.write(pngChunk(b"IHDR", struct.pack(">IIBBBBB", nx, ny, 8, 3, 0, 0, 0)))
+                fObj.write(pngChunk(b"acTL", struct.pack(">II", nframes, 0)))
+                fObj.write(pngChunk(b"PLTE", numpy.asarray(pal, dtype = numpy.uint8).reshape(-1, 3).tobytes()))
+                shape = (ny, nx)
+            elif (ny, nx) != shape:
+                raise Exception("all of the frames must be the same shape") from None
+
+            # Save the frame control ...
+            fObj.write(
+                pngChunk(
+                    b"fcTL",
+                    struct.pack(">IIIIIHHBB", seq, nx, ny, 0, 0, round(1000.0 * delay), 1000, 0, 0),
+                )
+            )
+            seq += 1
+
+            # Compress the frame (with each row using filter type 0) ...
+            rows = numpy.zeros((ny, nx + 1), dtype = numpy.uint8)
+            rows[:, 1:] = frame
+            data = zlib.compress(rows.tobytes(), level = 9)
+
+            # Save the frame data ...
+            if i == 0:
+                fObj.write(pngChunk(b"IDAT", data))
+            else:
+                fObj.write(pngChunk(b"fdAT", struct.pack(">I", seq) + data))
+                seq += 1
+
+            # Increment counter ...
+            i += 1
+
+        # Check that the correct number of frames were saved ...
+        if i != nframes:
+            raise Exception(f"{i:d} frames were saved but {nframes:d} were expected") from None
+
+        # Save the end ...
+        fObj.write(pngChunk(b"IEND", b""))
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def solveOffsets(
+    labs,
+    gues,
+    wgts,
+    /,
+    *,
+     nlabs = None,
+    nzones = 1,
+       res = 1.0 / 60.0,
+      step = 1.0,
+):
+    # NOTE: This function finds the time zone (or up to "nzones" time zones)
+    #       for every label which minimises the weighted mean absolute
+    #       difference between the time zone and the time zone that each point
+    #       should be in ("gues"). The candidate time zones are every "step"
+    #       hours and the points are binned every "res" hours so that the cost
+    #       of every candidate time zone can be evaluated for every label at
+    #       once using a single matrix multiplication.
+    # NOTE: When more than one time zone is allowed, each point is assumed to
+    #       use the closest time zone, so the points that share a time zone are
+    #       contiguous around the clock and the boundaries between them are
+    #       half-way between two candidate time zones. The points within each
+    #       label are "unwrapped" at each of these possible boundaries in turn
+    #       (so that labels which straddle the anti-meridian, or which cover
+    #       most of the clock, are handled) and the optimal set of time zones
+    #       for each cut is found using dynamic programming over the candidate
+    #       time zones. The best set over all of the cuts is exact (for the
+    #       binned points).
+    # NOTE: The returned time zones are between -12 hours (exclusive) and +12
+    #       hours (inclusive).
+
+    # Import standard modules ...
+    import math
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Flatten the arrays and only keep the valid points ...
+    labs = numpy.asarray(labs).ravel().astype(numpy.int64)
+    gues = numpy.asarray(gues, dtype = numpy.float64).ravel()                   # [hr]
+    wgts = numpy.broadcast_to(numpy.asarray(wgts, dtype = numpy.float64), labs.shape).ravel()
+    keep = (labs > 0) & numpy.isfinite(gues) & (wgts > 0.0)
+    labs = labs[keep]
+    gues = gues[keep]                                                           # [hr]
+    wgts = wgts[keep]
+    if nlabs is None:
+        nlabs = int(labs.max()) + 1 if labs.size > 0 else 1
+
+    # Check inputs ...
+    nb = round(24.0 / res)
+    if not math.isclose(nb * res, 24.0):
+        raise Exception("\"res\" must divide 24 hours exactly") from None
+    nc = round(24.0 / step)
+    if not math.isclose(nc * step, 24.0):
+        raise Exception("\"step\" must divide 24 hours exactly") from None
+
+    # Make a histogram of the weights of the points in each label ...
+    b = numpy.floor((gues + 12.0) / res).astype(numpy.int64) % nb
+    hist = numpy.bincount(labs * nb + b, weights = wgts, minlength = nlabs * nb).reshape(nlabs, nb)
+    tot = hist.sum(axis = 1)
+
+    # Make the matrix of the (wrapped) absolute differences between the centre
+    # of each bin and each candidate time zone ...
+    xb = -12.0 + res * (numpy.arange(nb, dtype = numpy.float64) + 0.5)          # [hr]
+    xc = -12.0 + step * (numpy.arange(nc, dtype = numpy.float64) + 1.0)         # [hr]
+    dist = numpy.abs(xc.reshape(nc, 1) - xb.reshape(1, nb))                     # [hr]
+    dist = numpy.minimum(dist, 24.0 - dist)                                     # [hr]
+
+    # Evaluate every candidate time zone for every label and find the best ...
+    cost = hist @ dist.T
+    best = cost.argmin(axis = 1)
+    offs = [[float(xc[best[lab]])] for lab in range(nlabs)]
+    mins = cost[numpy.arange(nlabs), best]
+
+    # Check if more than one time zone is allowed ...
+    if nzones > 1:
+        # Find every place that the boundary between two neighbouring time
+        # zones can be (half-way between two candidate time zones) ...
+        cuts = -12.0 + 0.5 * step * numpy.arange(2 * nc, dtype = numpy.float64) # [hr]
+
+        # Loop over labels ...
+        for lab in numpy.flatnonzero(tot > 0.0):
+            # Find the occupied bins ...
+            occ0 = numpy.flatnonzero(hist[lab, :] > 0.0)
+
+            # Initialize best answer ...
+            bestCost = numpy.inf
+            bestZones = None
+
+            # Loop over the distinct ways of cutting the clock at a possible
+            # boundary ...
+            for i0 in numpy.unique(numpy.searchsorted(xb[occ0], cuts) % occ0.size):
+                # Unwrap the occupied bins so that they start after the cut and
+                # are in ascending order ...
+                occ = numpy.roll(occ0, -int(i0))
+                x = xb[occ] + 24.0 * (occ < occ[0])                             # [hr]
+                h = hist[lab, occ]
+
+                # Find the candidate time zones which cover the points ...
+                cand = step * numpy.arange(
+                    math.floor((x[0] + 12.0) / step),
+                    math.ceil((x[-1] + 12.0) / step) + 1,
+                ) - 12.0                                                        # [hr]
+                m = cand.size
+
+                # Calculate the cumulative sums that allow the cost of any
+                # contiguous group of points to be found ...
+                s0 = numpy.concatenate([[0.0], numpy.cumsum(h)])
+                s1 = numpy.concatenate([[0.0], numpy.cumsum(h * x)])
+
+                # Find the index of the first point which is above each
+                # candidate time zone (and the mid-point between each pair of
+                # them) ...
+                ic = numpy.searchsorted(x, cand, side = "right")
+                mid = 0.5 * (cand.reshape(m, 1) + cand.reshape(1, m))           # [hr]
+                im = numpy.searchsorted(x, mid, side = "right")
+
+                # Calculate the cost of the points before the first time zone,
+                # the cost of the points after the last time zone and the cost
+                # of the points between every pair of time zones (where the
+                # points use whichever of the pair is closest) ...
+                head = cand * s0[ic] - s1[ic]
+                tail = (s1[-1] - s1[ic]) - cand * (s0[-1] - s0[ic])
+                icA = ic.reshape(m, 1)
+                icB = ic.reshape(1, m)
+                pair = (s1[im] - s1[icA]) - cand.reshape(m, 1) * (s0[im] - s0[icA])
+                pair += cand.reshape(1, m) * (s0[icB] - s0[im]) - (s1[icB] - s1[im])
+                pair[numpy.tril_indices(m)] = numpy.inf
+
+                # Find the optimal set of time zones for this cut using dynamic
+                # programming ...
+                # NOTE: "f[j]" is the lowest cost of the points below candidate
+                #       "j" given that candidate "j" is the highest time zone so
+                #       far.
+                f = head.copy()
+                prevs = []
+                for k in range(nzones):
+                    # Add another time zone above the previous highest one
+                    # (except for the first time zone) ...
+                    if k > 0:
+                        tmp = f.reshape(m, 1) + pair
+                        prev = tmp.argmin(axis = 0)
+                        f = tmp[prev, numpy.arange(m)]
+                        prevs.append(prev)
+
+                    # Skip this number of time zones if it is not an
+                    # improvement ...
+                    if (f + tail).min() >= bestCost - 1.0e-9 * tot[lab]:
+                        continue
+
+                    # Trace the set of time zones back from the highest one ...
+                    bestCost = float((f + tail).min())
+                    bestSet = [int((f + tail).argmin())]
+                    for prev in reversed(prevs):
+                        bestSet.insert(0, int(prev[bestSet[0]]))
+                    bestZones = cand[bestSet]                                   # [hr]
+
+            # Save the answer (wrapped back to between -12 hours and +12
+            # hours) ...
+            offs[lab] = sorted({float(12.0 - (12.0 - z) % 24.0) for z in bestZones})
+            mins[lab] = bestCost
+
+    # Calculate the weighted mean absolute difference ...
+    with numpy.errstate(divide = "ignore", invalid = "ignore"):
+        mabs = mins / tot                                                       # [hr]
+
+    # Return answer ...
+    return offs, mabs
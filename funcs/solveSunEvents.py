@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def solveSunEvents(
+    lon,
+    lat,
+    elev,
+    ref,
+    /,
+    *,
+     body = "Sun",
+     cost = False,
+    event = "transit",
+     warm = False,
+):
+    # NOTE: This function finds the time of the first event (either "rising",
+    #       "transit" or "setting") of the Sun (or of another "ephem" body, for
+    #       example "Moon") after the 'aware' datetime object "ref" for every
+    #       point by calling "ephem" for each one (exactly as the step 2
+    #       scripts do). The points are given as 1D arrays of longitude
+    #       [rad], latitude [rad] and elevation [m] and the returned array is in
+    #       hours after "ref". If a rising (or setting) does not occur then the
+    #       array contains either "ALWAYS_UP" or "NEVER_UP".
+    # NOTE: If "cost" is True then a dictionary describing how expensive each
+    #       point was is also returned: the time taken ("secs"), the number of
+    #       times that the position of the body was computed ("evals") and
+    #       whether "AlwaysUpError" (1) or "NeverUpError" (2) was raised
+    #       ("flags").
+    # NOTE: If "warm" is True then the search for each rising (or setting)
+    #       starts just before the time predicted from the previous two points
+    #       (which are usually its neighbours, so the times change smoothly)
+    #       rather than at "ref", which saves about one computation of the
+    #       position of the body per point. The answer is only kept if it must
+    #       be the first event after "ref" (it is after "ref" and well within a
+    #       day of it and the point is not near the poles, where the time
+    #       between consecutive events can be very different from a day),
+    #       otherwise the point is solved again from "ref". Transits are always
+    #       solved from "ref", as "ephem" makes its own first guess of the time
+    #       of a transit and so a warm start does not save anything.
+
+    # Import standard modules ...
+    import datetime
+    import time
+
+    # Import special modules ...
+    try:
+        import ephem
+    except:
+        raise Exception("\"ephem\" is not installed; run \"pip install --user ephem\"") from None
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .constants import ALWAYS_UP, NEVER_UP
+    from .horizon import horizon
+
+    # **************************************************************************
+
+    # Check inputs ...
+    if event not in ["rising", "setting", "transit"]:
+        raise ValueError(f"\"event\" is an unexpected value ({repr(event)})") from None
+
+    # Initialize arrays ...
+    ans = numpy.zeros(len(lon), dtype = numpy.float64)                          # [hr]
+    evals = numpy.zeros(len(lon), dtype = numpy.uint16)
+    flags = numpy.zeros(len(lon), dtype = numpy.uint8)
+    secs = numpy.zeros(len(lon), dtype = numpy.float64)                         # [s]
+
+    # Define a version of the body which counts how many times its position is
+    # computed (which is once per iteration of the solvers in "ephem") ...
+    class CountedBody(getattr(ephem, body)):
+        n = 0
+
+        def compute(self, *args, **kwargs):
+            CountedBody.n += 1
+            return super().compute(*args, **kwargs)
+
+    # Initialize observer and body ...
+    obs = ephem.Observer()
+    obs.date = ephem.Date(ref)
+    obj = CountedBody() if cost else getattr(ephem, body)()
+
+    # Create short-hand ...
+    solve = getattr(obs, f"next_{event}")
+
+    # Define how long before the predicted time of the event to start the
+    # search for a warm start, the largest change between the previous two
+    # points that a prediction is made from, the latest time that an answer
+    # from a warm start is kept and the highest latitude that a warm start is
+    # tried at ...
+    margin = 30.0 / 3600.0                                                      # [hr]
+    jump = 1.0                                                                  # [hr]
+    latest = 22.0                                                               # [hr]
+    maxLat = numpy.radians(60.0)                                                # [rad]
+
+    # Loop over points ...
+    for i in range(ans.size):
+        # Update the observer's position ...
+        obs.lat = lat[i]                                                        # [rad]
+        obs.long = lon[i]                                                       # [rad]
+        obs.elevation = elev[i]                                                 # [m]
+        obs.horizon = horizon(elev[i])                                          # [rad]
+
+        # Start the clock and reset the counter ...
+        start = time.perf_counter()
+        CountedBody.n = 0
+
+        # Try to find the next time that the event will happen (as an 'aware'
+        # datetime object in UTC) using a warm start (if it is wanted and if the
+        # previous two points have answers which are close together) ...
+        # NOTE: Any exception (or an answer which might not be the first event
+        #       after "ref") means that the warm start has failed and that the
+        #       point is solved again from "ref", so that the answers (and the
+        #       exceptions) are the same as without a warm start.
+        when = None
+        if warm and event != "transit" and i > 1 and abs(lat[i]) <= maxLat:
+            if min(ans[i - 2], ans[i - 1]) >= 0.0 and abs(ans[i - 1] - ans[i - 2]) <= jump:
+                try:
+                    when = solve(
+                        obj,
+                        start = ephem.Date(ref + datetime.timedelta(hours = float(2.0 * ans[i - 1] - ans[i - 2]) - margin)),
+                    ).datetime().replace(tzinfo = datetime.UTC)
+                except ephem.CircumpolarError:
+                    pass
+                if when is not None and not datetime.timedelta(0) <= when - ref < datetime.timedelta(hours = latest):
+                    when = None
+
+        # Find the next time that the event will happen (as an 'aware'
+        # datetime object in UTC), if it was not found by a warm start, and the
+        # difference from the reference time ...
+        try:
+            if when is None:
+                when = solve(obj).datetime().replace(tzinfo = datetime.UTC)
+        except ephem.AlwaysUpError:
+            ans[i] = ALWAYS_UP                                                  # [hr]
+            flags[i] = 1
+        except ephem.NeverUpError:
+            ans[i] = NEVER_UP                                                   # [hr]
+            flags[i] = 2
+        else:
+            ans[i] = (when - ref).total_seconds() / 3600.0                      # [hr]
+
+        # Stop the clock and save the counter ...
+        secs[i] = time.perf_counter() - start                                   # [s]
+        evals[i] = min(CountedBody.n, numpy.iinfo(numpy.uint16).max)
+
+    # Return answer ...
+    if cost:
+        return ans, {
+            "evals" : evals,
+            "flags" : flags,
+             "secs" : secs,
+        }
+    return ans
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def streamPng(
+    bands,
+    pfile,
+    shape,
+    pal,
+    /,
+    *,
+    level = 9,
+     size = 1048576,
+):
+    # NOTE: This function writes a paletted PNG (of shape "shape") whose rows
+    #       are consumed from the iterable "bands" (of 2D arrays of "uint8",
+    #       each containing some of the rows). Each band is filtered (see
+    #       "filterRows()") and fed into a single zlib stream as it arrives and
+    #       the compressed data is written to the file in IDAT chunks of about
+    #       "size" bytes, so the memory usage does not depend on the height of
+    #       the image.
+
+    # Import standard modules ...
+    import struct
+    import zlib
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .filterRows import filterRows
+    from .pngChunk import pngChunk
+
+    # **************************************************************************
+
+    # Create short-hands ...
+    ny, nx = shape
+    comp = zlib.compressobj(level = level)
+
+    # Open PNG file ...
+    with open(pfile, mode = "wb") as fObj:
+        # Save the header and the palette ...
+        # NOTE: The image is 8-bit with a palette (colour type 3).
+        fObj.write(b"\x89PNG\r\n\x1a\n")
+        fObj.write(pngChunk(b"IHDR", struct.pack(">IIBBBBB", nx, ny, 8, 3, 0, 0, 0)))
+        fObj.write(pngChunk(b"PLTE", numpy.asarray(pal, dtype = numpy.uint8).reshape(-1, 3).tobytes()))
+
+        # Initialize the row before the first band, the counter and the buffer
+        # of compressed data ...
+        prev = numpy.zeros(nx, dtype = numpy.uint8)
+        n = 0
+        buf = b""
+
+        # Loop over bands ...
+        for band in bands:
+            # Check the band ...
+            if band.ndim != 2 or band.shape[1] != nx:
+                raise Exception(f"the bands must be 2D with {nx:d} columns") from None
+
+            # Filter the band and compress it ...
+            buf += comp.compress(filterRows(band, prev).tobytes())
+            prev = band[-1, :]
+            n += band.shape[0]
+
+            # Save the compressed data (if there is enough of it) ...
+            if len(buf) >= size:
+                fObj.write(pngChunk(b"IDAT", buf))
+                buf = b""
+
+        # Check that the correct number of rows were saved ...
+        if n != ny:
+            raise Exception(f"{n:d} rows were saved but {ny:d} were expected") from None
+
+        # Save the rest of the compressed data and the end ...
+        fObj.write(pngChunk(b"IDAT", buf + comp.flush()))
+        fObj.write(pngChunk(b"IEND", b""))
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def summariseCost(
+    secs,
+    lon,
+    lat,
+    /,
+    *,
+    size = 10.0,
+     top = 10,
+):
+    # NOTE: This function sums the map of the time taken to solve each pixel
+    #       "secs" over blocks of "size" x "size" degrees and returns the "top"
+    #       most expensive blocks (as a list of dictionaries, most expensive
+    #       first).
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Find which block each pixel is in ...
+    nx = round(360.0 / size)
+    ny = round(180.0 / size)
+    bx = numpy.floor((numpy.degrees(lon) + 180.0) / size).astype(numpy.int64).clip(0, nx - 1)
+    by = numpy.floor((90.0 - numpy.degrees(lat)) / size).astype(numpy.int64).clip(0, ny - 1)
+    blks = (by.reshape(-1, 1) * nx + bx.reshape(1, -1)).ravel()
+
+    # Sum the time taken (and count the pixels) in each block ...
+    tot = numpy.bincount(blks, weights = secs.ravel(), minlength = nx * ny)     # [s]
+    cnt = numpy.bincount(blks, minlength = nx * ny)
+
+    # Loop over the most expensive blocks ...
+    ans = []
+    for blk in numpy.argsort(tot)[::-1][:top]:
+        # Skip this block if it is empty ...
+        if cnt[blk] == 0:
+            continue
+
+        # Append block to the list ...
+        ans.append(
+            {
+                "count" : int(cnt[blk]),
+                 "east" : -180.0 + size * float(blk % nx + 1),
+                "north" : 90.0 - size * float(blk // nx),
+                "share" : float(tot[blk] / tot.sum()),
+                "south" : 90.0 - size * float(blk // nx + 1),
+                 "secs" : float(tot[blk]),
+                 "west" : -180.0 + size * float(blk % nx),
+            }
+        )
+
+    # Return answer ...
+    return ans
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def vectorise(
+    labs,
+    lon,
+    lat,
+    /,
+    *,
+    tolerance = 0.0,
+):
+    # NOTE: This function is the opposite of "rasterise()": it traces the
+    #       boundaries of the regions of a label map (where each pixel is the
+    #       label of the region that it is in) and returns a dictionary of the
+    #       (multi-)polygon of every label, in degrees. The axes are the centres
+    #       of the pixels and the map is assumed to cover the whole globe, so
+    #       the polygons are split at the antimeridian (as required by GeoJSON)
+    #       rather than crossing it.
+    # NOTE: The edges of the pixels which are on the boundary of a region are
+    #       found all at once and then joined end-to-end into rings by following
+    #       them around the region, which takes a time proportional to the
+    #       number of edges. The rings are split into arcs at the points where
+    #       three (or more) regions meet, so that each arc is shared by two
+    #       regions, and if "tolerance" is positive then each arc is simplified
+    #       (using the Douglas-Peucker algorithm, with "tolerance" in degrees)
+    #       once and used by both regions, so that neighbouring polygons still
+    #       share their boundaries without any gaps or overlaps.
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+    try:
+        import shapely
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # **************************************************************************
+
+    # Replace the labels with their ranks (so that they are small, positive and
+    # contiguous) ...
+    vals, rank = numpy.unique(labs, return_inverse = True)
+    rank = rank.reshape(labs.shape).astype(numpy.int64)
+    ny, nx = rank.shape
+    nv = (ny + 1) * (nx + 1)
+
+    # Find the coordinates of the corners of the pixels ...
+    # NOTE: The vertices are numbered row by row, so vertex "i * (nx + 1) + j"
+    #       is at the top-left corner of pixel "(i, j)" (when the latitude axis
+    #       is descending, as it is in the rest of the project).
+    dlon = (numpy.degrees(lon[-1]) - numpy.degrees(lon[0])) / (nx - 1)          # [°]
+    dlat = (numpy.degrees(lat[-1]) - numpy.degrees(lat[0])) / (ny - 1)          # [°]
+    lonEdge = numpy.degrees(lon[0]) + dlon * (numpy.arange(nx + 1) - 0.5)       # [°]
+    latEdge = numpy.degrees(lat[0]) + dlat * (numpy.arange(ny + 1) - 0.5)       # [°]
+
+    # **************************************************************************
+
+    # Find where neighbouring pixels are in different regions ...
+    diffY = numpy.ones((ny + 1, nx), dtype = bool)
+    diffY[1:-1, :] = rank[:-1, :] != rank[1:, :]
+    diffX = numpy.ones((ny, nx + 1), dtype = bool)
+    diffX[:, 1:-1] = rank[:, :-1] != rank[:, 1:]
+
+    # Make the edges of every pixel which are on the boundary of its region, in
+    # the order of its ring (where "j" increases to the right and "i" increases
+    # downwards, so that the region is always on the right of the edge) ...
+    # NOTE: Each edge is described by the rank of the label of its region, the
+    #       vertices that it starts and ends at, and its direction (0 = right,
+    #       1 = down, 2 = left, 3 = up).
+    iy, ix = numpy.indices((ny, nx))
+    v = iy * (nx + 1) + ix
+    parts = []
+    for mask, start, end, code in [
+        (diffY[:-1, :], v, v + 1, 0),                                           # top
+        (diffX[:, 1:], v + 1, v + nx + 2, 1),                                   # right
+        (diffY[1:, :], v + nx + 2, v + nx + 1, 2),                              # bottom
+        (diffX[:, :-1], v + nx + 1, v, 3),                                      # left
+    ]:
+        parts.append(
+            (
+                rank[mask],
+                start[mask],
+                end[mask],
+                numpy.full(mask.sum(), code, dtype = numpy.int64),
+            )
+        )
+    eRank, eStart, eEnd, eDir = [numpy.concatenate(part) for part in zip(*parts, strict = True)]
+    nedge = eRank.size
+
+    # Find the next edge of every edge (which is the edge of the same region
+    # which starts where it ends) ...
+    # NOTE: Where a region touches itself diagonally there are two possible
+    #       next edges, in which case the one which turns right (keeping the
+    #       same pixel on the right) is chosen, so that regions which only touch
+    #       diagonally are separate rings.
+    keys = eRank * nv + eStart
+    order = numpy.argsort(keys, kind = "stable")
+    keys = keys[order]
+    target = eRank * nv + eEnd
+    pos = numpy.searchsorted(keys, target)
+    nxt = order[pos]
+    two = numpy.zeros(nedge, dtype = bool)
+    two[pos < nedge - 1] = keys[numpy.minimum(pos + 1, nedge - 1)][pos < nedge - 1] == target[pos < nedge - 1]
+    alt = order[numpy.minimum(pos + 1, nedge - 1)]
+    swap = two & (eDir[nxt] != (eDir + 1) % 4)
+    nxt[swap] = alt[swap]
+
+    # Find the vertices where three (or more) regions meet (including the
+    # outside of the map) or where two regions touch diagonally ...
+    pad = numpy.full((ny + 2, nx + 2), vals.size, dtype = numpy.int64)
+    pad[1:-1, 1:-1] = rank
+    a = pad[:-1, :-1]
+    b = pad[:-1, 1:]
+    c = pad[1:, :-1]
+    d = pad[1:, 1:]
+    count = 1 + (a != b) + ((c != a) & (c != b)) + ((d != a) & (d != b) & (d != c))
+    node = ((count >= 3) | ((a == d) & (b == c) & (a != b))).ravel()
+
+    # **************************************************************************
+
+    # Define a function to convert a list of vertices to coordinates and to
+    # simplify it (keeping both ends) ...
+    def simplify(verts, /):
+        xy = numpy.stack(
+            [
+                lonEdge[verts % (nx + 1)],
+                latEdge[verts // (nx + 1)],
+            ],
+            axis = 1,
+        )                                                                       # [°]
+        if tolerance > 0.0 and verts.size > 2:
+            xy = shapely.get_coordinates(
+                shapely.simplify(
+                    shapely.LineString(xy),
+                    tolerance,
+                    preserve_topology = False,
+                )
+            )                                                                   # [°]
+        return xy
+
+    # Define a function to follow the edges around every ring ...
+    # NOTE: A ring which goes through the same vertex twice (which can happen
+    #       where a region touches itself diagonally) is split into two rings
+    #       there, so that every ring is simple.
+    def traceRings():
+        # Create short-hands ...
+        nxtList = nxt.tolist()
+        startList = eStart.tolist()
+        seen = bytearray(nedge)
+
+        # Loop over edges ...
+        for e0 in range(nedge):
+            # Skip this edge if it is already part of a ring ...
+            if seen[e0]:
+                continue
+
+            # Follow the edges around the ring (splitting off a ring each
+            # time that a vertex is visited again) ...
+            path = []
+            where = {}
+            e = e0
+            while not seen[e]:
+                seen[e] = 1
+                v = startList[e]
+                if v in where:
+                    i = where[v]
+                    for e2 in path[i:]:
+                        del where[startList[e2]]
+                    yield numpy.array(path[i:], dtype = numpy.int64)
+                    del path[i:]
+                where[v] = len(path)
+                path.append(e)
+                e = nxtList[e]
+            yield numpy.array(path, dtype = numpy.int64)
+
+    # Initialize cache of simplified arcs and lists of rings ...
+    arcs = {}
+    shells = {}
+    holes = {}
+
+    # Loop over rings ...
+    for ring in traceRings():
+        # Find the vertices of the ring, only keeping the corners and the nodes
+        # ...
+        verts = eStart[ring]
+        dirs = eDir[ring]
+        keep = node[verts]
+        keep[0] |= dirs[0] != dirs[-1]
+        keep[1:] |= dirs[1:] != dirs[:-1]
+        verts = verts[keep]
+
+        # Find the signed area of the ring (which is positive for the outsides
+        # of regions and negative for holes in them) ...
+        x = verts % (nx + 1)
+        y = verts // (nx + 1)
+        area = 0.5 * float(numpy.dot(x[:-1], y[1:]) - numpy.dot(x[1:], y[:-1]) + x[-1] * y[0] - x[0] * y[-1])
+
+        # Split the ring into arcs which start and end at nodes (or treat the
+        # whole ring as one arc, starting from its smallest vertex, if it
+        # does not have any nodes) ...
+        inodes = numpy.flatnonzero(node[verts])
+        if inodes.size == 0:
+            inodes = numpy.array([verts.argmin()])
+        verts = numpy.roll(verts, -inodes[0])
+        inodes -= inodes[0]
+        bounds = inodes.tolist() + [verts.size]
+
+        # Loop over arcs ...
+        xys = []
+        for i0, i1 in zip(bounds[:-1], bounds[1:], strict = True):
+            # Make the arc (including the node at the end) ...
+            arc = numpy.append(verts[i0:i1], verts[i1 % verts.size])
+
+            # Find the arc in the same direction that the other region uses
+            # (so that both regions get the same simplified arc) ...
+            flip = (arc[0], arc[1]) > (arc[-1], arc[-2])
+            if flip:
+                arc = arc[::-1]
+
+            # Simplify the arc (if it has not been simplified already) ...
+            key = (int(arc[0]), int(arc[1]), int(arc[-1]))
+            if key not in arcs:
+                arcs[key] = simplify(arc)
+            xy = arcs[key][::-1] if flip else arcs[key]                         # [°]
+            xys.append(xy[:-1])
+
+        # Skip this ring if it has collapsed ...
+        xy = numpy.concatenate(xys)                                             # [°]
+        if len(xy) < 3:
+            continue
+
+        # Append the ring to the correct list ...
+        # NOTE: The holes are found by a point which is just inside them (to
+        #       the left of their first edge).
+        if area > 0.0:
+            shells.setdefault(int(eRank[ring[0]]), []).append((xy, shapely.Polygon(numpy.stack([x, y], axis = 1))))
+        else:
+            x0, y0 = divmod(int(eStart[ring[0]]), nx + 1)[::-1]
+            dx, dy = [(1, 0), (0, 1), (-1, 0), (0, -1)][eDir[ring[0]]]
+            pnt = (x0 + 0.5 * dx + 0.25 * dy, y0 + 0.5 * dy - 0.25 * dx)
+            holes.setdefault(int(eRank[ring[0]]), []).append((xy, shapely.Point(pnt)))
+
+    # **************************************************************************
+
+    # Initialize dictionary ...
+    ans = {}
+
+    # Loop over labels ...
+    for r, rings in shells.items():
+        # Find the (smallest) outside which contains each hole ...
+        inner = [[] for _ in rings]
+        if r in holes:
+            tree = shapely.STRtree([raw for _, raw in rings])
+            for xy, pnt in holes[r]:
+                cands = tree.query(pnt, predicate = "within")
+                if cands.size > 0:
+                    inner[min(cands, key = lambda i: rings[i][1].area)].append(xy)
+
+        # Make the polygons (fixing any which have become invalid when they were
+        # simplified) ...
+        polys = [shapely.Polygon(xy, inner[i]) for i, (xy, _) in enumerate(rings)]
+        geom = shapely.MultiPolygon(polys) if len(polys) > 1 else polys[0]
+        if not geom.is_valid:
+            geom = shapely.make_valid(geom)
+
+        # Add the (multi-)polygon to the dictionary ...
+        ans[vals[r].item()] = geom
+
+    # Return answer ...
+    return ans
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def zonalStats(
+    labs,
+    vals,
+    wgts,
+    /,
+    *,
+     nlabs = None,
+    period = None,
+):
+    # NOTE: The returned dictionary contains arrays which are indexed by label.
+    #       Label zero (and any pixel which does not have a finite value) is
+    #       ignored. All of the statistics are calculated in a single pass:
+    #       the counts and sums are calculated using "numpy.bincount()" and the
+    #       order statistics are read out of a single sort of the labels and
+    #       values.
+    # NOTE: If "period" is given then the values are periodic (for example,
+    #       hours which wrap around at ±12 hours have a period of 24 hours), so
+    #       the means are circular means (found from the sums of the sines and
+    #       cosines of the values) and the order statistics are found after
+    #       unwrapping the values of each label around their circular mean. All
+    #       of the statistics are then wrapped back into the range of "period"
+    #       centred on zero, so the minimum of a label which straddles the wrap
+    #       is greater than its maximum.
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Flatten the arrays and only keep the valid pixels ...
+    # NOTE: The weights are broadcast so that, for example, a column of
+    #       cos(latitude) can be passed in for a map.
+    labs = numpy.asarray(labs)
+    if wgts is None:
+        wgts = numpy.ones(labs.shape, dtype = numpy.float64)
+    wgts = numpy.broadcast_to(wgts, labs.shape).ravel()
+    labs = labs.ravel()
+    vals = numpy.asarray(vals, dtype = numpy.float64).ravel()
+    keep = (labs > 0) & numpy.isfinite(vals)
+    labs = labs[keep].astype(numpy.int64)
+    vals = vals[keep]
+    wgts = wgts[keep].astype(numpy.float64)
+    if nlabs is None:
+        nlabs = int(labs.max()) + 1 if labs.size > 0 else 1
+
+    # Unwrap the values of each label around their circular mean (if they are
+    # periodic) ...
+    if period is not None:
+        ang = 2.0 * numpy.pi * vals / period
+        csum = numpy.bincount(labs, weights = numpy.cos(ang), minlength = nlabs)
+        ssum = numpy.bincount(labs, weights = numpy.sin(ang), minlength = nlabs)
+        wcsum = numpy.bincount(labs, weights = wgts * numpy.cos(ang), minlength = nlabs)
+        wssum = numpy.bincount(labs, weights = wgts * numpy.sin(ang), minlength = nlabs)
+        centre = period * numpy.arctan2(ssum, csum) / (2.0 * numpy.pi)
+        vals = centre[labs] + (vals - centre[labs] + 0.5 * period) % period - 0.5 * period
+
+    # Calculate the counts and sums ...
+    cnt = numpy.bincount(labs, minlength = nlabs)
+    tot = numpy.bincount(labs, weights = vals, minlength = nlabs)
+    area = numpy.bincount(labs, weights = wgts, minlength = nlabs)
+    wtot = numpy.bincount(labs, weights = wgts * vals, minlength = nlabs)
+
+    # Sort the values within each label and find where each label starts and
+    # stops ...
+    order = numpy.lexsort((vals, labs))
+    svals = vals[order]
+    start = numpy.searchsorted(labs[order], numpy.arange(nlabs), side = "left")
+    stop = start + cnt
+    good = cnt > 0
+
+    # Calculate the order statistics ...
+    vmin = numpy.full(nlabs, numpy.nan, dtype = numpy.float64)
+    vmax = numpy.full(nlabs, numpy.nan, dtype = numpy.float64)
+    vmed = numpy.full(nlabs, numpy.nan, dtype = numpy.float64)
+    vmin[good] = svals[start[good]]
+    vmax[good] = svals[stop[good] - 1]
+    vmed[good] = 0.5 * (svals[start[good] + (cnt[good] - 1) // 2] + svals[start[good] + cnt[good] // 2])
+
+    # Calculate the means ...
+    with numpy.errstate(divide = "ignore", invalid = "ignore"):
+        mean = tot / cnt
+        wmean = wtot / area
+
+    # Replace the means with the circular means and wrap all of the statistics
+    # back into the range of the period (if the values are periodic) ...
+    if period is not None:
+        mean[good] = centre[good]
+        wmean[good] = period * numpy.arctan2(wssum, wcsum)[good] / (2.0 * numpy.pi)
+        for arr in [mean, wmean, vmed, vmin, vmax]:
+            arr[good] = (arr[good] + 0.5 * period) % period - 0.5 * period
+
+    # Return answer ...
+    return {
+          "area" : area,
+         "count" : cnt,
+           "max" : vmax,
+          "mean" : mean,
+        "median" : vmed,
+           "min" : vmin,
+         "wmean" : wmean,
+    }
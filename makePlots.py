@@ -1,313 +1,247 @@
 #!/usr/bin/env python3
 
+# Define function ...
+def makeParser():
+    # Import standard modules ...
+    import argparse
+    import os
+
+    # **************************************************************************
+
+    # Create argument parser ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Make the figures.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+    parser.add_argument(
+        "--direct",
+        action = "store_true",
+          help = "draw the BIN files directly (rather than the PNG files registered in \"images.json\" as Cartopy background images)",
+    )
+    parser.add_argument(
+        "--raster",
+        default = None,
+           dest = "raster",
+           help = "draw this BIN file (which is on the same grid as \"lon.bin\" and \"lat.bin\", unless \"--raster-shape\" is given) directly, instead of the usual figures",
+           type = str,
+    )
+    parser.add_argument(
+        "--raster-cmap",
+        default = "turbo",
+           dest = "rasterCmap",
+           help = "the colour map to use for \"--raster\"",
+           type = str,
+    )
+    parser.add_argument(
+        "--raster-extent",
+        default = [-180.0, +180.0, -90.0, +90.0],
+           dest = "rasterExtent",
+           help = "the extent (west, east, south, north) of \"--raster\" [°]",
+          nargs = 4,
+           type = float,
+    )
+    parser.add_argument(
+        "--raster-label",
+        default = "",
+           dest = "rasterLabel",
+           help = "the label of the colour bar for \"--raster\"",
+           type = str,
+    )
+    parser.add_argument(
+        "--raster-png",
+        default = None,
+           dest = "rasterPng",
+           help = "the PNG file to save \"--raster\" to (if not given then it is the BIN file name with \"Map.png\" instead of \".bin\")",
+           type = str,
+    )
+    parser.add_argument(
+        "--raster-shape",
+        default = None,
+           dest = "rasterShape",
+           help = "the shape (number of rows, number of columns) of \"--raster\"",
+          nargs = 2,
+           type = int,
+    )
+    parser.add_argument(
+        "--raster-vmax",
+        default = 24.0,
+           dest = "rasterVmax",
+           help = "the maximum value of the colour map for \"--raster\"",
+           type = float,
+    )
+    parser.add_argument(
+        "--raster-vmin",
+        default = 0.0,
+           dest = "rasterVmin",
+           help = "the minimum value of the colour map for \"--raster\"",
+           type = float,
+    )
+    parser.add_argument(
+        "--jobs",
+        default = os.cpu_count() or 1,
+           dest = "jobs",
+           help = "the number of figures to render at the same time (each in its own process, which re-uses the base maps that it has already created)",
+           type = int,
+    )
+
+    # Return answer ...
+    return parser
+
 # Use the proper idiom in the main module ...
 # NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
 if __name__ == "__main__":
     # Import standard modules ...
+    import concurrent.futures
     import os
-    import pathlib
 
-    # Import special modules ...
-    try:
-        import cartopy
-        cartopy.config.update(
-            {
-                "cache_dir" : pathlib.PosixPath("~/.local/share/cartopy").expanduser(),
-            }
-        )
-    except:
-        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
-    try:
-        import matplotlib
-        matplotlib.rcParams.update(
-            {
-                       "axes.xmargin" : 0.01,
-                       "axes.ymargin" : 0.01,
-                            "backend" : "Agg",                                  # NOTE: See https://matplotlib.org/stable/gallery/user_interfaces/canvasagg.html
-                         "figure.dpi" : 300,
-                     "figure.figsize" : (9.6, 7.2),                             # NOTE: See https://github.com/Guymer/misc/blob/main/README.md#matplotlib-figure-sizes
-                          "font.size" : 8,
-                "image.interpolation" : "none",                                 # NOTE: See https://matplotlib.org/stable/gallery/images_contours_and_fields/interpolation_methods.html
-                     "image.resample" : False,
-            }
-        )
-        import matplotlib.pyplot
-    except:
-        raise Exception("\"matplotlib\" is not installed; run \"pip install --user matplotlib\"") from None
-    try:
-        import numpy
-    except:
-        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+    # Create argument parser and parse the arguments ...
+    # NOTE: This is done before any special modules are imported, so that
+    #       "--help" is quick and works without them.
+    parser = makeParser()
+    args = parser.parse_args()
 
     # Import my modules ...
     try:
         import pyguymer3
-        import pyguymer3.geo
         import pyguymer3.image
     except:
         raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
 
-    # **************************************************************************
-
-    # Configure Cartopy ...
-    os.environ["CARTOPY_USER_BACKGROUNDS"] = os.getcwd()
-
-    # **************************************************************************
-
-    # Define PNG file name and check if it exists already ...
-    pfile = "step1a.png"
-    if not os.path.exists(pfile):
-        print(f"Making \"{pfile}\" ...")
-
-        # Create figure ...
-        fg = matplotlib.pyplot.figure()
-
-        # Create axis ...
-        ax = pyguymer3.geo.add_axis(
-            fg,
-            coastlines_edgecolor = "white",
-             gridlines_linecolor = "white",
-        )
-
-        # Configure axis ...
-        pyguymer3.geo.add_map_background(
-            ax,
-               name = "step1a",
-            subName = "step1a",
-        )
-
-        # Add (fake) foreground images ...
-        im = ax.imshow(numpy.array([[0.0, 6000.0]]), cmap = "turbo")
-        im.set_visible(False)
-
-        # Add colour bar ...
-        cb = fg.colorbar(im, ax = ax, orientation = "horizontal")
-
-        # Configure colour bar ...
-        cb.set_label("Elevation [m]")
-
-        # Configure figure ...
-        fg.tight_layout()
-
-        # Save figure ...
-        fg.savefig(pfile)
-        matplotlib.pyplot.close(fg)
-
-        # Optimize PNG ...
-        pyguymer3.image.optimise_image(pfile, strip = True)
+    # Import local modules ...
+    import funcs
 
     # **************************************************************************
 
-    # Define PNG file name and check if it exists already ...
-    pfile = "step2a.png"
-    if not os.path.exists(pfile):
-        print(f"Making \"{pfile}\" ...")
-
-        # Create figure ...
-        fg = matplotlib.pyplot.figure()
-
-        # Create axis ...
-        ax = pyguymer3.geo.add_axis(
-            fg,
-            coastlines_edgecolor = "white",
-             gridlines_linecolor = "white",
-        )
-
-        # Configure axis ...
-        pyguymer3.geo.add_map_background(
-            ax,
-               name = "step2a",
-            subName = "step2a",
-        )
-
-        # Add (fake) foreground images ...
-        im = ax.imshow(numpy.array([[0.0, 24.0]]), cmap = "turbo")
-        im.set_visible(False)
-
-        # Add colour bar ...
-        cb = fg.colorbar(im, ax = ax, orientation = "horizontal")
-
-        # Configure colour bar ...
-        cb.set_label("Time Until Sunrise After 12:00 UTC [hr]")
-
-        # Configure figure ...
-        fg.tight_layout()
-
-        # Save figure ...
-        fg.savefig(pfile)
-        matplotlib.pyplot.close(fg)
-
-        # Optimize PNG ...
-        pyguymer3.image.optimise_image(pfile, strip = True)
+    # Define the figures ...
+    figs = {
+        "step1a.png" : {
+            "bfile" : "elev.bin",
+            "label" : "Elevation [m]",
+             "name" : "step1a",
+             "vmax" : 6000.0,
+        },
+        "step2a.png" : {
+            "bfile" : "sunriseDiff.bin",
+            "label" : "Time Until Sunrise After 12:00 UTC [hr]",
+             "name" : "step2a",
+        },
+        "step2b.png" : {
+            "bfile" : "noonDiff.bin",
+            "label" : "Time Until Noon After 12:00 UTC [hr]",
+             "name" : "step2b",
+        },
+        "step2c.png" : {
+            "bfile" : "sunsetDiff.bin",
+            "label" : "Time Until Sunset After 12:00 UTC [hr]",
+             "name" : "step2c",
+        },
+        "step3a.png" : {
+            "bfile" : "timeZone.bin",
+            "label" : "Time Zone Difference From UTC [hr]",
+             "name" : "step3a",
+        },
+        "step4a.png" : {
+                           "bfile" : "timeZoneDiff.bin",
+            "coastlines_edgecolor" : None,
+                            "cmap" : "coolwarm",
+             "gridlines_linecolor" : None,
+                           "label" : "Difference Between Noon & Time Zone [hr]",
+                            "name" : "step4a",
+                            "vmax" : 3.0,
+                            "vmin" : -3.0,
+        },
+    }
+
+    # Check if an ad-hoc BIN file was provided ...
+    if args.raster is not None:
+        # Set default PNG file name ...
+        if args.rasterPng is None:
+            args.rasterPng = f"{os.path.splitext(args.raster)[0]}Map.png"
+
+        # Only draw the ad-hoc BIN file ...
+        args.direct = True
+        figs = {
+            args.rasterPng : {
+                 "bfile" : args.raster,
+                  "cmap" : args.rasterCmap,
+                "extent" : args.rasterExtent,
+                 "label" : args.rasterLabel,
+                 "shape" : args.rasterShape,
+                  "vmax" : args.rasterVmax,
+                  "vmin" : args.rasterVmin,
+            },
+        }
+
+    # Check if the BIN files are going to be drawn directly ...
+    if args.direct:
+        # Loop over figures ...
+        for kwargs in figs.values():
+            # Set default shape using the axes ...
+            if kwargs.get("shape") is None:
+                kwargs["shape"] = (
+                    os.path.getsize("lat.bin") // 8,
+                    os.path.getsize("lon.bin") // 8,
+                )
+    else:
+        # Loop over figures ...
+        for kwargs in figs.values():
+            # Remove the BIN file so that the registered PNG file is drawn ...
+            del kwargs["bfile"]
 
     # **************************************************************************
 
-    # Define PNG file name and check if it exists already ...
-    pfile = "step2b.png"
-    if not os.path.exists(pfile):
-        print(f"Making \"{pfile}\" ...")
-
-        # Create figure ...
-        fg = matplotlib.pyplot.figure()
-
-        # Create axis ...
-        ax = pyguymer3.geo.add_axis(
-            fg,
-            coastlines_edgecolor = "white",
-             gridlines_linecolor = "white",
-        )
-
-        # Configure axis ...
-        pyguymer3.geo.add_map_background(
-            ax,
-               name = "step2b",
-            subName = "step2b",
-        )
-
-        # Add (fake) foreground images ...
-        im = ax.imshow(numpy.array([[0.0, 24.0]]), cmap = "turbo")
-        im.set_visible(False)
-
-        # Add colour bar ...
-        cb = fg.colorbar(im, ax = ax, orientation = "horizontal")
-
-        # Configure colour bar ...
-        cb.set_label("Time Until Noon After 12:00 UTC [hr]")
-
-        # Configure figure ...
-        fg.tight_layout()
-
-        # Save figure ...
-        fg.savefig(pfile)
-        matplotlib.pyplot.close(fg)
-
-        # Optimize PNG ...
-        pyguymer3.image.optimise_image(pfile, strip = True)
-
-    # **************************************************************************
-
-    # Define PNG file name and check if it exists already ...
-    pfile = "step2c.png"
-    if not os.path.exists(pfile):
-        print(f"Making \"{pfile}\" ...")
-
-        # Create figure ...
-        fg = matplotlib.pyplot.figure()
-
-        # Create axis ...
-        ax = pyguymer3.geo.add_axis(
-            fg,
-            coastlines_edgecolor = "white",
-             gridlines_linecolor = "white",
-        )
-
-        # Configure axis ...
-        pyguymer3.geo.add_map_background(
-            ax,
-               name = "step2c",
-            subName = "step2c",
-        )
-
-        # Add (fake) foreground images ...
-        im = ax.imshow(numpy.array([[0.0, 24.0]]), cmap = "turbo")
-        im.set_visible(False)
-
-        # Add colour bar ...
-        cb = fg.colorbar(im, ax = ax, orientation = "horizontal")
-
-        # Configure colour bar ...
-        cb.set_label("Time Until Sunset After 12:00 UTC [hr]")
-
-        # Configure figure ...
-        fg.tight_layout()
-
-        # Save figure ...
-        fg.savefig(pfile)
-        matplotlib.pyplot.close(fg)
-
-        # Optimize PNG ...
-        pyguymer3.image.optimise_image(pfile, strip = True)
-
-    # **************************************************************************
-
-    # Define PNG file name and check if it exists already ...
-    pfile = "step3a.png"
-    if not os.path.exists(pfile):
-        print(f"Making \"{pfile}\" ...")
-
-        # Create figure ...
-        fg = matplotlib.pyplot.figure()
-
-        # Create axis ...
-        ax = pyguymer3.geo.add_axis(
-            fg,
-            coastlines_edgecolor = "white",
-             gridlines_linecolor = "white",
-        )
-
-        # Configure axis ...
-        pyguymer3.geo.add_map_background(
-            ax,
-               name = "step3a",
-            subName = "step3a",
-        )
-
-        # Add (fake) foreground images ...
-        im = ax.imshow(numpy.array([[0.0, 24.0]]), cmap = "turbo")
-        im.set_visible(False)
-
-        # Add colour bar ...
-        cb = fg.colorbar(im, ax = ax, orientation = "horizontal")
-
-        # Configure colour bar ...
-        cb.set_label("Time Zone Difference From UTC [hr]")
-
-        # Configure figure ...
-        fg.tight_layout()
-
-        # Save figure ...
-        fg.savefig(pfile)
-        matplotlib.pyplot.close(fg)
-
-        # Optimize PNG ...
-        pyguymer3.image.optimise_image(pfile, strip = True)
+    # Configure Cartopy ...
+    # NOTE: This is inherited by the processes in the pool.
+    if not args.direct:
+        os.environ["CARTOPY_USER_BACKGROUNDS"] = os.getcwd()
 
     # **************************************************************************
 
-    # Define PNG file name and check if it exists already ...
-    pfile = "step4a.png"
-    if not os.path.exists(pfile):
-        print(f"Making \"{pfile}\" ...")
-
-        # Create figure ...
-        fg = matplotlib.pyplot.figure()
-
-        # Create axis ...
-        ax = pyguymer3.geo.add_axis(fg)
-
-        # Configure axis ...
-        pyguymer3.geo.add_map_background(
-            ax,
-               name = "step4a",
-            subName = "step4a",
-        )
-
-        # Add (fake) foreground images ...
-        im = ax.imshow(numpy.array([[-3.0, 3.0]]), cmap = "coolwarm")
-        im.set_visible(False)
-
-        # Add colour bar ...
-        cb = fg.colorbar(im, ax = ax, orientation = "horizontal")
-
-        # Configure colour bar ...
-        cb.set_label("Difference Between Noon & Time Zone [hr]")
-
-        # Configure figure ...
-        fg.tight_layout()
-
-        # Save figure ...
-        fg.savefig(pfile)
-        matplotlib.pyplot.close(fg)
-
-        # Optimize PNG ...
-        pyguymer3.image.optimise_image(pfile, strip = True)
+    # Create a pool of processes to render the figures and a pool of threads to
+    # optimise them ...
+    # NOTE: Each process keeps its own cache of base maps (see
+    #       "funcs.renderFigure()"), so a base map is only created once by each
+    #       process no matter how many of the figures that it renders use it.
+    # NOTE: Each figure is optimised as soon as it has been rendered, whilst the
+    #       other figures are still being rendered.
+    with concurrent.futures.ProcessPoolExecutor(max_workers = args.jobs) as renderPool, concurrent.futures.ThreadPoolExecutor(max_workers = args.jobs) as optimisePool:
+        # Loop over figures ...
+        renders = []
+        for pfile, kwargs in figs.items():
+            # Skip this figure if it exists already ...
+            if os.path.exists(pfile):
+                continue
+
+            print(f"Making \"{pfile}\" ...")
+
+            # Render figure ...
+            renders.append(
+                renderPool.submit(
+                    funcs.renderFigure,
+                    pfile,
+                    debug = args.debug,
+                    **kwargs,
+                )
+            )
+
+        # Loop over rendered figures ...
+        optimisations = []
+        for render in concurrent.futures.as_completed(renders):
+            # Optimize PNG ...
+            optimisations.append(
+                optimisePool.submit(
+                    pyguymer3.image.optimise_image,
+                    render.result(),
+                    strip = True,
+                )
+            )
+
+        # Wait for the optimisations to finish (and raise any exceptions) ...
+        for optimisation in concurrent.futures.as_completed(optimisations):
+            optimisation.result()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makeParser():
+    # Import standard modules ...
+    import argparse
+    import datetime
+
+    # **************************************************************************
+
+    # Create argument parser ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Split the step 2 maps into tasks in a work queue (in a directory which is shared between machines) so that they can be solved by \"runWorker.py\" and then stitched together by \"assembleTasks.py\".",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--chunk",
+        default = 16384,
+           dest = "chunk",
+           help = "the number of pixels in each task",
+           type = int,
+    )
+    parser.add_argument(
+        "--dates",
+        default = [],
+           dest = "dates",
+           help = "the dates (in ISO 8601 format) to make the maps for, at 12 o'clock UTC (if none are given then the maps are made for 20-March-2019 and are saved to the same files as the step 2 scripts, otherwise the date is appended to the name of each file)",
+          nargs = "+",
+           type = datetime.date.fromisoformat,
+    )
+    parser.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+    parser.add_argument(
+        "--events",
+        choices = [
+            "rising",
+            "setting",
+            "transit",
+        ],
+        default = [
+            "rising",
+            "setting",
+            "transit",
+        ],
+           dest = "events",
+           help = "the events to make the maps of",
+          nargs = "+",
+           type = str,
+    )
+    parser.add_argument(
+        "--land-only",
+        action = "store_true",
+          dest = "landOnly",
+          help = "only solve the pixels which contain any land (using \"land.bin\" from \"step1a_makeElevationMap.py\") and save the others as NaN",
+    )
+    parser.add_argument(
+        "--queue",
+        default = "queue",
+           dest = "queue",
+           help = "the directory of the work queue",
+           type = str,
+    )
+
+    # Return answer ...
+    return parser
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import datetime
+    import json
+    import os
+
+    # Create argument parser and parse the arguments ...
+    # NOTE: This is done before any special modules are imported, so that
+    #       "--help" is quick and works without them.
+    parser = makeParser()
+    args = parser.parse_args()
+
+    # Import local modules ...
+    import funcs
+
+    # **************************************************************************
+
+    # Define the names of the maps of each event ...
+    stems = {
+         "rising" : "sunriseDiff",
+        "setting" : "sunsetDiff",
+        "transit" : "noonDiff",
+    }
+
+    # Load axes ...
+    lon, lat = funcs.loadAxes()                                                 # [rad], [rad]
+    npix = lat.size * lon.size
+
+    # **************************************************************************
+
+    # Check that the work queue does not exist already ...
+    mfile = os.path.join(args.queue, "manifest.json")
+    if os.path.exists(mfile):
+        raise Exception(f"\"{args.queue}\" already contains a work queue") from None
+
+    # Make the directories of the work queue ...
+    for dname in ["claimed", "clocks", "done", "todo"]:
+        os.makedirs(os.path.join(args.queue, dname), exist_ok = True)
+
+    # Loop over dates (or just the date of the step 2 scripts) ...
+    tasks = []
+    for date in args.dates or [None]:
+        # Define the reference time ...
+        ref = datetime.datetime.combine(
+            date or datetime.date(2019, 3, 20),
+            datetime.time(12, tzinfo = datetime.UTC),
+        )
+
+        # Loop over events ...
+        for event in args.events:
+            # Define the BIN file name ...
+            bfile = f"{stems[event]}.bin" if date is None else f"{stems[event]}_{date.isoformat()}.bin"
+
+            # Loop over chunks of pixels ...
+            for i, i0 in enumerate(range(0, npix, args.chunk)):
+                # Append the task to the list ...
+                tasks.append(
+                    {
+                           "bfile" : bfile,
+                           "event" : event,
+                        "landOnly" : args.landOnly,
+                            "name" : f"{bfile.removesuffix('.bin')}_{i:06d}",
+                             "ref" : ref.isoformat(),
+                           "start" : i0,
+                            "stop" : min(npix, i0 + args.chunk),
+                    }
+                )
+
+    print(f"Queueing {len(tasks):,d} tasks in \"{args.queue}\" ...")
+
+    # Loop over tasks ...
+    for task in tasks:
+        # Save the description of the task (via a temporary file, so that a
+        # worker never claims a partially written task) ...
+        tname = os.path.join(args.queue, "todo", f"{task['name']}.json")
+        with open(f"{tname}.tmp", mode = "wt", encoding = "utf-8") as fObj:
+            json.dump(
+                task,
+                fObj,
+                ensure_ascii = False,
+                      indent = 4,
+                   sort_keys = True,
+            )
+        os.replace(f"{tname}.tmp", tname)
+
+    # Save the list of tasks (last, so that it only exists if every task has
+    # been queued) ...
+    with open(mfile, mode = "wt", encoding = "utf-8") as fObj:
+        json.dump(
+            {
+                "shape" : [lat.size, lon.size],
+                "tasks" : tasks,
+            },
+            fObj,
+            ensure_ascii = False,
+                  indent = 4,
+               sort_keys = True,
+        )
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makeParser():
+    # Import standard modules ...
+    import argparse
+
+    # **************************************************************************
+
+    # Create argument parser ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Recommend the time zone (or time zones) for every country.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--csv",
+        default = "recommendedTimeZones.csv",
+           dest = "cfile",
+           help = "the CSV file to save the table to",
+           type = str,
+    )
+    parser.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+    parser.add_argument(
+        "--step",
+        choices = [
+            1.0,
+            0.5,
+            0.25,
+        ],
+        default = 1.0,
+           dest = "step",
+           help = "the spacing of the candidate time zones (whole, half or quarter hours)",
+           type = float,
+    )
+    parser.add_argument(
+        "--weighting",
+        choices = [
+            "area",
+            "population",
+        ],
+        default = "population",
+           dest = "weighting",
+           help = "weight the pixels by their area or weight the populated places by their population (countries without any populated places are weighted by area)",
+           type = str,
+    )
+    parser.add_argument(
+        "--zones",
+        default = 1,
+           dest = "nzones",
+           help = "the maximum number of time zones per country",
+           type = int,
+    )
+
+    # Return answer ...
+    return parser
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import csv
+    import json
+    import math
+    import pathlib
+
+    # Create argument parser and parse the arguments ...
+    # NOTE: This is done before any special modules are imported, so that
+    #       "--help" is quick and works without them.
+    parser = makeParser()
+    args = parser.parse_args()
+
+    # Import special modules ...
+    try:
+        import cartopy
+        cartopy.config.update(
+            {
+                "cache_dir" : pathlib.PosixPath("~/.local/share/cartopy").expanduser(),
+            }
+        )
+    except:
+        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # Import local modules ...
+    import funcs
+
+    # **************************************************************************
+
+    # Load axes and arrays ...
+    lon, lat = funcs.loadAxes()                                                 # [rad], [rad]
+    diff = funcs.loadMap("noonDiff.bin", (lat.size, lon.size))                  # [hr]
+    tmzn = funcs.loadMap("timeZone.bin", (lat.size, lon.size))                  # [hr]
+
+    # Load country map along with its labels ...
+    labs = numpy.fromfile("country.bin", dtype = numpy.int16).reshape(lat.size, lon.size)
+    with open("country.json", mode = "rt", encoding = "utf-8") as fObj:
+        names = json.load(fObj)
+    lut = {name["ADM0_A3"] : lab for lab, name in enumerate(names) if lab > 0}
+
+    # Calculate the time zone that each pixel should be (wrapped so that it is
+    # between -12 hours and +12 hours) and the area of each pixel ...
+    gues = (24.0 - diff + 12.0) % 24.0 - 12.0                                   # [hr]
+    area = numpy.broadcast_to(numpy.cos(lat).reshape(lat.size, 1), gues.shape)
+
+    # **************************************************************************
+
+    # Find file containing all the populated places ...
+    sfile = cartopy.io.shapereader.natural_earth(
+          category = "cultural",
+              name = "populated_places",
+        resolution = "10m",
+    )
+
+    # Loop over records ...
+    cityLabs = []
+    cityGues = []                                                               # [hr]
+    cityPops = []
+    for record in cartopy.io.shapereader.Reader(sfile).records():
+        # Skip this record if it is not in a known country ...
+        neA3 = pyguymer3.geo.getRecordAttribute(record, "ADM0_A3")
+        if neA3 not in lut:
+            continue
+
+        # Find its location and determine the closest pixel to it ...
+        x = math.radians(record.geometry.x)                                     # [rad]
+        y = math.radians(record.geometry.y)                                     # [rad]
+        ix = abs(lon - x).argmin()
+        iy = abs(lat - y).argmin()
+
+        # Append it to the lists ...
+        cityLabs.append(lut[neA3])
+        cityGues.append(gues[iy, ix])                                           # [hr]
+        cityPops.append(max(0.0, float(pyguymer3.geo.getRecordAttribute(record, "POP_MAX"))))
+
+    # **************************************************************************
+
+    # Solve for the best time zones for every country using both the pixels and
+    # the populated places ...
+    areaOffs, areaCost = funcs.solveOffsets(
+        labs,
+        gues,
+        area,
+         nlabs = len(names),
+        nzones = args.nzones,
+          step = args.step,
+    )
+    popsOffs, popsCost = funcs.solveOffsets(
+        numpy.array(cityLabs, dtype = numpy.int64),
+        numpy.array(cityGues, dtype = numpy.float64),
+        numpy.array(cityPops, dtype = numpy.float64),
+         nlabs = len(names),
+        nzones = args.nzones,
+          step = args.step,
+    )
+
+    # Find the current (median) time zone of every country ...
+    curr = funcs.zonalStats(labs, (tmzn + 12.0) % 24.0 - 12.0, None, nlabs = len(names), period = 24.0)["median"]  # [hr]
+
+    # **************************************************************************
+
+    # Save the table ...
+    with open(args.cfile, mode = "wt", encoding = "utf-8", newline = "") as fObj:
+        fObj2 = csv.writer(fObj)
+        fObj2.writerow(
+            [
+                "ADM0_A3",
+                "NAME",
+                "weighting",
+                "current time zone [hr]",
+                "recommended time zones [hr]",
+                "mean absolute solar offset [hr]",
+            ]
+        )
+
+        # Loop over countries ...
+        for lab in range(1, len(names)):
+            # Pick the answer to use ...
+            if args.weighting == "population" and numpy.isfinite(popsCost[lab]):
+                weighting, offs, cost = "population", popsOffs[lab], popsCost[lab]
+            elif numpy.isfinite(areaCost[lab]):
+                weighting, offs, cost = "area", areaOffs[lab], areaCost[lab]
+            else:
+                continue
+
+            # Write the row and print a summary ...
+            fObj2.writerow(
+                [
+                    names[lab]["ADM0_A3"],
+                    names[lab]["NAME"],
+                    weighting,
+                    f"{curr[lab]:+.2f}",
+                    " ".join(f"{off:+.2f}" for off in offs),
+                    f"{cost:.3f}",
+                ]
+            )
+            print(f"{names[lab]['ADM0_A3']:3s} is UTC{curr[lab]:+6.2f} but should be UTC{', UTC'.join(f'{off:+.2f}' for off in offs)} (a {weighting}-weighted mean absolute solar offset of {cost:.3f} hours).")
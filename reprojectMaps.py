@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makeParser():
+    # Import standard modules ...
+    import argparse
+
+    # **************************************************************************
+
+    # Create argument parser ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Reproject maps (which are on the same grid as \"lon.bin\" and \"lat.bin\") into another projection.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "bfiles",
+        help = "the BIN files to reproject",
+       nargs = "+",
+        type = str,
+    )
+    parser.add_argument(
+        "--cmap",
+        choices = [
+            "coolwarm",
+            "turbo",
+        ],
+        default = "turbo",
+           dest = "cmap",
+           help = "the colour map to use for the PNG files",
+           type = str,
+    )
+    parser.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+    parser.add_argument(
+        "--land-only",
+        action = "store_true",
+          dest = "landOnly",
+          help = "only reproject the pixels which contain any land (using \"land.bin\" from \"step1a_makeElevationMap.py\") and save the others as NaN",
+    )
+    parser.add_argument(
+        "--method",
+        choices = [
+            "bilinear",
+            "nearest",
+        ],
+        default = "nearest",
+           dest = "method",
+           help = "the interpolation method (\"bilinear\" should not be used for maps of labels or maps containing sentinel values)",
+           type = str,
+    )
+    parser.add_argument(
+        "--projection",
+        choices = [
+            "EqualEarth",
+            "LambertCylindrical",
+            "Mollweide",
+            "NorthPolarStereo",
+            "Robinson",
+            "SouthPolarStereo",
+        ],
+        default = "EqualEarth",
+           dest = "projection",
+           help = "the Cartopy projection to reproject the maps into",
+           type = str,
+    )
+    parser.add_argument(
+        "--shape",
+        default = [1024, 2048],
+           dest = "shape",
+           help = "the shape (number of rows, number of columns) of the reprojected maps",
+          nargs = 2,
+           type = int,
+    )
+    parser.add_argument(
+        "--vmax",
+        default = 24.0,
+           dest = "vmax",
+           help = "the maximum value of the colour map",
+           type = float,
+    )
+    parser.add_argument(
+        "--vmin",
+        default = 0.0,
+           dest = "vmin",
+           help = "the minimum value of the colour map",
+           type = float,
+    )
+
+    # Return answer ...
+    return parser
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import os
+
+    # Create argument parser and parse the arguments ...
+    # NOTE: This is done before any special modules are imported, so that
+    #       "--help" is quick and works without them.
+    parser = makeParser()
+    args = parser.parse_args()
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import local modules ...
+    import funcs
+
+    # **************************************************************************
+
+    # Load palette ...
+    cmap = funcs.loadPalette(args.cmap)
+
+    # Load axes ...
+    lon, lat = funcs.loadAxes()                                                 # [rad], [rad]
+
+    # Load land mask (if needed) ...
+    if args.landOnly:
+        land = funcs.loadMask("land.bin", (lat.size, lon.size))
+
+    # Load (or make) index map ...
+    # NOTE: The index map only depends on the source grid, the projection, the
+    #       shape and the method, so it is shared by all of the BIN files (and
+    #       is cached on disk for the next time).
+    rmap = funcs.calcReprojection(
+        lon,
+        lat,
+        args.projection,
+        args.shape,
+        method = args.method,
+    )
+
+    # **************************************************************************
+
+    # Loop over BIN files ...
+    for bfile in args.bfiles:
+        # Create short-hand ...
+        # NOTE: The shape, the method and whether only the land is wanted are
+        #       part of the file names, so that reprojecting a map with
+        #       different settings does not find (and skip) the files made with
+        #       the old settings.
+        stem = f"{os.path.splitext(bfile)[0]}_{args.projection}_{args.shape[0]:d}x{args.shape[1]:d}_{args.method}"
+        if args.landOnly:
+            stem += "_land"
+
+        # Skip this BIN file if it has been reprojected already ...
+        if os.path.exists(f"{stem}.bin") and os.path.exists(f"{stem}.png"):
+            continue
+
+        print(f"Making \"{stem}.bin\" and \"{stem}.png\" ...")
+
+        # Load map (removing the pixels which do not contain any land, if
+        # needed) ...
+        arr = funcs.loadMap(bfile, (lat.size, lon.size))                        # [hr]
+        if args.landOnly:
+            arr = numpy.where(land, arr, funcs.NO_DATA)                         # [hr]
+
+        # Reproject map and save it ...
+        arr = funcs.reproject(arr, rmap)                                        # [hr]
+        funcs.encodeMap(arr).tofile(f"{stem}.bin")
+
+        # Make PNG from the reprojected map ...
+        # NOTE: The BIN file is memory-mapped and streamed into the PNG a chunk
+        #       of rows at a time (see "funcs.evaluateMaps()"), so the image is
+        #       never held in memory. The pixels which are outside of the Earth
+        #       (or which do not have any data) are set to the reserved index of
+        #       the palette (see "funcs.quantiseMap()").
+        funcs.evaluateMaps(
+            lambda arr, /: arr,
+            [f"{stem}.bin"],
+            arr.shape,
+            None,
+              pal = cmap,
+            pfile = f"{stem}.png",
+             vmax = args.vmax,
+             vmin = args.vmin,
+        )
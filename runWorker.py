@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makeParser():
+    # Import standard modules ...
+    import argparse
+
+    # **************************************************************************
+
+    # Create argument parser ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Solve tasks from a work queue (made by \"queueTasks.py\") until there are none left. Any number of workers can be run at the same time, on any number of machines which share the directory of the work queue.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+    parser.add_argument(
+        "--heartbeat",
+        default = 30.0,
+           dest = "heartbeat",
+           help = "how often to touch the claim of the task that is being solved [s]",
+           type = float,
+    )
+    parser.add_argument(
+        "--poll",
+        default = 10.0,
+           dest = "poll",
+           help = "how long to wait before checking the work queue again when all of the remaining tasks are claimed by other workers [s]",
+           type = float,
+    )
+    parser.add_argument(
+        "--queue",
+        default = "queue",
+           dest = "queue",
+           help = "the directory of the work queue",
+           type = str,
+    )
+    parser.add_argument(
+        "--stale",
+        default = 300.0,
+           dest = "stale",
+           help = "how long a claim can go without being touched before the task is given to another worker [s]",
+           type = float,
+    )
+    parser.add_argument(
+        "--warm",
+        action = "store_true",
+          help = "start the search for each pixel of a rising or setting from the times of the previous pixels rather than from the reference time",
+    )
+
+    # Return answer ...
+    return parser
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import datetime
+    import os
+    import socket
+    import threading
+    import time
+
+    # Create argument parser and parse the arguments ...
+    # NOTE: This is done before any special modules are imported, so that
+    #       "--help" is quick and works without them.
+    parser = makeParser()
+    args = parser.parse_args()
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import local modules ...
+    import funcs
+
+    # **************************************************************************
+
+    # Check arguments ...
+    if args.heartbeat >= args.stale:
+        raise Exception("\"--heartbeat\" must be shorter than \"--stale\"") from None
+
+    # **************************************************************************
+
+    # Define a name for this worker which is unique across every machine ...
+    owner = f"{socket.gethostname()}-{os.getpid():d}"
+
+    # Load elevation map along with axes and make flattened maps of the
+    # longitude, latitude and elevation of every pixel ...
+    lon, lat = funcs.loadAxes()                                                 # [rad], [rad]
+    elev = funcs.loadMap("elev.bin", (lat.size, lon.size))                      # [m]
+    lon2 = numpy.broadcast_to(lon.reshape(1, lon.size), elev.shape).ravel()     # [rad]
+    lat2 = numpy.broadcast_to(lat.reshape(lat.size, 1), elev.shape).ravel()     # [rad]
+    elev2 = elev.ravel()                                                        # [m]
+
+    # Define a function to touch a claim until it is told to stop (or until the
+    # claim disappears, because it went stale and was moved back to "todo") ...
+    def heartbeat(cname, stop, /):
+        while not stop.wait(args.heartbeat):
+            try:
+                os.utime(cname)
+            except FileNotFoundError:
+                print(f"WARNING: The claim \"{cname}\" has gone stale.")
+                return
+
+    # **************************************************************************
+
+    # Start loop ...
+    ntask = 0
+    while True:
+        # Try to claim a task ...
+        claim = funcs.claimTask(args.queue, owner, stale = args.stale)
+
+        # Check if there are no tasks left to claim ...
+        if claim is None:
+            # Stop if there are no claims left either (otherwise wait, in case
+            # one of them goes stale) ...
+            if not os.listdir(os.path.join(args.queue, "claimed")):
+                break
+            if args.debug:
+                print(f"No tasks left to claim, waiting {args.poll:.1f}s ...")
+            time.sleep(args.poll)
+            continue
+
+        # Create short-hands ...
+        cname, task = claim
+        pix = slice(task["start"], task["stop"])
+        ref = datetime.datetime.fromisoformat(task["ref"])
+
+        print(f"Solving \"{task['name']}\" ...")
+
+        # Start touching the claim in the background ...
+        stop = threading.Event()
+        thread = threading.Thread(target = heartbeat, args = (cname, stop), daemon = True)
+        thread.start()
+
+        try:
+            # Find the next time that the event will happen for every pixel
+            # (only keeping the pixels which contain any land, if needed) ...
+            diff = funcs.makeSunEventMap(
+                lon2[pix],
+                lat2[pix],
+                elev2[pix],
+                ref,
+                event = task["event"],
+                 keep = funcs.loadMask("land.bin", elev.shape).ravel()[pix] if task.get("landOnly", False) else None,
+                 warm = args.warm,
+            )                                                                   # [hr]
+
+            # Save the answer (via a temporary file, so that the answer only
+            # exists once it is complete) ...
+            dname = os.path.join(args.queue, "done", f"{task['name']}.bin")
+            diff.tofile(f"{dname}.{owner}.tmp")
+            os.replace(f"{dname}.{owner}.tmp", dname)
+        finally:
+            # Stop touching the claim ...
+            stop.set()
+            thread.join()
+
+        # Release the claim (ignoring it if it went stale and another worker has
+        # already moved it back to "todo") ...
+        try:
+            os.remove(cname)
+        except FileNotFoundError:
+            pass
+        ntask += 1
+
+    print(f"Solved {ntask:,d} tasks.")
@@ -1,25 +1,85 @@
 #!/usr/bin/env python3
 
+# Define function ...
+def makeParser():
+    # Import standard modules ...
+    import argparse
+
+    # Import local modules ...
+    import funcs
+
+    # **************************************************************************
+
+    # Create argument parser ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Download the GLOBE dataset.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--no-verify",
+        action = "store_true",
+          dest = "noVerify",
+          help = "do not check the SHA-256 checksum of the ZIP file (which is needed if it is not known and \"--sha256\" is not given)",
+    )
+    parser.add_argument(
+        "--segments",
+        default = 4,
+           dest = "segments",
+           help = "the number of segments of the ZIP file to download at the same time",
+           type = int,
+    )
+    parser.add_argument(
+        "--sha256",
+        default = funcs.SHA256S["all10g.zip"],
+           dest = "sha256",
+           help = "the SHA-256 checksum that the ZIP file must have (the default is the known checksum in \"funcs.SHA256S\")",
+           type = str,
+    )
+    parser.add_argument(
+        "--url",
+        default = "https://www.ngdc.noaa.gov/mgg/topo/DATATILES/elev/all10g.zip",
+           dest = "url",
+           help = "the URL of the ZIP file",
+           type = str,
+    )
+
+    # Return answer ...
+    return parser
+
 # Use the proper idiom in the main module ...
 # NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
 if __name__ == "__main__":
     # Import standard modules ...
     import os
 
-    # Import my modules ...
-    try:
-        import pyguymer3
-    except:
-        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+    # Create argument parser and parse the arguments ...
+    # NOTE: This is done before any special modules are imported, so that
+    #       "--help" is quick and works without them.
+    parser = makeParser()
+    args = parser.parse_args()
+
+    # Import local modules ...
+    import funcs
 
     # **************************************************************************
 
     # Check if the ZIP file does not exist yet ...
     if not os.path.exists("all10g.zip"):
+        # Check that the ZIP file can be checked (unless the user has said that
+        # it should not be) ...
+        if args.sha256 is None and not args.noVerify:
+            parser.error("the SHA-256 checksum of \"all10g.zip\" is not known (see \"funcs.SHA256S\"), so either pass \"--sha256\" or pass \"--no-verify\" to download it without checking it")
+
         print("Downloading \"all10g.zip\" ...")
 
-        # Start session ...
-        with pyguymer3.start_session() as sess:
-            # Download the ZIP file ...
-            if not pyguymer3.download_file(sess, "https://www.ngdc.noaa.gov/mgg/topo/DATATILES/elev/all10g.zip", "all10g.zip"):
-                raise Exception("download failed", "https://www.ngdc.noaa.gov/mgg/topo/DATATILES/elev/all10g.zip") from None
+        # Download the ZIP file ...
+        # NOTE: If the download is interrupted then running this script again
+        #       resumes it.
+        digest = funcs.downloadFile(
+            args.url,
+            "all10g.zip",
+            segments = args.segments,
+              sha256 = None if args.noVerify else args.sha256,
+        )
+        print(f"  The SHA-256 checksum of \"all10g.zip\" is {digest}.")
@@ -1,31 +1,14 @@
 #!/usr/bin/env python3
 
-# Use the proper idiom in the main module ...
-# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
-if __name__ == "__main__":
+# Define function ...
+def makeParser():
     # Import standard modules ...
     import argparse
-    import json
-    import math
     import os
-    import zipfile
-
-    # Import special modules ...
-    try:
-        import numpy
-    except:
-        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
-
-    # Import my modules ...
-    try:
-        import pyguymer3
-        import pyguymer3.image
-    except:
-        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
 
     # **************************************************************************
 
-    # Create argument parser and parse the arguments ...
+    # Create argument parser ...
     parser = argparse.ArgumentParser(
            allow_abbrev = False,
             description = "Make a map of elevation.",
@@ -36,118 +19,97 @@ if __name__ == "__main__":
         action = "store_true",
           help = "print debug messages",
     )
+    parser.add_argument(
+        "--jobs",
+        default = os.cpu_count() or 1,
+           dest = "jobs",
+           help = "the (maximum) number of GLOBE tiles to load at the same time (each in its own thread)",
+           type = int,
+    )
+    parser.add_argument(
+        "--max-memory",
+        default = None,
+           dest = "maxMemory",
+           help = "the memory budget (for example, \"4G\"), if not given then the memory limit of the control group (or the physical memory) is used",
+           type = str,
+    )
+
+    # Return answer ...
+    return parser
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import os
+
+    # Create argument parser and parse the arguments ...
+    # NOTE: This is done before any special modules are imported, so that
+    #       "--help" is quick and works without them.
+    parser = makeParser()
     args = parser.parse_args()
 
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import local modules ...
+    import funcs
+
     # **************************************************************************
 
-    # Load colour tables and create short-hand ...
-    with open(f"{pyguymer3.__path__[0]}/data/json/colourTables.json", mode = "rt", encoding = "utf-8") as fObj:
-        colourTables = json.load(fObj)
-    turbo = numpy.array(colourTables["turbo"]).astype(numpy.uint8)
+    # Load palette ...
+    turbo = funcs.loadPalette("turbo")
 
     # **************************************************************************
 
-    # Check if the BIN file does not exist yet ...
-    if not os.path.exists("elev.bin"):
-        print("Making \"elev.bin\" ...")
-
-        # Define constants ...
-        bins = [
-            "all10/a11g",
-            "all10/b10g",
-            "all10/c10g",
-            "all10/d10g",
-            "all10/e10g",
-            "all10/f10g",
-            "all10/g10g",
-            "all10/h10g",
-            "all10/i10g",
-            "all10/j10g",
-            "all10/k10g",
-            "all10/l10g",
-            "all10/m10g",
-            "all10/n10g",
-            "all10/o10g",
-            "all10/p10g",
-        ]
-        nx = 43200                                                              # [px]
-        ny = 21600                                                              # [px]
-
-        # Make map ...
-        elev = numpy.zeros((ny, nx), dtype = numpy.int16)                       # [m]
+    # Check if the BIN files do not exist yet ...
+    if not os.path.exists("elev.bin") or not os.path.exists("land.bin"):
+        print("Making \"elev.bin\" and \"land.bin\" ...")
 
         # Set the scale that everything else will be done at ...
         sc = 100
-        if nx % sc != 0:
-            raise Exception("\"nx\" must be an integer multiple of \"sc\"") from None
-        if ny % sc != 0:
-            raise Exception("\"ny\" must be an integer multiple of \"sc\"") from None
-
-        # Initialize arrays ...
-        lon = numpy.zeros(nx // sc, dtype = numpy.float64)                      # [rad]
-        lat = numpy.zeros(ny // sc, dtype = numpy.float64)                      # [rad]
-        scElev = numpy.zeros((lat.size, lon.size), dtype = numpy.float64)       # [m]
-
-        # Load dataset ...
-        with zipfile.ZipFile("all10g.zip", mode = "r") as fObj:
-            # Initialize index ...
-            iy = 0                                                              # [px]
-
-            # Loop over y-axis ...
-            for i in range(4):
-                # Initialize index ...
-                ix = 0                                                          # [px]
-
-                # Loop over x-axis ...
-                for j in range(4):
-                    # Define tile size ...
-                    if i in [0, 3]:
-                        nrows = 4800                                            # [px]
-                    else:
-                        nrows = 6000                                            # [px]
-                    ncols = 10800                                               # [px]
-
-                    # Load tile ...
-                    tile = numpy.frombuffer(
-                        fObj.read(bins[j + i * 4]),
-                        dtype = numpy.int16
-                    ).reshape(nrows, ncols)                                     # [m]
-
-                    # Fill map ...
-                    elev[iy:iy + tile.shape[0], ix:ix + tile.shape[1]] = tile[:, :] # [m]
-
-                    # Increment index ...
-                    ix += ncols                                                 # [px]
-
-                # Increment index ...
-                iy += nrows                                                     # [px]
-
-        # Rise everywhere up to sea level ...
-        numpy.place(elev, elev < 0, 0)                                          # [m]
-
-        # Scale the elevation map ...
-        for ix in range(lon.size):
-            for iy in range(lat.size):
-                scElev[iy, ix] = elev[sc * iy:sc * (iy + 1), sc * ix:sc * (ix + 1)].sum()   # [m]
-        scElev /= float(sc * sc)                                                # [m]
-
-        # Make longitude axis ...
-        for ix in range(lon.size):
-            lon[ix] = math.radians(360.0 * (float(ix) + 0.5) / float(lon.size) - 180.0) # [°]
-
-        # Make latitude axis ...
-        for iy in range(lat.size):
-            lat[lat.size - 1 - iy] = math.radians(180.0 * (float(iy) + 0.5) / float(lat.size) - 90.0)   # [°]
+
+        # Choose how many tiles to load at the same time, so that the step fits
+        # in the memory budget ...
+        # NOTE: GLOBE is 43200 x 21600 pixels in 16 tiles. The scaled maps use 9
+        #       bytes per pixel (the elevation and the land mask) and each
+        #       thread holds two copies of the largest tile at full resolution
+        #       (the decompressed tile and the tile raised up to sea level) and
+        #       a mask of where the largest tile is land.
+        njobs, _, est = funcs.planChunks(
+            funcs.memoryBudget(args.maxMemory),
+            16,
+             fixed = funcs.PROCESS_MEMORY + 9 * (43200 // sc) * (21600 // sc),
+              jobs = args.jobs,
+            perJob = (2 * numpy.dtype(numpy.int16).itemsize + 1) * 6000 * 10800,
+        )
+
+        # Make elevation map along with axes and land mask ...
+        lon, lat, scElev, scLand = funcs.makeElevationMap(
+            "all10g.zip",
+            jobs = njobs,
+              sc = sc,
+        )                                                                       # [rad], [rad], [m]
+
+        # Print the peak memory usage (against the estimate) ...
+        peak = funcs.peakMemory()
+        print(f"  The peak memory usage was {peak['self'] / 1048576.0:,.1f} MiB (estimated {est / 1048576.0:,.1f} MiB).")
+        if args.debug:
+            print(f"  {100.0 * scLand.mean():.1f}% of the pixels contain some land.")
 
         # Save elevation map along with axes ...
         lon.tofile("lon.bin")
         lat.tofile("lat.bin")
         scElev.tofile("elev.bin")
+
+        # Save land mask ...
+        scLand.tofile("land.bin")
     else:
-        # Load elevation map along with axes ...
-        lon = numpy.fromfile("lon.bin", dtype = numpy.float64)                  # [rad]
-        lat = numpy.fromfile("lat.bin", dtype = numpy.float64)                  # [rad]
-        scElev = numpy.fromfile("elev.bin", dtype = numpy.float64).reshape(lat.size, lon.size)  # [m]
+        # Load axes ...
+        lon, lat = funcs.loadAxes()                                             # [rad], [rad]
 
     # **************************************************************************
 
@@ -156,45 +118,19 @@ if __name__ == "__main__":
     if not os.path.exists(pfile):
         print(f"Making \"{pfile}\" ...")
 
-        # Make image ...
-        img = numpy.zeros(
-            (lat.size, lon.size, 1),
-            dtype = numpy.uint8,
-        )
-
-        # Loop over y-axis ...
-        for iy in range(lat.size):
-            # Loop over x-axis ...
-            for ix in range(lon.size):
-                # Set pixel ...
-                img[iy, ix, 0] = numpy.uint8(
-                    min(
-                        255.0,
-                        max(
-                            0.0,
-                            255.0 * scElev[iy, ix] / 6000.0,
-                        ),
-                    )
-                )
-
-        # Save PNG ...
-        src = pyguymer3.image.makePng(
-            img,
-            calcAdaptive = True,
-             calcAverage = True,
-                calcNone = True,
-               calcPaeth = True,
-                 calcSub = True,
-                  calcUp = True,
-                 choices = "all",
-                   debug = args.debug,
-                     dpi = None,
-                  levels = [9,],
-               memLevels = [9,],
-                 modTime = None,
-                palUint8 = turbo,
-              strategies = None,
-                  wbitss = [15,],
+        # Make PNG from the map ...
+        # NOTE: The BIN file is memory-mapped and streamed into the PNG a chunk
+        #       of rows at a time (see "funcs.evaluateMaps()"), so the whole
+        #       image is never held in memory. The pixels which do not have any
+        #       data are set to the reserved index of the palette (see
+        #       "funcs.quantiseMap()").
+        funcs.evaluateMaps(
+            lambda elev, /: elev,
+            ["elev.bin"],
+            (lat.size, lon.size),
+            None,
+              pal = turbo,
+            pfile = pfile,
+             vmax = 6000.0,
+             vmin = 0.0,
         )
-        with open(pfile, mode = "wb") as fObj:
-            fObj.write(src)
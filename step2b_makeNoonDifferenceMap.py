@@ -1,62 +1,97 @@
 #!/usr/bin/env python3
 
-# Use the proper idiom in the main module ...
-# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
-if __name__ == "__main__":
+# Define function ...
+def makeParser():
     # Import standard modules ...
     import argparse
-    import json
-    import datetime
     import os
 
-    # Import special modules ...
-    try:
-        import ephem
-    except:
-        raise Exception("\"ephem\" is not installed; run \"pip install --user ephem\"") from None
-    try:
-        import numpy
-    except:
-        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
-
-    # Import my modules ...
-    try:
-        import pyguymer3
-        import pyguymer3.image
-    except:
-        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
-
-    # Import local modules ...
-    import funcs
-
     # **************************************************************************
 
-    # Create argument parser and parse the arguments ...
+    # Create argument parser ...
     parser = argparse.ArgumentParser(
            allow_abbrev = False,
             description = "Make a map of the difference between 12 o'clock UTC and noon.",
         formatter_class = argparse.ArgumentDefaultsHelpFormatter,
     )
+    parser.add_argument(
+        "--cost",
+        action = "store_true",
+          help = "save maps of how expensive each pixel was to solve (\"noonDiffCost.bin\", \"noonDiffEvals.bin\" and \"noonDiffFlags.bin\") and print the most expensive regions",
+    )
     parser.add_argument(
         "--debug",
         action = "store_true",
           help = "print debug messages",
     )
+    parser.add_argument(
+        "--encoding",
+        choices = [
+            "float64",
+            "int32",
+            "uint16",
+        ],
+        default = "float64",
+           dest = "encoding",
+           help = "the encoding to use when saving the BIN file (\"int32\" stores seconds, \"uint16\" stores minutes)",
+           type = str,
+    )
+    parser.add_argument(
+        "--jobs",
+        default = os.cpu_count() or 1,
+           dest = "jobs",
+           help = "the (maximum) number of processes to solve the pixels with",
+           type = int,
+    )
+    parser.add_argument(
+        "--land-only",
+        action = "store_true",
+          dest = "landOnly",
+          help = "only solve the pixels which contain any land (using \"land.bin\" from \"step1a_makeElevationMap.py\") and save the others as NaN",
+    )
+    parser.add_argument(
+        "--max-memory",
+        default = None,
+           dest = "maxMemory",
+           help = "the memory budget (for example, \"4G\"), if not given then the memory limit of the control group (or the physical memory) is used",
+           type = str,
+    )
+
+    # Return answer ...
+    return parser
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import datetime
+    import os
+
+    # Create argument parser and parse the arguments ...
+    # NOTE: This is done before any special modules are imported, so that
+    #       "--help" is quick and works without them.
+    parser = makeParser()
     args = parser.parse_args()
 
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import local modules ...
+    import funcs
+
     # **************************************************************************
 
-    # Load colour tables and create short-hand ...
-    with open(f"{pyguymer3.__path__[0]}/data/json/colourTables.json", mode = "rt", encoding = "utf-8") as fObj:
-        colourTables = json.load(fObj)
-    turbo = numpy.array(colourTables["turbo"]).astype(numpy.uint8)
+    # Load palette ...
+    turbo = funcs.loadPalette("turbo")
 
     # **************************************************************************
 
     # Load elevation map along with axes ...
-    lon = numpy.fromfile("lon.bin", dtype = numpy.float64)                      # [rad]
-    lat = numpy.fromfile("lat.bin", dtype = numpy.float64)                      # [rad]
-    elev = numpy.fromfile("elev.bin", dtype = numpy.float64).reshape(lat.size, lon.size)    # [m]
+    lon, lat = funcs.loadAxes()                                                 # [rad], [rad]
+    elev = funcs.loadMap("elev.bin", (lat.size, lon.size))                      # [m]
 
     # **************************************************************************
 
@@ -65,37 +100,80 @@ if __name__ == "__main__":
     if not os.path.exists(bfile):
         print(f"Making \"{bfile}\" ...")
 
-        # Make difference map ...
-        diff = numpy.zeros((lat.size, lon.size), dtype = numpy.float64)         # [hr]
-
-        # Define the reference time as chronological noon on 20-March-2019 and
-        # initialize observer ...
+        # Define the reference time as chronological noon on 20-March-2019 ...
         ref = datetime.datetime(2019, 3, 20, 12, tzinfo = datetime.UTC)
-        obs = ephem.Observer()
-        obs.date = ephem.Date(ref)
-
-        # Loop over x-axis ...
-        for ix in range(lon.size):
-            # Loop over y-axis ...
-            for iy in range(lat.size):
-                # Update the observer's position ...
-                obs.lat = lat[iy]                                               # [rad]
-                obs.long = lon[ix]                                              # [rad]
-                obs.elevation = elev[iy, ix]                                    # [m]
-                obs.horizon = funcs.horizon(elev[iy, ix])                       # [rad]
-
-                # Find the next time that the Sun will cross the meridian (as an
-                # 'aware' datetime object in UTC) ...
-                noon = obs.next_transit(ephem.Sun()).datetime().replace(tzinfo = datetime.UTC)
-
-                # Find out the difference from the reference time ...
-                diff[iy, ix] = (noon - ref).total_seconds() / 3600.0            # [hr]
+
+        # Load the map of the time taken to solve each pixel from a previous
+        # run with "--cost" (if there is one), so that the pixels can be split
+        # into chunks which should each take roughly the same amount of time to
+        # solve ...
+        cfile = "noonDiffCost.bin"
+        if os.path.exists(cfile) and os.path.getsize(cfile) == 8 * elev.size:
+            wgts = numpy.fromfile(cfile, dtype = numpy.float64)                 # [s]
+        else:
+            wgts = None
+
+        # Choose how many processes to use and roughly how many pixels to give
+        # each of them at a time, so that the step fits in the memory budget
+        # ...
+        # NOTE: The main process holds about 13 arrays (16 with "--cost") of
+        #       every pixel and each worker process holds about 8 arrays of the
+        #       pixels that it is solving. The chunks are balanced by their
+        #       cost and so their sizes vary around the chosen size.
+        njobs, chunk, est = funcs.planChunks(
+            funcs.memoryBudget(args.maxMemory),
+            elev.size,
+              fixed = funcs.PROCESS_MEMORY + (128 if args.cost else 104) * elev.size,
+               jobs = args.jobs,
+            perItem = 64,
+             perJob = funcs.PROCESS_MEMORY,
+        )
+
+        # Find the next time that the Sun will cross the meridian for every
+        # pixel (only keeping the pixels which contain any land, if needed) ...
+        ans = funcs.makeSunEventMap(
+            lon.reshape(1, lon.size),
+            lat.reshape(lat.size, 1),
+            elev,
+            ref,
+            chunk = chunk,
+             cost = args.cost,
+            debug = args.debug,
+            event = "transit",
+             jobs = njobs,
+             keep = funcs.loadMask("land.bin", elev.shape) if args.landOnly else None,
+             wgts = wgts,
+        )
+        if args.cost:
+            diff, cost = ans                                                    # [hr]
+        else:
+            diff = ans                                                          # [hr]
 
         # Save difference map ...
-        diff.tofile(bfile)
-    else:
-        # Load difference map ...
-        diff = numpy.fromfile(bfile, dtype = numpy.float64).reshape(lat.size, lon.size) # [hr]
+        funcs.encodeMap(
+            diff,
+             encoding = args.encoding,
+            sentinels = True,
+        ).tofile(bfile)
+
+        # Print the peak memory usage (against the estimate) ...
+        peak = funcs.peakMemory()
+        print(f"  The peak memory usage was {peak['self'] / 1048576.0:,.1f} MiB in the main process and {peak['children'] / 1048576.0:,.1f} MiB in the largest worker process (estimated {est / 1048576.0:,.1f} MiB in total).")
+
+        # Check if the cost maps are needed ...
+        if args.cost:
+            # Save cost maps ...
+            cost["secs"].tofile(cfile)
+            cost["evals"].tofile("noonDiffEvals.bin")
+            cost["flags"].tofile("noonDiffFlags.bin")
+
+            # Print summary ...
+            print(f"  Solving took {cost['secs'].sum():,.1f}s in total ({1.0e6 * cost['secs'].mean():,.1f}µs per pixel, on average).")
+            print(f"  \"AlwaysUpError\" was raised for {(cost['flags'] == 1).sum():,d} pixels and \"NeverUpError\" was raised for {(cost['flags'] == 2).sum():,d} pixels.")
+            print(f"  The position of the Sun was computed {cost['evals'].mean():.2f} times per pixel (on average) and up to {cost['evals'].max():d} times.")
+            print("  The most expensive regions were:")
+            for blk in funcs.summariseCost(cost["secs"], lon, lat):
+                print(f"    {blk['west']:+7.1f}° to {blk['east']:+7.1f}°, {blk['south']:+6.1f}° to {blk['north']:+6.1f}° : {blk['secs']:8.3f}s ({100.0 * blk['share']:5.2f}%)")
 
     # **************************************************************************
 
@@ -104,45 +182,19 @@ if __name__ == "__main__":
     if not os.path.exists(pfile):
         print(f"Making \"{pfile}\" ...")
 
-        # Make image ...
-        img = numpy.zeros(
-            (lat.size, lon.size, 1),
-            dtype = numpy.uint8,
-        )
-
-        # Loop over y-axis ...
-        for iy in range(lat.size):
-            # Loop over x-axis ...
-            for ix in range(lon.size):
-                # Set pixel ...
-                img[iy, ix, 0] = numpy.uint8(
-                    min(
-                        255.0,
-                        max(
-                            0.0,
-                            255.0 * diff[iy, ix] / 24.0,
-                        ),
-                    )
-                )
-
-        # Save PNG ...
-        src = pyguymer3.image.makePng(
-            img,
-            calcAdaptive = True,
-             calcAverage = True,
-                calcNone = True,
-               calcPaeth = True,
-                 calcSub = True,
-                  calcUp = True,
-                 choices = "all",
-                   debug = args.debug,
-                     dpi = None,
-                  levels = [9,],
-               memLevels = [9,],
-                 modTime = None,
-                palUint8 = turbo,
-              strategies = None,
-                  wbitss = [15,],
+        # Make PNG from the map ...
+        # NOTE: The BIN file is memory-mapped and streamed into the PNG a chunk
+        #       of rows at a time (see "funcs.evaluateMaps()"), so the whole
+        #       image is never held in memory. The pixels which do not have any
+        #       data are set to the reserved index of the palette (see
+        #       "funcs.quantiseMap()").
+        funcs.evaluateMaps(
+            lambda diff, /: diff,
+            ["noonDiff.bin"],
+            (lat.size, lon.size),
+            None,
+              pal = turbo,
+            pfile = pfile,
+             vmax = 24.0,
+             vmin = 0.0,
         )
-        with open(pfile, mode = "wb") as fObj:
-            fObj.write(src)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makeParser():
+    # Import standard modules ...
+    import argparse
+
+    # **************************************************************************
+
+    # Create argument parser ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Make a map of the difference between 12 o'clock UTC and moonset.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+    parser.add_argument(
+        "--encoding",
+        choices = [
+            "float64",
+            "int32",
+            "uint16",
+        ],
+        default = "float64",
+           dest = "encoding",
+           help = "the encoding to use when saving the BIN file (\"int32\" stores seconds, \"uint16\" stores minutes)",
+           type = str,
+    )
+    parser.add_argument(
+        "--land-only",
+        action = "store_true",
+          dest = "landOnly",
+          help = "only keep the pixels which contain any land (using \"land.bin\" from \"step1a_makeElevationMap.py\") and save the others as NaN",
+    )
+
+    # Return answer ...
+    return parser
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import datetime
+    import os
+
+    # Create argument parser and parse the arguments ...
+    # NOTE: This is done before any special modules are imported, so that
+    #       "--help" is quick and works without them.
+    parser = makeParser()
+    args = parser.parse_args()
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import local modules ...
+    import funcs
+
+    # **************************************************************************
+
+    # Load palette ...
+    turbo = funcs.loadPalette("turbo")
+
+    # **************************************************************************
+
+    # Load axes ...
+    lon, lat = funcs.loadAxes()                                                 # [rad], [rad]
+
+    # **************************************************************************
+
+    # Define BIN file name and check if it exists already ...
+    bfile = "moonsetDiff.bin"
+    if not os.path.exists(bfile):
+        print(f"Making \"{bfile}\" ...")
+
+        # Define the reference time as chronological noon on 20-March-2019 ...
+        ref = datetime.datetime(2019, 3, 20, 12, tzinfo = datetime.UTC)
+
+        # Find the next time that the Moon will set for every pixel ...
+        # NOTE: The Moon moves too quickly for "ephem" to be called for every
+        #       pixel, so the position of the Moon is tabulated once (every 10
+        #       minutes for 48 hours) and the time of the event is interpolated
+        #       for every pixel (correcting for parallax, refraction and the
+        #       horizon of the pixel from "funcs.horizon()"). See
+        #       "funcs.findEvents()" for details.
+        diff = funcs.calcEventMap(
+            ref,
+             body = "Moon",
+            event = "setting",
+        )                                                                       # [hr]
+
+        # Remove the pixels which do not contain any land (if needed) ...
+        # NOTE: The events are interpolated for every pixel at once, so it is
+        #       not any quicker to only find them for the pixels which contain
+        #       any land.
+        if args.landOnly:
+            diff = numpy.where(funcs.loadMask("land.bin", diff.shape), diff, funcs.NO_DATA) # [hr]
+
+        # Save difference map ...
+        funcs.encodeMap(
+            diff,
+             encoding = args.encoding,
+            sentinels = True,
+        ).tofile(bfile)
+
+    # **************************************************************************
+
+    # Define PNG file name and check if it exists already ...
+    pfile = "moonsetDiff.png"
+    if not os.path.exists(pfile):
+        print(f"Making \"{pfile}\" ...")
+
+        # Make PNG from the map ...
+        # NOTE: The BIN file is memory-mapped and streamed into the PNG a chunk
+        #       of rows at a time (see "funcs.evaluateMaps()"), so the whole
+        #       image is never held in memory. The pixels which do not have any
+        #       data are set to the reserved index of the palette (see
+        #       "funcs.quantiseMap()").
+        # NOTE: The Moon comes back to the same place in the sky about 50
+        #       minutes later each day, so the next event can be up to about
+        #       24.8 hours after the reference time and the colour map goes up
+        #       to 25 hours (rather than 24 hours, like the maps of the Sun).
+        funcs.evaluateMaps(
+            lambda diff, /: diff,
+            ["moonsetDiff.bin"],
+            (lat.size, lon.size),
+            None,
+              pal = turbo,
+            pfile = pfile,
+             vmax = 25.0,
+             vmin = 0.0,
+        )
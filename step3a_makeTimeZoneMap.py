@@ -1,15 +1,75 @@
 #!/usr/bin/env python3
 
+# Define function ...
+def makeParser():
+    # Import standard modules ...
+    import argparse
+    import datetime
+
+    # **************************************************************************
+
+    # Create argument parser ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Make a map of time zones.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--civil-dates",
+        default = [],
+           dest = "civilDates",
+           help = "the dates (in ISO 8601 format) to make maps of the civil time zones (including daylight saving) for",
+          nargs = "+",
+           type = datetime.date.fromisoformat,
+    )
+    parser.add_argument(
+        "--civil-year",
+        default = None,
+           dest = "civilYear",
+           help = "the year to make daily maps of the civil time zones (including daylight saving) for",
+           type = int,
+    )
+    parser.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+    parser.add_argument(
+        "--encoding",
+        choices = [
+            "float64",
+            "uint8",
+        ],
+        default = "float64",
+           dest = "encoding",
+           help = "the encoding to use when saving the BIN file (\"uint8\" stores quarter-hours)",
+           type = str,
+    )
+    parser.add_argument(
+        "--land-only",
+        action = "store_true",
+          dest = "landOnly",
+          help = "only keep the pixels which contain any land (using \"land.bin\" from \"step1a_makeElevationMap.py\") and save the others as NaN",
+    )
+
+    # Return answer ...
+    return parser
+
 # Use the proper idiom in the main module ...
 # NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
 if __name__ == "__main__":
     # Import standard modules ...
-    import argparse
+    import datetime
     import json
-    import math
     import os
     import pathlib
 
+    # Create argument parser and parse the arguments ...
+    # NOTE: This is done before any special modules are imported, so that
+    #       "--help" is quick and works without them.
+    parser = makeParser()
+    args = parser.parse_args()
+
     # Import special modules ...
     try:
         import cartopy
@@ -24,96 +84,130 @@ if __name__ == "__main__":
         import numpy
     except:
         raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
-    try:
-        import shapely
-        import shapely.geometry
-    except:
-        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
 
     # Import my modules ...
     try:
         import pyguymer3
         import pyguymer3.geo
-        import pyguymer3.image
     except:
         raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
 
-    # **************************************************************************
-
-    # Create argument parser and parse the arguments ...
-    parser = argparse.ArgumentParser(
-           allow_abbrev = False,
-            description = "Make a map of time zones.",
-        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
-    )
-    parser.add_argument(
-        "--debug",
-        action = "store_true",
-          help = "print debug messages",
-    )
-    args = parser.parse_args()
+    # Import local modules ...
+    import funcs
 
     # **************************************************************************
 
-    # Load colour tables and create short-hand ...
-    with open(f"{pyguymer3.__path__[0]}/data/json/colourTables.json", mode = "rt", encoding = "utf-8") as fObj:
-        colourTables = json.load(fObj)
-    turbo = numpy.array(colourTables["turbo"]).astype(numpy.uint8)
+    # Load palette ...
+    turbo = funcs.loadPalette("turbo")
 
     # **************************************************************************
 
     # Load axes ...
-    lon = numpy.fromfile("lon.bin", dtype = numpy.float64)                      # [rad]
-    lat = numpy.fromfile("lat.bin", dtype = numpy.float64)                      # [rad]
+    lon, lat = funcs.loadAxes()                                                 # [rad], [rad]
 
-    # **************************************************************************
+    # Load land mask (if needed) ...
+    if args.landOnly:
+        land = funcs.loadMask("land.bin", (lat.size, lon.size))
 
-    # Define BIN file name and check if it exists already ...
-    bfile = "timeZone.bin"
-    if not os.path.exists(bfile):
-        print(f"Making \"{bfile}\" ...")
-
-        # Make time zone map ...
-        tmzn = numpy.zeros((lat.size, lon.size), dtype = numpy.float64)         # [hr]
+    # **************************************************************************
 
-        # Create 2D list of Shapely points ...
-        pnt = []
-        for iy in range(lat.size):
-            tmp = []
-            for ix in range(lon.size):
-                tmp.append(shapely.geometry.Point(math.degrees(lon[ix]), math.degrees(lat[iy])))
-            pnt.append(tmp)
+    # Define BIN and JSON file names and check if they exist already ...
+    bfile = "timeZoneLabel.bin"
+    jfile = "timeZoneLabel.json"
+    if not os.path.exists(bfile) or not os.path.exists(jfile):
+        print(f"Making \"{bfile}\" and \"{jfile}\" ...")
 
-        # Find file containing all the country shapes ...
+        # Find file containing all the time zone shapes ...
         sfile = cartopy.io.shapereader.natural_earth(
               category = "cultural",
                   name = "time_zones",
             resolution = "10m",
         )
 
+        # Initialize lists ...
+        # NOTE: The first label is for the pixels which are not in a time zone.
+        geoms = []
+        zones = [None]
+
         # Loop over records ...
         for record in cartopy.io.shapereader.Reader(sfile).records():
-            # Create short-hand ...
-            neZone = pyguymer3.geo.getRecordAttribute(record, "ZONE")           # [hr]
-            if neZone < 0.0:
-                neZone += 24.0                                                  # [hr]
-
-            # Loop over x-axis ...
-            for ix in range(lon.size):
-                # Loop over y-axis ...
-                for iy in range(lat.size):
-                    # Skip this pixel if it is not within the geometry ...
-                    if not record.geometry.contains(pnt[iy][ix]):
-                        continue
-
-                    # Set pixel to time zone ...
-                    tmzn[iy, ix] = neZone                                       # [hr]
+            # Append geometry and its labels to the lists ...
+            geoms.append(record.geometry)
+            zones.append(
+                {
+                          "ZONE" : float(pyguymer3.geo.getRecordAttribute(record, "ZONE")),
+                    "tz_name1st" : pyguymer3.geo.getRecordAttribute(record, "tz_name1st"),
+                }
+            )
+
+        # Make time zone label map ...
+        labs = funcs.rasterise(geoms, lon, lat)
+
+        # Save time zone label map along with its labels ...
+        labs.tofile(bfile)
+        with open(jfile, mode = "wt", encoding = "utf-8") as fObj:
+            json.dump(
+                zones,
+                fObj,
+                ensure_ascii = False,
+                      indent = 4,
+                   sort_keys = True,
+            )
+    else:
+        # Load time zone label map along with its labels ...
+        labs = numpy.fromfile(bfile, dtype = numpy.int16).reshape(lat.size, lon.size)
+        with open(jfile, mode = "rt", encoding = "utf-8") as fObj:
+            zones = json.load(fObj)
+
+    # **************************************************************************
+
+    # Define BIN file name and check if it exists already ...
+    bfile = "timeZone.bin"
+    if not os.path.exists(bfile):
+        print(f"Making \"{bfile}\" ...")
+
+        # Make time zone map (removing the pixels which do not contain any
+        # land, if needed) ...
+        tmzn = funcs.makeTimeZoneMap(labs, zones)                               # [hr]
+        if args.landOnly:
+            tmzn = numpy.where(land, tmzn, funcs.NO_DATA)                       # [hr]
 
         # Save time zone map ...
-        tmzn.tofile(bfile)
-    else:
-        # Load time zone map ...
-        tmzn = numpy.fromfile(bfile, dtype = numpy.float64).reshape(lat.size, lon.size) # [hr]
+        funcs.encodeMap(
+            tmzn,
+            encoding = args.encoding,
+        ).tofile(bfile)
+
+    # **************************************************************************
+
+    # Make a list of the dates to make maps of the civil time zones for ...
+    dates = list(args.civilDates)
+    if args.civilYear is not None:
+        date = datetime.date(args.civilYear, 1, 1)
+        while date.year == args.civilYear:
+            dates.append(date)
+            date += datetime.timedelta(days = 1)
+
+    # Loop over dates ...
+    for date in dates:
+        # Define BIN file name and check if it exists already ...
+        bfile = f"timeZone_{date.isoformat()}.bin"
+        if os.path.exists(bfile):
+            continue
+
+        print(f"Making \"{bfile}\" ...")
+
+        # Make civil time zone map (removing the pixels which do not contain
+        # any land, if needed) ...
+        civil = funcs.makeTimeZoneMap(labs, zones, date = date)                 # [hr]
+        if args.landOnly:
+            civil = numpy.where(land, civil, funcs.NO_DATA)                     # [hr]
+
+        # Save civil time zone map ...
+        funcs.encodeMap(
+            civil,
+            encoding = args.encoding,
+        ).tofile(bfile)
 
     # **************************************************************************
 
@@ -122,45 +216,19 @@ if __name__ == "__main__":
     if not os.path.exists(pfile):
         print(f"Making \"{pfile}\" ...")
 
-        # Make image ...
-        img = numpy.zeros(
-            (lat.size, lon.size, 1),
-            dtype = numpy.uint8,
-        )
-
-        # Loop over y-axis ...
-        for iy in range(lat.size):
-            # Loop over x-axis ...
-            for ix in range(lon.size):
-                # Set pixel ...
-                img[iy, ix, 0] = numpy.uint8(
-                    min(
-                        255.0,
-                        max(
-                            0.0,
-                            255.0 * tmzn[iy, ix] / 24.0,
-                        ),
-                    )
-                )
-
-        # Save PNG ...
-        src = pyguymer3.image.makePng(
-            img,
-            calcAdaptive = True,
-             calcAverage = True,
-                calcNone = True,
-               calcPaeth = True,
-                 calcSub = True,
-                  calcUp = True,
-                 choices = "all",
-                   debug = args.debug,
-                     dpi = None,
-                  levels = [9,],
-               memLevels = [9,],
-                 modTime = None,
-                palUint8 = turbo,
-              strategies = None,
-                  wbitss = [15,],
+        # Make PNG from the map ...
+        # NOTE: The BIN file is memory-mapped and streamed into the PNG a chunk
+        #       of rows at a time (see "funcs.evaluateMaps()"), so the whole
+        #       image is never held in memory. The pixels which do not have any
+        #       data are set to the reserved index of the palette (see
+        #       "funcs.quantiseMap()").
+        funcs.evaluateMaps(
+            lambda tmzn, /: tmzn,
+            ["timeZone.bin"],
+            (lat.size, lon.size),
+            None,
+              pal = turbo,
+            pfile = pfile,
+             vmax = 24.0,
+             vmin = 0.0,
         )
-        with open(pfile, mode = "wb") as fObj:
-            fObj.write(src)
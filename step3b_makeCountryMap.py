@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makeParser():
+    # Import standard modules ...
+    import argparse
+
+    # **************************************************************************
+
+    # Create argument parser ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Make a map of countries.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+
+    # Return answer ...
+    return parser
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import json
+    import os
+    import pathlib
+
+    # Create argument parser and parse the arguments ...
+    # NOTE: This is done before any special modules are imported, so that
+    #       "--help" is quick and works without them.
+    parser = makeParser()
+    args = parser.parse_args()
+
+    # Import special modules ...
+    try:
+        import cartopy
+        cartopy.config.update(
+            {
+                "cache_dir" : pathlib.PosixPath("~/.local/share/cartopy").expanduser(),
+            }
+        )
+    except:
+        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # Import local modules ...
+    import funcs
+
+    # **************************************************************************
+
+    # Load axes ...
+    lon, lat = funcs.loadAxes()                                                 # [rad], [rad]
+
+    # **************************************************************************
+
+    # Define BIN and JSON file names and check if they exist already ...
+    bfile = "country.bin"
+    jfile = "country.json"
+    if not os.path.exists(bfile) or not os.path.exists(jfile):
+        print(f"Making \"{bfile}\" and \"{jfile}\" ...")
+
+        # Find file containing all the country shapes ...
+        sfile = cartopy.io.shapereader.natural_earth(
+              category = "cultural",
+                  name = "admin_0_countries",
+            resolution = "10m",
+        )
+
+        # Loop over records ...
+        geoms = []
+        names = [
+            {
+                "ADM0_A3" : "",
+                   "NAME" : "",
+            },
+        ]
+        for record in cartopy.io.shapereader.Reader(sfile).records():
+            # Append the geometry and its names to the lists ...
+            geoms.append(record.geometry)
+            names.append(
+                {
+                    "ADM0_A3" : pyguymer3.geo.getRecordAttribute(record, "ADM0_A3"),
+                       "NAME" : pyguymer3.geo.getRecordAttribute(record, "NAME"),
+                }
+            )
+
+        # Make country map ...
+        labs = funcs.rasterise(geoms, lon, lat)
+
+        # Save country map along with its labels ...
+        labs.tofile(bfile)
+        with open(jfile, mode = "wt", encoding = "utf-8") as fObj:
+            json.dump(
+                names,
+                fObj,
+                ensure_ascii = False,
+                      indent = 4,
+                   sort_keys = True,
+            )
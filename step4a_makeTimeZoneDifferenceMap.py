@@ -1,131 +1,144 @@
 #!/usr/bin/env python3
 
-# Use the proper idiom in the main module ...
-# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
-if __name__ == "__main__":
+# Define function ...
+def makeParser():
     # Import standard modules ...
     import argparse
-    import json
-    import os
-
-    # Import special modules ...
-    try:
-        import numpy
-    except:
-        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
-
-    # Import my modules ...
-    try:
-        import pyguymer3
-        import pyguymer3.image
-    except:
-        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+    import datetime
 
     # **************************************************************************
 
-    # Create argument parser and parse the arguments ...
+    # Create argument parser ...
     parser = argparse.ArgumentParser(
            allow_abbrev = False,
             description = "Make a map of the difference between noon and the time zone.",
         formatter_class = argparse.ArgumentDefaultsHelpFormatter,
     )
+    parser.add_argument(
+        "--civil-date",
+        default = None,
+           dest = "civilDate",
+           help = "the date (in ISO 8601 format) of the map of the civil time zones (including daylight saving) to compare against, as made by \"step3a_makeTimeZoneMap.py --civil-dates\"",
+           type = datetime.date.fromisoformat,
+    )
     parser.add_argument(
         "--debug",
         action = "store_true",
           help = "print debug messages",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--encoding",
+        choices = [
+            "float64",
+            "int32",
+            "uint16",
+        ],
+        default = "float64",
+           dest = "encoding",
+           help = "the encoding to use when saving the BIN file (\"int32\" stores seconds, \"uint16\" stores minutes)",
+           type = str,
+    )
+    parser.add_argument(
+        "--land-only",
+        action = "store_true",
+          dest = "landOnly",
+          help = "only keep the pixels which contain any land (using \"land.bin\" from \"step1a_makeElevationMap.py\") and save the others as NaN",
+    )
+    parser.add_argument(
+        "--max-memory",
+        default = None,
+           dest = "maxMemory",
+           help = "the memory budget (for example, \"4G\"), if not given then the memory limit of the control group (or the physical memory) is used",
+           type = str,
+    )
 
-    # **************************************************************************
+    # Return answer ...
+    return parser
 
-    # Load colour tables and create short-hand ...
-    with open(f"{pyguymer3.__path__[0]}/data/json/colourTables.json", mode = "rt", encoding = "utf-8") as fObj:
-        colourTables = json.load(fObj)
-    coolwarm = numpy.array(colourTables["coolwarm"]).astype(numpy.uint8)
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import os
+
+    # Create argument parser and parse the arguments ...
+    # NOTE: This is done before any special modules are imported, so that
+    #       "--help" is quick and works without them.
+    parser = makeParser()
+    args = parser.parse_args()
+
+    # Import local modules ...
+    import funcs
 
     # **************************************************************************
 
-    # Load both time maps along with axes ...
-    lon = numpy.fromfile("lon.bin", dtype = numpy.float64)                      # [rad]
-    lat = numpy.fromfile("lat.bin", dtype = numpy.float64)                      # [rad]
-    diff = numpy.fromfile("noonDiff.bin", dtype = numpy.float64).reshape(lat.size, lon.size)    # [hr]
-    tmzn = numpy.fromfile("timeZone.bin", dtype = numpy.float64).reshape(lat.size, lon.size)    # [hr]
+    # Load palette ...
+    coolwarm = funcs.loadPalette("coolwarm")
 
     # **************************************************************************
 
-    # Define BIN file name and check if it exists already ...
-    bfile = "timeZoneDiff.bin"
-    if not os.path.exists(bfile):
-        print(f"Making \"{bfile}\" ...")
+    # Create short-hand ...
+    suffix = "" if args.civilDate is None else f"_{args.civilDate.isoformat()}"
 
-        # Make time zone difference map ...
-        offs = numpy.zeros((lat.size, lon.size), dtype = numpy.float64)         # [hr]
+    # Load axes ...
+    lon, lat = funcs.loadAxes()                                                 # [rad], [rad]
 
-        # Loop over x-axis ...
-        for ix in range(lon.size):
-            # Loop over y-axis ...
-            for iy in range(lat.size):
-                # Calculate difference ...
-                offs[iy, ix] = diff[iy, ix] + tmzn[iy, ix] - 24.0               # [hr]
+    # **************************************************************************
 
-                # Make sure that the values loop back around correctly ...
-                if offs[iy, ix] < -12.0:
-                    offs[iy, ix] += 24.0                                        # [hr]
-                if offs[iy, ix] > +12.0:
-                    offs[iy, ix] -= 24.0                                        # [hr]
+    # Choose how many rows to evaluate at a time, so that the step fits in the
+    # memory budget ...
+    # NOTE: Each row needs a decoded copy of each of the two inputs and about
+    #       six more arrays of the same size (the answer, the masks used to
+    #       wrap it, the encoded answer, the quantised answer and the filtered
+    #       rows of the PNG file).
+    _, chunk, est = funcs.planChunks(
+        funcs.memoryBudget(args.maxMemory),
+        lat.size,
+          fixed = funcs.PROCESS_MEMORY,
+        perItem = 64 * lon.size,
+    )
 
-        # Save time zone difference map ...
-        offs.tofile(bfile)
-    else:
-        # Load time zone difference map ...
-        offs = numpy.fromfile(bfile, dtype = numpy.float64).reshape(lat.size, lon.size) # [hr]
+    # Define BIN and PNG file names ...
+    bfile = f"timeZoneDiff{suffix}.bin"
+    pfile = f"timeZoneDiff{suffix}.png"
 
-    # **************************************************************************
+    # Check if the BIN file exists already ...
+    # NOTE: The maps are evaluated a chunk of rows at a time, and the BIN file
+    #       and the PNG file are both made in the same pass (the PNG file is
+    #       streamed, so the whole image is never held in memory).
+    if not os.path.exists(bfile):
+        print(f"Making \"{bfile}\" ...")
 
-    # Define PNG file name and check if it exists already ...
-    pfile = "timeZoneDiff.png"
-    if not os.path.exists(pfile):
+        # Make time zone difference map (and PNG, if needed) ...
+        funcs.evaluateMaps(
+            funcs.calcTimeZoneDifference,
+            ["noonDiff.bin", f"timeZone{suffix}.bin"],
+            (lat.size, lon.size),
+            bfile,
+               chunk = chunk,
+            encoding = args.encoding,
+                mask = "land.bin" if args.landOnly else None,
+                 pal = coolwarm,
+               pfile = None if os.path.exists(pfile) else pfile,
+                vmax = +3.0,
+                vmin = -3.0,
+        )
+    elif not os.path.exists(pfile):
         print(f"Making \"{pfile}\" ...")
 
-        # Make image ...
-        img = numpy.zeros(
-            (lat.size, lon.size, 1),
-            dtype = numpy.uint8,
+        # Make PNG from the time zone difference map ...
+        funcs.evaluateMaps(
+            lambda offs, /: offs,
+            [bfile],
+            (lat.size, lon.size),
+            None,
+            chunk = chunk,
+              pal = coolwarm,
+            pfile = pfile,
+             vmax = +3.0,
+             vmin = -3.0,
         )
 
-        # Loop over y-axis ...
-        for iy in range(lat.size):
-            # Loop over x-axis ...
-            for ix in range(lon.size):
-                # Set pixel ...
-                img[iy, ix, 0] = numpy.uint8(
-                    min(
-                        255.0,
-                        max(
-                            0.0,
-                            255.0 * (0.5 + offs[iy, ix] / 6.0),
-                        ),
-                    )
-                )
-
-        # Save PNG ...
-        src = pyguymer3.image.makePng(
-            img,
-            calcAdaptive = True,
-             calcAverage = True,
-                calcNone = True,
-               calcPaeth = True,
-                 calcSub = True,
-                  calcUp = True,
-                 choices = "all",
-                   debug = args.debug,
-                     dpi = None,
-                  levels = [9,],
-               memLevels = [9,],
-                 modTime = None,
-                palUint8 = coolwarm,
-              strategies = None,
-                  wbitss = [15,],
-        )
-        with open(pfile, mode = "wb") as fObj:
-            fObj.write(src)
+    # Print the peak memory usage (against the estimate) ...
+    peak = funcs.peakMemory()
+    print(f"The peak memory usage was {peak['self'] / 1048576.0:,.1f} MiB (estimated {est / 1048576.0:,.1f} MiB).")
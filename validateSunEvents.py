@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makeParser():
+    # Import standard modules ...
+    import argparse
+    import os
+
+    # Import local modules ...
+    import funcs
+
+    # **************************************************************************
+
+    # Create argument parser ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Compare a candidate method of making the step 2 maps against \"ephem\" for a stratified random sample of pixels.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--body",
+        choices = [
+            "Moon",
+            "Sun",
+        ],
+        default = "Sun",
+           dest = "body",
+           help = "the body to compare the events of",
+           type = str,
+    )
+    parser.add_argument(
+        "--candidate",
+        choices = [
+            "table",
+        ],
+        default = "table",
+           dest = "candidate",
+           help = "the candidate method (\"table\" interpolates a shared table of positions of the Sun, see \"funcs.findEvents()\")",
+           type = str,
+    )
+    parser.add_argument(
+        "--date",
+        default = "2019-03-20T12:00:00+00:00",
+           dest = "date",
+           help = "the reference time (in ISO 8601 format)",
+           type = str,
+    )
+    parser.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+    parser.add_argument(
+        "--events",
+        choices = [
+            "rising",
+            "setting",
+            "transit",
+        ],
+        default = [
+            "rising",
+            "setting",
+            "transit",
+        ],
+           dest = "events",
+           help = "the events to compare",
+          nargs = "+",
+           type = str,
+    )
+    parser.add_argument(
+        "--jobs",
+        default = os.cpu_count() or 1,
+           dest = "jobs",
+           help = "the number of processes to solve the pixels with \"ephem\"",
+           type = int,
+    )
+    parser.add_argument(
+        "--samples",
+        default = 5000,
+           dest = "samples",
+           help = "the number of pixels to sample in each stratum",
+           type = int,
+    )
+    parser.add_argument(
+        "--seed",
+        default = 0,
+           dest = "seed",
+           help = "the seed of the random number generator",
+           type = int,
+    )
+    parser.add_argument(
+        "--worst",
+        default = 5,
+           dest = "worst",
+           help = "the number of worst pixels to list",
+           type = int,
+    )
+
+    # Return answer ...
+    return parser
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import concurrent.futures
+    import datetime
+    import math
+    import time
+
+    # Create argument parser and parse the arguments ...
+    # NOTE: This is done before any special modules are imported, so that
+    #       "--help" is quick and works without them.
+    parser = makeParser()
+    args = parser.parse_args()
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import local modules ...
+    import funcs
+
+    # **************************************************************************
+
+    # Parse the reference time ...
+    ref = datetime.datetime.fromisoformat(args.date)
+    if ref.tzinfo is None:
+        ref = ref.replace(tzinfo = datetime.UTC)
+
+    # **************************************************************************
+
+    # Load elevation map along with axes ...
+    lon, lat = funcs.loadAxes()                                                 # [rad], [rad]
+    elev = funcs.loadMap("elev.bin", (lat.size, lon.size))                      # [m]
+
+    # Make maps of the longitude and latitude of every pixel ...
+    lon2 = numpy.broadcast_to(lon.reshape(1, lon.size), elev.shape).ravel()     # [rad]
+    lat2 = numpy.broadcast_to(lat.reshape(lat.size, 1), elev.shape).ravel()     # [rad]
+    elev2 = elev.ravel()                                                        # [m]
+
+    # Calculate the altitude of the Sun at the reference time for every pixel
+    # (ignoring refraction and parallax, which are negligible here) ...
+    tab = funcs.calcTable("Sun", ref, dur = 0.0)
+    alt = numpy.degrees(
+        numpy.arcsin(
+            numpy.sin(lat2) * math.sin(tab["dec"][0]) + numpy.cos(lat2) * math.cos(tab["dec"][0]) * numpy.cos(tab["gst"][0] + lon2 - tab["ra"][0])
+        )
+    )                                                                           # [°]
+
+    # Define the strata ...
+    strata = {
+            "all" : numpy.ones(elev2.size, dtype = bool),
+          "polar" : numpy.abs(numpy.degrees(lat2)) >= 60.0,
+     "equatorial" : numpy.abs(numpy.degrees(lat2)) <= 23.44,
+           "high" : elev2 >= 2000.0,
+       "boundary" : numpy.abs(alt) <= 5.0,
+    }
+
+    # Draw a random sample of pixels from each stratum ...
+    rng = numpy.random.default_rng(args.seed)
+    samples = {}
+    for key, mask in strata.items():
+        idx = numpy.flatnonzero(mask)
+        if idx.size == 0:
+            print(f"WARNING: There are not any pixels in the \"{key}\" stratum.")
+            continue
+        samples[key] = rng.choice(idx, size = min(args.samples, idx.size), replace = False)
+
+    # Combine the samples so that each pixel is only solved once ...
+    pix = numpy.unique(numpy.concatenate(list(samples.values())))
+    print(f"Solving {pix.size:,d} pixels ...")
+
+    # **************************************************************************
+
+    # Create a pool of processes ...
+    with concurrent.futures.ProcessPoolExecutor(max_workers = args.jobs) as pool:
+        # Loop over events ...
+        for event in args.events:
+            print(f"Comparing \"{event}\" ...")
+
+            # Solve the pixels with "ephem" (in chunks, in parallel) ...
+            start = time.perf_counter()
+            chunks = numpy.array_split(pix, 4 * args.jobs)
+            futures = [
+                pool.submit(
+                    funcs.solveSunEvents,
+                    lon2[chunk],
+                    lat2[chunk],
+                    elev2[chunk],
+                    ref,
+                     body = args.body,
+                    event = event,
+                )
+                for chunk in chunks
+            ]
+            refAns = numpy.concatenate([future.result() for future in futures]) # [hr]
+            refTime = time.perf_counter() - start                               # [s]
+
+            # Solve the pixels with the candidate method ...
+            start = time.perf_counter()
+            match args.candidate:
+                case "table":
+                    canAns = funcs.findEvents(
+                        funcs.calcGeometry(lon2[pix], lat2[pix], elev2[pix]),
+                        funcs.calcTable(args.body, ref),
+                        event = event,
+                    )                                                           # [hr]
+                case _:
+                    # Crash ...
+                    raise ValueError(f"\"args.candidate\" is an unexpected value ({repr(args.candidate)})") from None
+            canTime = time.perf_counter() - start                               # [s]
+
+            print(f"  \"ephem\" took {refTime:.3f}s and \"{args.candidate}\" took {canTime:.3f}s.")
+
+            # Calculate the errors (ignoring the pixels where the event does
+            # not occur) ...
+            sentinel = numpy.isin(refAns, [funcs.ALWAYS_UP, funcs.NEVER_UP]) | numpy.isin(canAns, [funcs.ALWAYS_UP, funcs.NEVER_UP])
+            err = 3600.0 * numpy.abs(canAns - refAns)                           # [s]
+            err[sentinel] = numpy.nan                                           # [s]
+
+            # Loop over strata ...
+            for key, sample in samples.items():
+                # Create short-hands ...
+                i = numpy.searchsorted(pix, sample)
+                e = err[i]                                                      # [s]
+                good = numpy.isfinite(e)
+                wrong = int((sentinel[i] & (refAns[i] != canAns[i])).sum())
+
+                print(f"  {key:10s} : {sample.size:6,d} pixels, {wrong:6,d} with a different sentinel, {int(sentinel[i].sum()) - wrong:6,d} with the same sentinel")
+
+                # Skip this stratum if there are not any errors ...
+                if not good.any():
+                    continue
+
+                # Print the statistics and a histogram of the errors ...
+                print(f"  {'':10s}   median = {numpy.median(e[good]):.3f}s, 99th percentile = {numpy.percentile(e[good], 99.0):.3f}s, max = {e[good].max():.3f}s")
+                edges = [0.0, 0.1, 1.0, 10.0, 60.0, 600.0, numpy.inf]           # [s]
+                hist, _ = numpy.histogram(e[good], bins = edges)
+                for lo, hi, n in zip(edges[:-1], edges[1:], hist, strict = True):
+                    print(f"  {'':10s}   {lo:6.1f}s to {hi:6.1f}s : {n:6,d} {'#' * round(50.0 * n / good.sum())}")
+
+            # Print the worst pixels ...
+            order = numpy.argsort(numpy.where(sentinel, -1.0, err))[::-1][:args.worst]
+            for j in order:
+                print(f"  worst: ({math.degrees(lon2[pix[j]]):+8.3f}°, {math.degrees(lat2[pix[j]]):+7.3f}°, {elev2[pix[j]]:6.0f}m) \"ephem\" = {refAns[j]:+9.5f}hr, \"{args.candidate}\" = {canAns[j]:+9.5f}hr, error = {err[j]:.3f}s")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makeParser():
+    # Import standard modules ...
+    import argparse
+
+    # **************************************************************************
+
+    # Create argument parser ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Turn a map of time zones (either the time zones that the pixels should be in, from a map of the difference between 12 o'clock UTC and noon, or the time zones that they are in) into polygons and save them to a GeoJSON file.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--bin",
+        default = "noonDiff.bin",
+           dest = "bin",
+           help = "the BIN file to load",
+           type = str,
+    )
+    parser.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+    parser.add_argument(
+        "--geojson",
+        default = None,
+           dest = "geojson",
+           help = "the GeoJSON file to save the polygons to (if not given then it is the BIN file name with \".geojson\" instead of \".bin\")",
+           type = str,
+    )
+    parser.add_argument(
+        "--kind",
+        choices = [
+            "diff",
+            "zone",
+        ],
+        default = "diff",
+           dest = "kind",
+           help = "the kind of map in the BIN file (\"diff\" is a map of the difference between 12 o'clock UTC and noon, so the time zone of each pixel is 24 hours minus it, and \"zone\" is a map of time zones)",
+           type = str,
+    )
+    parser.add_argument(
+        "--step",
+        default = 1.0,
+           dest = "step",
+           help = "the time zones are rounded to the nearest multiple of this [hr]",
+           type = float,
+    )
+    parser.add_argument(
+        "--tolerance",
+        default = 0.05,
+           dest = "tolerance",
+           help = "the tolerance to simplify the boundaries with (zero to keep every corner of every pixel) [°]",
+           type = float,
+    )
+
+    # Return answer ...
+    return parser
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import json
+
+    # Create argument parser and parse the arguments ...
+    # NOTE: This is done before any special modules are imported, so that
+    #       "--help" is quick and works without them.
+    parser = makeParser()
+    args = parser.parse_args()
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+    try:
+        import shapely
+        import shapely.geometry
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Import local modules ...
+    import funcs
+
+    # **************************************************************************
+
+    # Define the label of the pixels which do not have a time zone ...
+    noLab = numpy.iinfo(numpy.int32).min
+
+    # Load axes and map ...
+    lon, lat = funcs.loadAxes()                                                 # [rad], [rad]
+    arr = funcs.loadMap(args.bin, (lat.size, lon.size))                         # [hr]
+
+    # Find the pixels which do not have a time zone (either because they do not
+    # have any data or, for a map of differences, because the event does not
+    # occur there) ...
+    if args.kind == "diff":
+        bad = ~numpy.isfinite(arr) | (arr == funcs.ALWAYS_UP) | (arr == funcs.NEVER_UP)
+    else:
+        bad = ~numpy.isfinite(arr)
+
+    # Calculate the time zone of each pixel (wrapped so that it is between -12
+    # hours and +12 hours) and round it ...
+    # NOTE: The pixels which do not have a time zone are given a reserved label,
+    #       which is not saved to the GeoJSON file.
+    if args.kind == "diff":
+        arr = 24.0 - arr                                                        # [hr]
+    tmzn = (numpy.where(bad, 0.0, arr) + 12.0) % 24.0 - 12.0                    # [hr]
+    labs = numpy.round(tmzn / args.step).astype(numpy.int32)
+    labs[bad] = noLab
+    if args.debug:
+        print(f"  {bad.sum():,d} pixels do not have a time zone.")
+
+    # **************************************************************************
+
+    # Define GeoJSON file name ...
+    gfile = args.geojson or f"{args.bin.removesuffix('.bin')}.geojson"
+
+    print(f"Making \"{gfile}\" ...")
+
+    # Turn the map into polygons (and remove the polygon of the pixels which do
+    # not have a time zone) ...
+    geoms = funcs.vectorise(
+        labs,
+        lon,
+        lat,
+        tolerance = args.tolerance,
+    )
+    geoms.pop(noLab, None)
+    if args.debug:
+        for lab, geom in sorted(geoms.items()):
+            print(f"  UTC{lab * args.step:+.2f} has {shapely.get_num_coordinates(geom):,d} points.")
+
+    # Save the polygons ...
+    with open(gfile, mode = "wt", encoding = "utf-8") as fObj:
+        json.dump(
+            {
+                "features" : [
+                    {
+                          "geometry" : shapely.geometry.mapping(geom),
+                        "properties" : {
+                            "ZONE" : lab * args.step,
+                        },
+                              "type" : "Feature",
+                    }
+                    for lab, geom in sorted(geoms.items())
+                ],
+                    "type" : "FeatureCollection",
+            },
+            fObj,
+            ensure_ascii = False,
+        )
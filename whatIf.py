@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makeParser():
+    # Import standard modules ...
+    import argparse
+
+    # **************************************************************************
+
+    # Create argument parser ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Find out what would happen if some countries (or time zones) changed their time zone.",
+                 epilog = "Each override is of the form \"KEY=OFFSETS\", where KEY is either the \"ADM0_A3\" code of a country (for example, \"ESP\") or a current time zone (for example, \"UTC+1\") and OFFSETS is a comma-separated list of time zones [hr] (for example, \"ESP=0\" or \"CHN=6,7,8\"). If more than one time zone is given then each pixel is moved to the one which is closest to the time zone that it should be in.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "overrides",
+        help = "the overrides to apply",
+       nargs = "*",
+        type = str,
+    )
+    parser.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+    parser.add_argument(
+        "--interactive",
+        action = "store_true",
+          help = "read more overrides (and commands) from the terminal after applying the ones on the command line",
+    )
+    parser.add_argument(
+        "--save",
+        default = None,
+           dest = "save",
+           help = "save the time zone difference map (after applying the overrides) to this BIN file and to a PNG file of the same name",
+           type = str,
+    )
+
+    # Return answer ...
+    return parser
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import json
+    import math
+    import time
+
+    # Create argument parser and parse the arguments ...
+    # NOTE: This is done before any special modules are imported, so that
+    #       "--help" is quick and works without them.
+    parser = makeParser()
+    args = parser.parse_args()
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import local modules ...
+    import funcs
+
+    # **************************************************************************
+
+    # Load palette ...
+    coolwarm = funcs.loadPalette("coolwarm")
+
+    # Load axes and arrays ...
+    lon, lat = funcs.loadAxes()                                                 # [rad], [rad]
+    diff = funcs.loadMap("noonDiff.bin", (lat.size, lon.size))                  # [hr]
+    tmzn = funcs.loadMap("timeZone.bin", (lat.size, lon.size))                  # [hr]
+
+    # Load country map along with its labels ...
+    labs = numpy.fromfile("country.bin", dtype = numpy.int16).reshape(lat.size, lon.size)
+    with open("country.json", mode = "rt", encoding = "utf-8") as fObj:
+        names = json.load(fObj)
+    codes = {name["ADM0_A3"] : i for i, name in enumerate(names) if name and name["ADM0_A3"]}
+
+    # Calculate the time zone that each pixel should be in (wrapped so that it
+    # is between -12 hours and +12 hours) ...
+    gues = (24.0 - diff + 12.0) % 24.0 - 12.0                                   # [hr]
+
+    # Calculate the area of each pixel ...
+    # NOTE: The axes are evenly spaced and so the area of each pixel is
+    #       proportional to the cosine of its latitude.
+    dlon = 2.0 * math.pi / float(lon.size)                                      # [rad]
+    dlat = math.pi / float(lat.size)                                            # [rad]
+    area = 6371.0088 * 6371.0088 * dlon * dlat * numpy.cos(lat).reshape(lat.size, 1)    # [km2]
+
+    # **************************************************************************
+
+    # Define a function to parse an override ...
+    def parseOverride(text, /):
+        # Split the override into its key and its time zones ...
+        key, sep, vals = text.partition("=")
+        if not sep:
+            raise ValueError(f"\"{text}\" is not of the form \"KEY=OFFSETS\"") from None
+        offsets = [float(val) for val in vals.split(",")]                       # [hr]
+
+        # Find the pixels which are being overridden ...
+        # NOTE: Time zones are always selected using the current time zone
+        #       map, not the map after any earlier overrides.
+        if key.upper().startswith("UTC"):
+            mask = numpy.abs((tmzn - float(key[3:]) + 12.0) % 24.0 - 12.0) < 1.0e-6
+        elif key.upper() in codes:
+            mask = labs == codes[key.upper()]
+        else:
+            raise ValueError(f"\"{key}\" is neither a country nor a time zone") from None
+
+        # Return answer ...
+        return text, mask, offsets
+
+    # Define a function to apply some overrides and to calculate the time zone
+    # difference map and the statistics for every country ...
+    def evaluate(overrides, /):
+        # Apply the overrides ...
+        new = tmzn                                                              # [hr]
+        for _, mask, offsets in overrides:
+            new = funcs.overrideZones(new, gues, mask, offsets)                 # [hr]
+
+        # Calculate the time zone difference map ...
+        offs = (diff + new - 24.0 + 12.0) % 24.0 - 12.0                         # [hr]
+
+        # Return answer ...
+        return offs, funcs.zonalStats(labs, numpy.abs(offs), area, nlabs = len(names))
+
+    # Define a function to print what the overrides change ...
+    def report(overrides, /):
+        # Start the clock and evaluate the overrides ...
+        start = time.perf_counter()
+        offs, stats = evaluate(overrides)
+
+        # Calculate the area-weighted mean mismatch over all countries ...
+        good = stats["count"] > 0
+        world = (stats["wmean"][good] * stats["area"][good]).sum() / stats["area"][good].sum()  # [hr]
+
+        # Print the summary ...
+        print(f"The area-weighted mean mismatch over all countries is {world:.3f} hours (it was {world0:.3f} hours).")
+        for lab in numpy.argsort(stats["area"])[::-1]:
+            # Skip this country if it has not changed ...
+            if not good[lab] or abs(stats["wmean"][lab] - stats0["wmean"][lab]) < 1.0e-6:
+                continue
+            print(f"  {names[lab]['ADM0_A3']:8s} {names[lab]['NAME'][:30]:30s} is on average {stats['wmean'][lab]:6.3f} hours away from its time zone (it was {stats0['wmean'][lab]:6.3f} hours).")
+        print(f"(This took {1.0e3 * (time.perf_counter() - start):.1f}ms.)")
+
+        # Return answer ...
+        return offs
+
+    # Define a function to save a time zone difference map ...
+    def save(offs, bfile, /):
+        # Save time zone difference map ...
+        funcs.encodeMap(offs).tofile(bfile)
+
+        # Make PNG from the time zone difference map ...
+        # NOTE: The BIN file is memory-mapped and streamed into the PNG a chunk
+        #       of rows at a time (see "funcs.evaluateMaps()"), so the image is
+        #       never held in memory.
+        funcs.evaluateMaps(
+            lambda offs, /: offs,
+            [bfile],
+            (lat.size, lon.size),
+            None,
+              pal = coolwarm,
+            pfile = f"{bfile.removesuffix('.bin')}.png",
+             vmax = +3.0,
+             vmin = -3.0,
+        )
+
+    # **************************************************************************
+
+    # Calculate the statistics without any overrides ...
+    _, stats0 = evaluate([])
+    good0 = stats0["count"] > 0
+    world0 = (stats0["wmean"][good0] * stats0["area"][good0]).sum() / stats0["area"][good0].sum()  # [hr]
+
+    # Apply the overrides on the command line ...
+    overrides = [parseOverride(text) for text in args.overrides]
+    offs = report(overrides)
+
+    # Check if more overrides should be read from the terminal ...
+    if args.interactive:
+        print("Type \"KEY=OFFSETS\" to add an override, \"undo\" to remove the last one, \"reset\" to remove all of them, \"list\" to list them, \"save FILE.bin\" to save the map or \"quit\" to quit.")
+
+        # Loop over lines ...
+        while True:
+            # Read a line ...
+            try:
+                line = input("> ").strip()
+            except EOFError:
+                break
+
+            # Check what was typed ...
+            match line.split():
+                case []:
+                    continue
+                case ["quit" | "exit"]:
+                    break
+                case ["list"]:
+                    for text, _, _ in overrides:
+                        print(f"  {text}")
+                    continue
+                case ["undo"]:
+                    if overrides:
+                        overrides.pop()
+                case ["reset"]:
+                    overrides.clear()
+                case ["save", bfile]:
+                    save(offs, bfile)
+                    continue
+                case _:
+                    try:
+                        overrides.append(parseOverride(line))
+                    except ValueError as err:
+                        print(f"ERROR: {err}")
+                        continue
+
+            # Re-evaluate the overrides ...
+            offs = report(overrides)
+
+    # Save the time zone difference map (if needed) ...
+    if args.save is not None:
+        save(offs, args.save)
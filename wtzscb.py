@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    # NOTE: Only light-weight standard modules are imported here, so that the
+    #       command starts quickly. The heavy modules are only imported by the
+    #       scripts that need them, when they are run.
+    import argparse
+    import os
+    import runpy
+    import sys
+
+    # **************************************************************************
+
+    # Define the sub-commands and the scripts that they run ...
+    cmds = {
+         "download" : "step0a_downloadGLOBE.py",
+        "elevation" : "step1a_makeElevationMap.py",
+          "sunrise" : "step2a_makeSunriseDifferenceMap.py",
+             "noon" : "step2b_makeNoonDifferenceMap.py",
+           "sunset" : "step2c_makeSunsetDifferenceMap.py",
+         "moonrise" : "step2d_makeMoonriseDifferenceMap.py",
+      "moontransit" : "step2e_makeMoonTransitDifferenceMap.py",
+          "moonset" : "step2f_makeMoonsetDifferenceMap.py",
+        "timezones" : "step3a_makeTimeZoneMap.py",
+        "countries" : "step3b_makeCountryMap.py",
+             "diff" : "step4a_makeTimeZoneDifferenceMap.py",
+            "plots" : "makePlots.py",
+           "cities" : "checkCities.py",
+            "stats" : "checkCountries.py",
+        "recommend" : "recommendTimeZones.py",
+           "whatif" : "whatIf.py",
+          "animate" : "animateSunEvents.py",
+         "validate" : "validateSunEvents.py",
+        "reproject" : "reprojectMaps.py",
+        "vectorise" : "vectoriseMap.py",
+            "queue" : "queueTasks.py",
+           "worker" : "runWorker.py",
+         "assemble" : "assembleTasks.py",
+    }
+
+    # Define the sub-commands that are run by "all" ...
+    pipeline = [
+        "download",
+        "elevation",
+        "sunrise",
+        "noon",
+        "sunset",
+        "timezones",
+        "diff",
+        "plots",
+    ]
+
+    # Define how the encoding given to "all" is translated for the steps which
+    # do not accept it (the maps of time zones are stored as quarter-hours,
+    # rather than as seconds or minutes, and the other maps cannot be stored as
+    # quarter-hours) ...
+    encodings = {
+          "sunrise" : {"uint8" : "uint16"},
+             "noon" : {"uint8" : "uint16"},
+           "sunset" : {"uint8" : "uint16"},
+        "timezones" : {"int32" : "uint8", "uint16" : "uint8"},
+             "diff" : {"uint8" : "uint16"},
+    }
+
+    # **************************************************************************
+
+    # Create argument parser and parse the arguments ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Run one step (or all of the steps, in the same process) of WTZSCB.",
+                 epilog = "Any arguments after the sub-command are passed to the script that it runs (run \"%(prog)s <sub-command> --help\" to see them). The arguments of \"all\" are only passed to the steps which accept them (translating \"--encoding\" for the steps which do not accept its value) and are checked for every step before any of them are run.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "cmd",
+        choices = list(cmds) + ["all"],
+           help = "the sub-command to run",
+        metavar = "{" + ",".join(list(cmds) + ["all"]) + "}",
+           type = str,
+    )
+    parser.add_argument(
+        "args",
+        help = "the arguments to pass to the script",
+       nargs = argparse.REMAINDER,
+    )
+    args = parser.parse_args()
+
+    # **************************************************************************
+
+    # Find the directory that the scripts are in and make sure that "funcs" can
+    # be imported from it ...
+    dname = os.path.dirname(os.path.abspath(__file__))
+    if dname not in sys.path:
+        sys.path.insert(0, dname)
+
+    # Check if all of the steps are going to be run ...
+    if args.cmd == "all":
+        # Check that help was not asked for ...
+        if "--help" in args.args:
+            parser.error("run \"%(prog)s <sub-command> --help\" to see the arguments of each step of \"all\"" % {"prog" : parser.prog})
+
+        # Split the arguments into groups of an option and its values ...
+        groups = []
+        for arg in args.args:
+            if arg.startswith("--"):
+                groups.append(arg.split("=", 1))
+            elif groups:
+                groups[-1].append(arg)
+            else:
+                parser.error(f"the arguments of \"all\" must start with an option, not \"{arg}\"")
+
+        # Loop over sub-commands ...
+        argvs = {}
+        for cmd in pipeline:
+            # Make the argument parser of the script (without running it) ...
+            stepParser = runpy.run_path(
+                os.path.join(dname, cmds[cmd]),
+                run_name = "wtzscb",
+            )["makeParser"]()
+            stepParser.prog = cmds[cmd]
+
+            # Loop over groups ...
+            argvs[cmd] = []
+            for group in groups:
+                # Translate the encoding (if needed) ...
+                if group[0] == "--encoding" and len(group) == 2:
+                    group = [group[0], encodings.get(cmd, {}).get(group[1], group[1])]
+
+                # Skip this group if the script does not accept the option ...
+                # NOTE: None of the scripts have any positional arguments, so an
+                #       option which is not accepted is returned along with its
+                #       values. An option which is accepted but which has a bad
+                #       value makes the script's parser exit with an error.
+                if stepParser.parse_known_args(group)[1]:
+                    continue
+
+                # Add group to the arguments of the script ...
+                argvs[cmd] += group
+
+            # Parse all of the arguments of the script now, so that a bad
+            # argument is found before any of the steps have been run ...
+            stepParser.parse_args(argvs[cmd])
+
+        # Check that every option is accepted by at least one step ...
+        for group in groups:
+            if not any(group[0] in argv for argv in argvs.values()):
+                parser.error(f"\"{group[0]}\" is not accepted by any of the steps of \"all\"")
+
+    # Loop over sub-commands ...
+    # NOTE: All of the scripts are run in this process, so the modules that
+    #       they import (and the axes, maps and colour tables that they load via
+    #       "funcs") are shared between them.
+    for cmd in pipeline if args.cmd == "all" else [args.cmd]:
+        if args.cmd == "all":
+            print(f"Running \"{cmd}\" ...")
+
+        # Run script as if it were the main module (only passing the options
+        # that it accepts, if all of the steps are being run) ...
+        if args.cmd == "all":
+            sys.argv = [cmds[cmd]] + argvs[cmd]
+        else:
+            sys.argv = [cmds[cmd]] + args.args
+        runpy.run_path(
+            os.path.join(dname, cmds[cmd]),
+            run_name = "__main__",
+        )